@@ -0,0 +1,51 @@
+"""
+Shared start-up helpers for the application entry points.
+"""
+
+import logging
+import signal
+import socket
+
+from PySide6.QtCore import QSocketNotifier
+from PySide6.QtWidgets import QApplication
+
+
+def configure_logging():
+    """Configure logging for production."""
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("google_auth_httplib2").setLevel(logging.ERROR)
+    logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.ERROR)
+    logging.getLogger("googleapiclient.discovery").setLevel(logging.ERROR)
+
+
+def signal_handler(signum, frame):
+    """Handle Ctrl+C signal gracefully."""
+    QApplication.quit()
+
+
+def install_signal_wakeup(parent):
+    """Wake the Qt event loop when a signal arrives.
+
+    Python only runs signal handlers between bytecodes, which never happens
+    while Qt sits idle in its C++ event loop. The interpreter writes a byte
+    to the wakeup socket on every signal; the notifier then wakes the loop
+    so the pending handler can run.
+    """
+    read_sock, write_sock = socket.socketpair()
+    read_sock.setblocking(False)
+    write_sock.setblocking(False)
+    signal.set_wakeup_fd(write_sock.fileno())
+
+    notifier = QSocketNotifier(read_sock.fileno(), QSocketNotifier.Read, parent)
+
+    def _drain():
+        try:
+            read_sock.recv(64)
+        except OSError:
+            pass
+
+    notifier.activated.connect(_drain)
+
+    # Keep both ends open for as long as the notifier lives
+    notifier.sockets = (read_sock, write_sock)
+    return notifier
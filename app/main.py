@@ -1,23 +1,42 @@
+import importlib
 import logging
 import signal
 import sys
-import time
+import threading
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QElapsedTimer, QObject, QTimer, Signal
 from PySide6.QtWidgets import QApplication
 
+from app._boot import configure_logging, install_signal_wakeup, signal_handler
 from app.splash_screen import show_splash_screen
 
-# Configure logging for production
-logging.basicConfig(level=logging.WARNING)
-logging.getLogger("google_auth_httplib2").setLevel(logging.ERROR)
-logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.ERROR)
-logging.getLogger("googleapiclient.discovery").setLevel(logging.ERROR)
+configure_logging()
+logger = logging.getLogger(__name__)
 
+# Keep the splash up at least this long so it doesn't just flash by
+MIN_SPLASH_MS = 800
 
-def signal_handler(signum, frame):
-    """Handle Ctrl+C signal gracefully."""
-    QApplication.quit()
+
+class _ModulePreloader(QObject):
+    """Import a module on a worker thread and report back on the GUI thread."""
+
+    loaded = Signal()
+
+    def __init__(self, module_name):
+        super().__init__()
+        self.module_name = module_name
+
+    def start(self):
+        """Start importing the module in the background."""
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        try:
+            importlib.import_module(self.module_name)
+        except Exception:
+            # The GUI-thread import repeats the failure with a real traceback
+            pass
+        self.loaded.emit()
 
 
 def main():
@@ -28,34 +47,58 @@ def main():
 
     # Show splash screen immediately
     splash = show_splash_screen()
+    splash_timer = QElapsedTimer()
+    splash_timer.start()
 
-    # Allow Python to process signals every 500ms
-    timer = QTimer()
-    timer.start(500)
-    timer.timeout.connect(lambda: None)
-
-    # Import MainWindow after QApplication is created
-    from app.ui.main_window import MainWindow
-
-    # Create main window (this will take some time to load)
-    w = MainWindow()
+    # Let Ctrl+C wake the event loop instead of polling for it
+    app.signal_wakeup = install_signal_wakeup(app)
 
-    # Use a timer to show main window after splash screen completes
-    # This avoids the complex signal coordination that was causing issues
-    QTimer.singleShot(6000, lambda: _show_main_window(splash, w))
+    # Import the main window module off the GUI thread while the splash
+    # animates; widgets are still created on the GUI thread once it's loaded
+    preloader = _ModulePreloader("app.ui.main_window")
+    preloader.loaded.connect(lambda: _load_main_window(app, splash, splash_timer))
+    preloader.start()
 
     try:
         sys.exit(app.exec())
     except KeyboardInterrupt:
-        w.close()
+        main_window = getattr(app, "main_window", None)
+        if main_window is not None:
+            main_window.close()
         sys.exit(0)
 
 
+def _load_main_window(app, splash, splash_timer):
+    """Create the main window once its module has been preloaded."""
+    # Create main window (this will take some time to load)
+    try:
+        from app.ui.main_window import MainWindow
+
+        w = MainWindow()
+    except Exception:
+        logger.exception("Failed to create main window")
+        splash.close()
+        app.exit(1)
+        return
+
+    # Keep a reference on the application so the window isn't collected
+    app.main_window = w
+
+    # Show the main window as soon as it is ready, unless the splash has
+    # not yet been visible for the minimum time
+    remaining = MIN_SPLASH_MS - splash_timer.elapsed()
+    if remaining > 0:
+        QTimer.singleShot(remaining, lambda: _show_main_window(splash, w))
+    else:
+        _show_main_window(splash, w)
+
+
 def _show_main_window(splash, main_window):
     """Show main window after splash screen completes."""
-    # Finish splash screen
+    # Fill the progress bar and finish splash screen
+    splash.update_progress(100)
     splash.finish(main_window)
-    
+
     # Show main window (it will fade in automatically)
     main_window.show()
 
@@ -1,23 +1,12 @@
-import logging
 import signal
 import sys
-import time
 
-from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 
+from app._boot import configure_logging, signal_handler
 from app.ui.main_window import MainWindow
 
-# Configure logging for production
-logging.basicConfig(level=logging.WARNING)
-logging.getLogger("google_auth_httplib2").setLevel(logging.ERROR)
-logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.ERROR)
-logging.getLogger("googleapiclient.discovery").setLevel(logging.ERROR)
-
-
-def signal_handler(signum, frame):
-    """Handle Ctrl+C signal gracefully."""
-    QApplication.quit()
+configure_logging()
 
 
 def main():
@@ -1,21 +1,11 @@
-import logging
 import signal
 import sys
-import time
 
-from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication, QLabel, QMainWindow, QVBoxLayout, QWidget
 
-# Configure logging for production
-logging.basicConfig(level=logging.WARNING)
-logging.getLogger("google_auth_httplib2").setLevel(logging.ERROR)
-logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.ERROR)
-logging.getLogger("googleapiclient.discovery").setLevel(logging.ERROR)
+from app._boot import configure_logging, signal_handler
 
-
-def signal_handler(signum, frame):
-    """Handle Ctrl+C signal gracefully."""
-    QApplication.quit()
+configure_logging()
 
 
 def main():
@@ -4,72 +4,52 @@ Splash screen that shows immediately when the EXE starts.
 """
 
 import sys
-import time
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QThread, QTimer, Signal, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPixmap
-from PySide6.QtWidgets import QApplication, QLabel, QSplashScreen, QVBoxLayout, QWidget
+from PySide6.QtCore import QPointF, QRect, Qt, QTimer, Signal
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QLinearGradient,
+    QPainter,
+    QPixmap,
+    QStaticText,
+    QTransform,
+)
+from PySide6.QtWidgets import QApplication, QSplashScreen, QWidget
 
+SPLASH_WIDTH, SPLASH_HEIGHT = 400, 300
 
-class LoadingThread(QThread):
-    """Thread to simulate loading progress."""
-
-    progress_updated = Signal(int)
-    loading_complete = Signal()
-
-    def run(self):
-        """Simulate loading progress with extended duration."""
-        # Start at 0
-        self.progress_updated.emit(0)
-        time.sleep(0.2)
-
-        # Initial load phase (0-20%)
-        for i in range(1, 21):
-            self.progress_updated.emit(i)
-            time.sleep(0.05)
-
-        # Main loading phase (20-70%)
-        for i in range(21, 71):
-            self.progress_updated.emit(i)
-            time.sleep(0.04)
-
-        # UI preparation phase (70-90%)
-        for i in range(71, 91):
-            self.progress_updated.emit(i)
-            time.sleep(0.06)
-
-        # Final preparation phase (90-100%)
-        for i in range(91, 101):
-            self.progress_updated.emit(i)
-            time.sleep(0.03)
-
-        # Signal completion
-        self.loading_complete.emit()
+# Static splash layers pre-rendered at build time (see build.py)
+PRERENDERED_SPLASH = (
+    Path(__file__).resolve().parent.parent / "assets" / "splash_base.png"
+)
 
 
 class SplashScreen(QSplashScreen):
     """Custom splash screen with loading animation."""
 
+    loading_complete = Signal()
+
     def __init__(self):
-        # Create a custom pixmap for the splash screen
-        pixmap = self.create_splash_pixmap()
-        super().__init__(pixmap)
+        # Render the static layers once; progress ticks only repaint the bar
+        self._base_pixmap = self.create_splash_pixmap()
+        self._shown_progress = 0
+        self._progress_font = QFont("Segoe UI", 9)
+        self._progress_rect = QRect(
+            self.bar_x - 2, self.bar_y - 2, self.bar_width + 4, self.bar_height + 25
+        )
+        super().__init__(self._base_pixmap)
 
         # Set up the splash screen
         self.setWindowFlag(Qt.WindowStaysOnTopHint)
         self.setWindowFlag(Qt.FramelessWindowHint)
 
-        # Create loading thread
-        self.loading_thread = LoadingThread()
-        self.loading_thread.progress_updated.connect(self.update_progress)
-        self.loading_thread.loading_complete.connect(self.on_loading_complete)
-        
-        # Add signal for external completion notification
-        self.loading_complete = self.loading_thread.loading_complete
-
-        # Start loading animation
-        self.loading_thread.start()
+        # Drive the loading animation from a timer on the GUI thread
+        self._progress = 0
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._tick)
+        self._timer.start(30)
 
         # Show the splash screen
         self.show()
@@ -79,14 +59,40 @@ class SplashScreen(QSplashScreen):
 
     def create_splash_pixmap(self):
         """Create a custom splash screen pixmap."""
-        width, height = 400, 300
+        self.bar_x, self.bar_y, self.bar_width, self.bar_height = self._bar_geometry(
+            SPLASH_WIDTH
+        )
+
+        # Prefer the copy rendered at build time; loading it is a single decode
+        pixmap = QPixmap(str(PRERENDERED_SPLASH))
+        if pixmap.width() == SPLASH_WIDTH and pixmap.height() == SPLASH_HEIGHT:
+            return pixmap
 
+        return self.render_base_pixmap()
+
+    @classmethod
+    def render_base_pixmap(cls):
+        """Render the static splash layers into a new pixmap."""
         # Create pixmap with gradient background
-        pixmap = QPixmap(width, height)
+        pixmap = QPixmap(SPLASH_WIDTH, SPLASH_HEIGHT)
+        pixmap.setDevicePixelRatio(1.0)
         pixmap.fill(Qt.transparent)
+        cls._render_static(pixmap)
+        return pixmap
+
+    @staticmethod
+    def _bar_geometry(width):
+        """Return the x, y, width and height of the loading bar."""
+        bar_width = 300
+        bar_height = 6
+        return (width - bar_width) // 2, 150, bar_width, bar_height
+
+    @classmethod
+    def _render_static(cls, pixmap):
+        """Paint the background, text and bar trough that never change."""
+        width, height = pixmap.width(), pixmap.height()
 
         painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
 
         # Create gradient background
         gradient = QLinearGradient(0, 0, 0, height)
@@ -103,60 +109,73 @@ class SplashScreen(QSplashScreen):
         painter.setFont(title_font)
         painter.setPen(QColor(255, 255, 255))
 
-        title_text = "Media Uploader"
-        title_rect = painter.fontMetrics().boundingRect(title_text)
-        title_x = (width - title_rect.width()) // 2
+        title_text = cls._static_text("Media Uploader", title_font)
+        title_x = (width - title_text.size().width()) / 2
         title_y = 80
-        painter.drawText(title_x, title_y, title_text)
+        cls._draw_static_text(painter, title_x, title_y, title_text)
 
         # Draw subtitle
         subtitle_font = QFont("Segoe UI", 10)
         painter.setFont(subtitle_font)
         painter.setPen(QColor(180, 180, 180))
 
-        subtitle_text = "Loading application..."
-        subtitle_rect = painter.fontMetrics().boundingRect(subtitle_text)
-        subtitle_x = (width - subtitle_rect.width()) // 2
+        subtitle_text = cls._static_text("Loading application...", subtitle_font)
+        subtitle_x = (width - subtitle_text.size().width()) / 2
         subtitle_y = title_y + 30
-        painter.drawText(subtitle_x, subtitle_y, subtitle_text)
+        cls._draw_static_text(painter, subtitle_x, subtitle_y, subtitle_text)
 
         # Draw loading bar background
-        bar_width = 300
-        bar_height = 6
-        bar_x = (width - bar_width) // 2
-        bar_y = subtitle_y + 40
+        bar_x, bar_y, bar_width, bar_height = cls._bar_geometry(width)
 
         painter.setPen(Qt.NoPen)
         painter.setBrush(QColor(30, 30, 30))
+        # Only the rounded bar ends need antialiasing
+        painter.setRenderHint(QPainter.Antialiasing, True)
         painter.drawRoundedRect(bar_x, bar_y, bar_width, bar_height, 3, 3)
-
-        # Draw loading bar progress (will be updated)
-        self.bar_x = bar_x
-        self.bar_y = bar_y
-        self.bar_width = bar_width
-        self.bar_height = bar_height
+        painter.setRenderHint(QPainter.Antialiasing, False)
 
         # Draw version info
         version_font = QFont("Segoe UI", 8)
         painter.setFont(version_font)
         painter.setPen(QColor(120, 120, 120))
 
-        version_text = "v1.0.0"
-        version_rect = painter.fontMetrics().boundingRect(version_text)
-        version_x = width - version_rect.width() - 20
+        version_text = cls._static_text("v1.0.0", version_font)
+        version_x = width - version_text.size().width() - 20
         version_y = height - 20
-        painter.drawText(version_x, version_y, version_text)
+        cls._draw_static_text(painter, version_x, version_y, version_text)
 
         painter.end()
-        return pixmap
+
+    @staticmethod
+    def _static_text(text, font):
+        """Create a pre-shaped plain-text label for the given font."""
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.PlainText)
+        static_text.prepare(QTransform(), font)
+        return static_text
+
+    @staticmethod
+    def _draw_static_text(painter, x, baseline_y, static_text):
+        """Draw static text with its baseline at baseline_y, like drawText."""
+        top_y = baseline_y - painter.fontMetrics().ascent()
+        painter.drawStaticText(QPointF(x, top_y), static_text)
 
     def update_progress(self, progress):
         """Update the loading progress bar."""
-        # Create a completely new pixmap to avoid overlay issues
-        pixmap = self.create_splash_pixmap()
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
+        self._shown_progress = progress
+
+        # Schedule a repaint of just the bar area over the unchanged pixmap
+        self.update(self._progress_rect)
 
+    def drawContents(self, painter):
+        """Draw the progress bar over the splash pixmap."""
+        painter.save()
+        self._render_progress(painter, self._shown_progress)
+        painter.restore()
+        super().drawContents(painter)
+
+    def _render_progress(self, painter, progress):
+        """Paint the filled part of the loading bar and the percentage text."""
         # Calculate progress bar width
         progress_width = int((progress / 100.0) * self.bar_width)
 
@@ -171,13 +190,14 @@ class SplashScreen(QSplashScreen):
         gradient.setColorAt(1, QColor(0, 120, 215))
         painter.setBrush(gradient)
 
+        painter.setRenderHint(QPainter.Antialiasing, True)
         painter.drawRoundedRect(
             self.bar_x, self.bar_y, progress_width, self.bar_height, 3, 3
         )
+        painter.setRenderHint(QPainter.Antialiasing, False)
 
         # Draw progress text
-        progress_font = QFont("Segoe UI", 9)
-        painter.setFont(progress_font)
+        painter.setFont(self._progress_font)
         painter.setPen(QColor(200, 200, 200))
 
         progress_text = f"{progress}%"
@@ -186,11 +206,14 @@ class SplashScreen(QSplashScreen):
         progress_y = self.bar_y + self.bar_height + 20
         painter.drawText(progress_x, progress_y, progress_text)
 
-        painter.end()
+    def _tick(self):
+        """Advance the loading animation, slowing down as it nears 100%."""
+        self._progress += max(1, (100 - self._progress) // 20)
+        self.update_progress(self._progress)
 
-        # Update the splash screen
-        self.setPixmap(pixmap)
-        QApplication.processEvents()
+        if self._progress >= 100:
+            self._timer.stop()
+            self.on_loading_complete()
 
     def on_loading_complete(self):
         """Called when loading is complete."""
@@ -203,19 +226,15 @@ class SplashScreen(QSplashScreen):
 
     def finish(self, widget):
         """Finish the splash screen and show the main widget."""
+        self._timer.stop()
         super().finish(widget)
-        self.loading_thread.quit()
-        self.loading_thread.wait()
 
 
 def show_splash_screen():
     """Show the splash screen and return it."""
-    # Create splash screen
+    # Create splash screen (it flushes its own first paint)
     splash = SplashScreen()
 
-    # Process events to ensure it's displayed
-    QApplication.processEvents()
-
     return splash
 
 
@@ -225,13 +244,14 @@ if __name__ == "__main__":
 
     splash = show_splash_screen()
 
-    # Simulate some loading time
-    time.sleep(3)
-
     # Create a dummy widget to finish the splash screen
     widget = QWidget()
-    widget.show()
 
-    splash.finish(widget)
+    def _finish():
+        widget.show()
+        splash.finish(widget)
+
+    # Simulate some loading time
+    QTimer.singleShot(3000, _finish)
 
     sys.exit(app.exec())
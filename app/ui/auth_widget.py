@@ -2,7 +2,14 @@
 Authentication widget for Google login/logout functionality.
 """
 
-from PySide6.QtCore import Qt, QThread, QTimer, Signal
+import functools
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QDialog,
@@ -16,56 +23,161 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from core.auth_manager import AuthError, ClientSecretError, GoogleAuthManager
+from core.auth_manager import (
+    AuthError,
+    ClientSecretError,
+    GoogleAuthManager,
+    get_auth_manager,
+)
 from core.styles import StyleBuilder, theme
 
 from .credentials_dialog import CredentialsDialog
 
+# How long (seconds) auth/setup checks are reused before asking the manager again
+AUTH_CACHE_TTL = 5.0
+
+# Custom credentials saved by CredentialsDialog
+_CREDS_PATH = Path("private/custom_credentials.json")
+
+# OAuth endpoints used when the saved config doesn't specify them
+_DEFAULT_AUTH_URI = "https://accounts.google.com/o/oauth2/auth"
+_DEFAULT_TOKEN_URI = "https://oauth2.googleapis.com/token"
+
+# Re-check auth this long (seconds) before the access token expires
+TOKEN_EXPIRY_MARGIN = 300
+
+# Never re-arm the expiry check sooner than this (ms)
+MIN_AUTH_CHECK_MS = 30000
+
+# Theme is fixed for the session, so the info button style is built once
+_INFO_BTN_QSS = f"""
+    QToolButton {{
+        padding: 4px 8px;
+        background: {theme.background_elevated};
+        color: {theme.text_primary};
+        border: 1px solid {theme.border};
+        border-radius: 6px;
+        font-size: 12px;
+        min-width: 24px;
+        min-height: 24px;
+    }}
+    QToolButton:hover {{
+        background: {theme.background_secondary};
+        border-color: {theme.primary};
+    }}
+"""
 
-class AuthWorker(QThread):
-    """Background worker for authentication operations."""
+# Static message box bodies
+_SETUP_INFO_TEMPLATE = (
+    "{info_text}\n\n"
+    "To use YouTube uploads, you need to:\n"
+    "1. Create a Google Cloud Project\n"
+    "2. Enable YouTube Data API v3\n"
+    "3. Create OAuth 2.0 credentials\n"
+    "4. Download client_secret.json to the 'private' folder\n\n"
+    "See README.md for detailed setup instructions."
+)
+
+_SETUP_INSTRUCTIONS_BODY = (
+    "To upload to YouTube, you need to set up Google authentication:\n\n"
+    "1. Go to https://console.cloud.google.com/\n"
+    "2. Create a new project or select existing one\n"
+    "3. Enable YouTube Data API v3\n"
+    "4. Go to 'Credentials' → 'Create Credentials' → 'OAuth 2.0 Client IDs'\n"
+    "5. Choose 'Desktop application'\n"
+    "6. Download the JSON file\n"
+    "7. Rename it to 'client_secret.json'\n"
+    "8. Place it in the 'private' folder\n\n"
+    "After setup, restart the application and try logging in again."
+)
+
+_VERIFICATION_BODY = (
+    "Your Google OAuth2 application needs verification. "
+    "Here are your options:\n\n"
+    "🔧 QUICK FIX (Recommended for testing):\n"
+    "1. Go to https://console.cloud.google.com/\n"
+    "2. Navigate to 'APIs & Services' → 'OAuth consent screen'\n"
+    "3. Under 'Test users', add your Google email address\n"
+    "4. Save and try logging in again\n\n"
+    "📋 FULL VERIFICATION:\n"
+    "1. Complete all required fields in OAuth consent screen\n"
+    "2. Submit for Google verification\n"
+    "3. Wait for approval (can take several days)\n\n"
+    "⚠️ For now, you can also:\n"
+    "- Click 'Advanced' on the warning page\n"
+    "- Click 'Go to [App Name] (unsafe)'\n"
+    "- Continue with authentication"
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_creds(path_str: str, mtime: float) -> dict:
+    """Parse a credentials config file; cached per (path, mtime).
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    with open(path_str, "r") as f:
+        return json.load(f)
+
+
+class AuthWorkerSignals(QObject):
+    """Signals for AuthWorker; a QRunnable can't define its own."""
 
-    # Signals
     login_success = Signal(str)  # user_email
     login_failed = Signal(str)  # error_message
     logout_success = Signal()
     logout_failed = Signal(str)  # error_message
+    finished = Signal()
+
+
+class AuthWorker(QRunnable):
+    """Background worker for authentication operations, run on the thread pool."""
 
     def __init__(self, auth_manager: GoogleAuthManager, operation: str):
         super().__init__()
         self.auth_manager = auth_manager
         self.operation = operation
+        # Created on the GUI thread, so emits from the pool are queued there
+        self.signals = AuthWorkerSignals()
 
     def run(self):
         """Run the authentication operation."""
+        try:
+            self._run_operation()
+        finally:
+            self.signals.finished.emit()
+
+    def _run_operation(self):
+        """Perform the operation and report the outcome through signals."""
+        signals = self.signals
         try:
             if self.operation == "login":
                 success = self.auth_manager.login()
                 if success:
                     user_email = self.auth_manager.get_user_email() or "Unknown"
-                    self.login_success.emit(user_email)
+                    signals.login_success.emit(user_email)
                 else:
-                    self.login_failed.emit("Login failed - please try again")
+                    signals.login_failed.emit("Login failed - please try again")
             elif self.operation == "logout":
                 self.auth_manager.logout()
-                self.logout_success.emit()
+                signals.logout_success.emit()
         except ClientSecretError as e:
-            self.login_failed.emit(f"Configuration error: {str(e)}")
+            signals.login_failed.emit(f"Configuration error: {str(e)}")
         except AuthError as e:
             error_msg = str(e)
             if "verification" in error_msg.lower():
-                self.login_failed.emit("VERIFICATION_REQUIRED")
+                signals.login_failed.emit("VERIFICATION_REQUIRED")
             else:
-                self.login_failed.emit(f"Authentication error: {error_msg}")
+                signals.login_failed.emit(f"Authentication error: {error_msg}")
         except Exception as e:
             error_msg = str(e)
             if (
                 "verification" in error_msg.lower()
                 or "not completed" in error_msg.lower()
             ):
-                self.login_failed.emit("VERIFICATION_REQUIRED")
+                signals.login_failed.emit("VERIFICATION_REQUIRED")
             else:
-                self.login_failed.emit(f"Unexpected error: {error_msg}")
+                signals.login_failed.emit(f"Unexpected error: {error_msg}")
 
 
 class AuthWidget(QWidget):
@@ -74,34 +186,85 @@ class AuthWidget(QWidget):
     # Signals
     auth_state_changed = Signal(bool)  # Emitted when authentication state changes
 
+    # Button styles are fixed for the session; build them once
+    _PRIMARY_QSS = StyleBuilder.button_primary()
+    _SECONDARY_QSS = StyleBuilder.button_secondary()
+    _DANGER_QSS = StyleBuilder.button_danger()
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.auth_manager = GoogleAuthManager()
+        self.auth_manager = get_auth_manager()
         self.auth_worker = None
+        self._auth_busy = False
+        # (checked_at, token_mtime, value) of the last auth/setup checks
+        self._auth_cache: Optional[Tuple[float, Optional[float], bool]] = None
+        self._setup_cache: Optional[Tuple[float, Tuple[bool, str]]] = None
+        # (is_authenticated, is_ready) last applied to the auth button
+        self._last_display_state: Optional[Tuple[bool, Optional[bool]]] = None
         self._setup_ui()
         self._load_custom_credentials()
         self._update_auth_display()
 
-        # Check authentication state periodically
-        self._auth_check_timer = QTimer()
+        # Re-check authentication shortly before the token expires
+        self._auth_check_timer = QTimer(self)
+        self._auth_check_timer.setSingleShot(True)
         self._auth_check_timer.timeout.connect(self._check_auth_state)
-        self._auth_check_timer.start(30000)  # Check every 30 seconds
+        if self._is_authenticated_cached():
+            self._schedule_auth_check()
 
     def _load_custom_credentials(self):
         """Load custom credentials on startup if available."""
         config = self._load_credentials_config()
         if config and config.get("type") != "file":
-            # Manual credentials - set them in the auth manager
-            self.auth_manager.set_custom_credentials(
-                client_id=config["client_id"],
-                client_secret=config["client_secret"],
-                auth_uri=config.get(
-                    "auth_uri", "https://accounts.google.com/o/oauth2/auth"
-                ),
-                token_uri=config.get(
-                    "token_uri", "https://oauth2.googleapis.com/token"
-                ),
-            )
+            self._apply_manual_creds(config)
+
+    def _apply_manual_creds(self, config: dict) -> None:
+        """Set manually entered credentials from the config in the auth manager."""
+        self.auth_manager.set_custom_credentials(
+            client_id=config["client_id"],
+            client_secret=config["client_secret"],
+            auth_uri=config.get("auth_uri", _DEFAULT_AUTH_URI),
+            token_uri=config.get("token_uri", _DEFAULT_TOKEN_URI),
+        )
+
+    def _token_mtime(self) -> Optional[float]:
+        """Modification time of the stored token, or None if there is none."""
+        try:
+            return self.auth_manager.credentials_path.stat().st_mtime
+        except OSError:
+            return None
+
+    def _is_authenticated_cached(self) -> bool:
+        """Return is_authenticated(), reusing a recent result if still fresh."""
+        now = time.monotonic()
+        cached = self._auth_cache
+        if (
+            cached is not None
+            and now - cached[0] < AUTH_CACHE_TTL
+            and cached[1] == self._token_mtime()
+        ):
+            return cached[2]
+
+        value = self.auth_manager.is_authenticated()
+        # Stat after the check since a token refresh rewrites the file
+        self._auth_cache = (now, self._token_mtime(), value)
+        return value
+
+    def _is_setup_ready_cached(self) -> Tuple[bool, str]:
+        """Return is_setup_ready(), reusing a recent result if still fresh."""
+        now = time.monotonic()
+        cached = self._setup_cache
+        if cached is not None and now - cached[0] < AUTH_CACHE_TTL:
+            return cached[1]
+
+        value = self.auth_manager.is_setup_ready()
+        self._setup_cache = (now, value)
+        return value
+
+    def _invalidate_auth_cache(self):
+        """Forget cached auth/setup checks after a state change."""
+        self._auth_cache = None
+        self._setup_cache = None
 
     def _setup_ui(self):
         """Setup the user interface."""
@@ -116,30 +279,13 @@ class AuthWidget(QWidget):
         self.info_button = QToolButton()
         self.info_button.setText("ℹ️")
         self.info_button.setToolTip("Setup Google API credentials")
-        self.info_button.setStyleSheet(
-            f"""
-            QToolButton {{
-                padding: 4px 8px;
-                background: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: 6px;
-                font-size: 12px;
-                min-width: 24px;
-                min-height: 24px;
-            }}
-            QToolButton:hover {{
-                background: {theme.background_secondary};
-                border-color: {theme.primary};
-            }}
-            """
-        )
+        self.info_button.setStyleSheet(_INFO_BTN_QSS)
         self.info_button.clicked.connect(self._show_setup_instructions)
         layout.addWidget(self.info_button)
 
         # Login/Logout button
         self.auth_button = QPushButton("Login with Google")
-        self.auth_button.setStyleSheet(StyleBuilder.button_primary())
+        self.auth_button.setStyleSheet(self._PRIMARY_QSS)
         self.auth_button.clicked.connect(self._handle_auth_click)
         layout.addWidget(self.auth_button)
 
@@ -158,28 +304,33 @@ class AuthWidget(QWidget):
 
     def _update_auth_display(self):
         """Update the authentication display based on current state."""
-        is_authenticated = self.auth_manager.is_authenticated()
+        is_authenticated = self._is_authenticated_cached()
+        # Setup status only matters while logged out
+        is_ready = None if is_authenticated else self._is_setup_ready_cached()[0]
+
+        # Skip the text/stylesheet churn if nothing changed
+        state = (is_authenticated, is_ready)
+        if state == self._last_display_state:
+            return
+        self._last_display_state = state
 
         if is_authenticated:
             self.auth_button.setText("Logout")
-            self.auth_button.setStyleSheet(StyleBuilder.button_danger())
+            self.auth_button.setStyleSheet(self._DANGER_QSS)
+        elif not is_ready:
+            self.auth_button.setText("Setup")
+            self.auth_button.setStyleSheet(self._SECONDARY_QSS)
         else:
-            # Check setup status
-            is_ready, message = self.auth_manager.is_setup_ready()
-            if not is_ready:
-                self.auth_button.setText("Setup")
-                self.auth_button.setStyleSheet(StyleBuilder.button_secondary())
-            else:
-                self.auth_button.setText("Login with Google")
-                self.auth_button.setStyleSheet(StyleBuilder.button_primary())
+            self.auth_button.setText("Login with Google")
+            self.auth_button.setStyleSheet(self._PRIMARY_QSS)
 
     def _handle_auth_click(self):
         """Handle login/logout button click."""
-        if self.auth_manager.is_authenticated():
+        if self._is_authenticated_cached():
             self._logout()
         else:
             # Check if setup is needed
-            is_ready, message = self.auth_manager.is_setup_ready()
+            is_ready, message = self._is_setup_ready_cached()
             if not is_ready:
                 self._show_setup_instructions()
             else:
@@ -187,43 +338,52 @@ class AuthWidget(QWidget):
 
     def _login(self):
         """Perform login in background thread."""
-        if self.auth_worker and self.auth_worker.isRunning():
+        if self._auth_busy:
             return
 
         self.auth_button.setEnabled(False)
         self.auth_button.setText("Logging in...")
+        self._last_display_state = None  # Button no longer shows a settled state
 
         # Create and start worker
         self.auth_worker = AuthWorker(self.auth_manager, "login")
-        self.auth_worker.login_success.connect(self._on_login_success)
-        self.auth_worker.login_failed.connect(self._on_login_failed)
-        self.auth_worker.finished.connect(self._on_worker_finished)
-        self.auth_worker.start()
+        signals = self.auth_worker.signals
+        signals.login_success.connect(self._on_login_success)
+        signals.login_failed.connect(self._on_login_failed)
+        signals.finished.connect(self._on_worker_finished)
+        self._auth_busy = True
+        QThreadPool.globalInstance().start(self.auth_worker)
 
     def _logout(self):
         """Perform logout in background thread."""
-        if self.auth_worker and self.auth_worker.isRunning():
+        if self._auth_busy:
             return
 
         self.auth_button.setEnabled(False)
         self.auth_button.setText("Logging out...")
+        self._last_display_state = None  # Button no longer shows a settled state
 
         # Create and start worker
         self.auth_worker = AuthWorker(self.auth_manager, "logout")
-        self.auth_worker.logout_success.connect(self._on_logout_success)
-        self.auth_worker.logout_failed.connect(self._on_logout_failed)
-        self.auth_worker.finished.connect(self._on_worker_finished)
-        self.auth_worker.start()
+        signals = self.auth_worker.signals
+        signals.logout_success.connect(self._on_logout_success)
+        signals.logout_failed.connect(self._on_logout_failed)
+        signals.finished.connect(self._on_worker_finished)
+        self._auth_busy = True
+        QThreadPool.globalInstance().start(self.auth_worker)
 
     def _on_login_success(self, user_email: str):
         """Handle successful login."""
         self.status_text.setText(f"✅ Logged in as {user_email}")
+        self._invalidate_auth_cache()
+        self._schedule_auth_check()
         self.auth_state_changed.emit(True)
         self._update_auth_display()
 
     def _on_login_failed(self, error_message: str):
         """Handle login failure."""
         self.status_text.setText("❌ Login failed")
+        self._invalidate_auth_cache()
 
         if error_message == "VERIFICATION_REQUIRED":
             self._show_verification_instructions()
@@ -241,6 +401,8 @@ class AuthWidget(QWidget):
     def _on_logout_success(self):
         """Handle successful logout."""
         self.status_text.setText("✅ Logged out successfully")
+        self._invalidate_auth_cache()
+        self._auth_check_timer.stop()
         self.auth_state_changed.emit(False)
         self._update_auth_display()
 
@@ -253,15 +415,32 @@ class AuthWidget(QWidget):
         self._update_auth_display()
 
     def _on_worker_finished(self):
-        """Handle worker thread completion."""
+        """Handle worker completion."""
         self.auth_button.setEnabled(True)
+        self._auth_busy = False
         self.auth_worker = None
 
     def _check_auth_state(self):
-        """Periodically check authentication state."""
-        current_auth = self.auth_manager.is_authenticated()
-        # Update display if state changed
+        """Re-check authentication as the token nears expiry."""
+        self._invalidate_auth_cache()
         self._update_auth_display()
+        if self._is_authenticated_cached():
+            self._schedule_auth_check()
+        else:
+            self.auth_state_changed.emit(False)
+
+    def _schedule_auth_check(self):
+        """Arm the auth check timer to fire shortly before the token expires."""
+        self._auth_check_timer.stop()
+        credentials = self.auth_manager.get_credentials()
+        expiry = getattr(credentials, "expiry", None)
+        if expiry is None:
+            return
+
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        remaining = (expiry - now).total_seconds() - TOKEN_EXPIRY_MARGIN
+        self._auth_check_timer.start(max(MIN_AUTH_CHECK_MS, int(remaining * 1000)))
 
     def _show_setup_info(self):
         """Show setup information."""
@@ -275,13 +454,7 @@ class AuthWidget(QWidget):
         QMessageBox.information(
             self,
             "Authentication Setup",
-            f"{info_text}\n\n"
-            "To use YouTube uploads, you need to:\n"
-            "1. Create a Google Cloud Project\n"
-            "2. Enable YouTube Data API v3\n"
-            "3. Create OAuth 2.0 credentials\n"
-            "4. Download client_secret.json to the 'private' folder\n\n"
-            "See README.md for detailed setup instructions.",
+            _SETUP_INFO_TEMPLATE.format(info_text=info_text),
         )
 
     def _show_setup_instructions(self):
@@ -297,20 +470,14 @@ class AuthWidget(QWidget):
             QMessageBox.information(
                 self,
                 "Setup Required",
-                "To upload to YouTube, you need to set up Google authentication:\n\n"
-                "1. Go to https://console.cloud.google.com/\n"
-                "2. Create a new project or select existing one\n"
-                "3. Enable YouTube Data API v3\n"
-                "4. Go to 'Credentials' → 'Create Credentials' → 'OAuth 2.0 Client IDs'\n"
-                "5. Choose 'Desktop application'\n"
-                "6. Download the JSON file\n"
-                "7. Rename it to 'client_secret.json'\n"
-                "8. Place it in the 'private' folder\n\n"
-                "After setup, restart the application and try logging in again.",
+                _SETUP_INSTRUCTIONS_BODY,
             )
 
     def _on_credentials_configured(self):
         """Handle successful credentials configuration."""
+        # The file was just rewritten; don't trust an mtime that may not have ticked
+        _read_creds.cache_clear()
+
         # Update the auth manager with the new credentials
         config = self._load_credentials_config()
         if config:
@@ -319,58 +486,35 @@ class AuthWidget(QWidget):
                 pass
             else:
                 # Manual credentials - set them in the auth manager
-                self.auth_manager.set_custom_credentials(
-                    client_id=config["client_id"],
-                    client_secret=config["client_secret"],
-                    auth_uri=config.get(
-                        "auth_uri", "https://accounts.google.com/o/oauth2/auth"
-                    ),
-                    token_uri=config.get(
-                        "token_uri", "https://oauth2.googleapis.com/token"
-                    ),
-                )
+                self._apply_manual_creds(config)
 
+        self._invalidate_auth_cache()
         self._update_auth_display()
 
     def _load_credentials_config(self):
         """Load credentials configuration from file."""
+        # A single stat both checks existence and keys the parse cache
         try:
-            import json
-            from pathlib import Path
+            mtime = _CREDS_PATH.stat().st_mtime
+        except OSError:
+            return None
 
-            config_file = Path("private/custom_credentials.json")
-            if config_file.exists():
-                with open(config_file, "r") as f:
-                    return json.load(f)
+        try:
+            return _read_creds(str(_CREDS_PATH), mtime)
         except Exception:
-            pass
-        return None
+            return None
 
     def _show_verification_instructions(self):
         """Show verification instructions."""
         QMessageBox.information(
             self,
             "OAuth2 Verification Required",
-            "Your Google OAuth2 application needs verification. "
-            "Here are your options:\n\n"
-            "🔧 QUICK FIX (Recommended for testing):\n"
-            "1. Go to https://console.cloud.google.com/\n"
-            "2. Navigate to 'APIs & Services' → 'OAuth consent screen'\n"
-            "3. Under 'Test users', add your Google email address\n"
-            "4. Save and try logging in again\n\n"
-            "📋 FULL VERIFICATION:\n"
-            "1. Complete all required fields in OAuth consent screen\n"
-            "2. Submit for Google verification\n"
-            "3. Wait for approval (can take several days)\n\n"
-            "⚠️ For now, you can also:\n"
-            "- Click 'Advanced' on the warning page\n"
-            "- Click 'Go to [App Name] (unsafe)'\n"
-            "- Continue with authentication",
+            _VERIFICATION_BODY,
         )
 
     def is_authenticated(self) -> bool:
         """Check if user is authenticated."""
-        return self.auth_manager.is_authenticated()
+        return self._is_authenticated_cached()
 
     def get_credentials(self):
         """Get authentication credentials."""
@@ -382,5 +526,5 @@ class AuthWidget(QWidget):
 
     def is_setup_ready(self) -> bool:
         """Check if authentication is properly set up."""
-        is_ready, _ = self.auth_manager.is_setup_ready()
+        is_ready, _ = self._is_setup_ready_cached()
         return is_ready
@@ -3,6 +3,7 @@ Conversion worker for handling MP3 to MP4 conversions in background threads.
 """
 
 import logging
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -12,6 +13,9 @@ from .media_converter import MediaConverter, ConversionError
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between progress emits that repeat the same percent
+PROGRESS_EMIT_INTERVAL = 0.1
+
 
 class ConversionWorker(QObject):
     """Worker for handling MP3 to MP4 conversions in background threads."""
@@ -25,11 +29,25 @@ class ConversionWorker(QObject):
         super().__init__()
         self.media_converter = MediaConverter(progress_callback=self._update_progress)
         self._is_running = False
+        # Bound once; the converter can report progress very often
+        self._emit_progress = self.progress_updated.emit
+        self._last_emit_pct = -1
+        self._last_emit_ts = 0.0
         
     def _update_progress(self, percent: int, message: str):
-        """Update progress and emit signal."""
-        if self._is_running:
-            self.progress_updated.emit(percent, message)
+        """Update progress and emit signal, coalescing repeated updates."""
+        if not self._is_running:
+            return
+        now = time.monotonic()
+        if (
+            percent < 100
+            and percent == self._last_emit_pct
+            and now - self._last_emit_ts <= PROGRESS_EMIT_INTERVAL
+        ):
+            return
+        self._last_emit_pct = percent
+        self._last_emit_ts = now
+        self._emit_progress(percent, message)
     
     def convert_single_mp3(
         self, 
@@ -40,24 +58,23 @@ class ConversionWorker(QObject):
     ):
         """Convert a single MP3 to MP4."""
         self._is_running = True
+        self._last_emit_pct = -1
         
         try:
-            logger.info(f"Starting conversion: {mp3_path}")
+            logger.info("Starting conversion: %s", mp3_path)
             
+            mc = self.media_converter
             if overlay_type != "none":
-                output_path = self.media_converter.convert_mp3_to_mp4_with_overlay(
+                output_path = mc.convert_mp3_to_mp4_with_overlay(
                     mp3_path, image_path, overlay_type, overlay_config
                 )
+            elif image_path is None:
+                output_path = mc.convert_mp3_to_mp4_black(mp3_path)
             else:
-                if image_path:
-                    output_path = self.media_converter.convert_mp3_to_mp4(mp3_path, image_path)
-                else:
-                    output_path = self.media_converter.convert_mp3_to_mp4_with_overlay(
-                        mp3_path, None, "none"
-                    )
+                output_path = mc.convert_mp3_to_mp4(mp3_path, image_path)
             
-            if output_path and output_path.exists():
-                logger.info(f"Conversion successful: {output_path}")
+            if output_path is not None:
+                logger.info("Conversion successful: %s", output_path)
                 self.conversion_finished.emit(output_path)
             else:
                 error_msg = "Conversion failed - output file not created"
@@ -82,17 +99,18 @@ class ConversionWorker(QObject):
     ):
         """Merge multiple MP3 files into a single MP4."""
         self._is_running = True
+        self._last_emit_pct = -1
         
         try:
-            logger.info(f"Starting merge of {len(mp3_paths)} MP3 files")
+            logger.info("Starting merge of %d MP3 files", len(mp3_paths))
             
             if image_path:
                 output_path = self.media_converter.merge_mp3s_to_mp4(mp3_paths, image_path)
             else:
                 output_path = self.media_converter.merge_mp3s_to_mp4_black(mp3_paths)
             
-            if output_path and output_path.exists():
-                logger.info(f"Merge successful: {output_path}")
+            if output_path is not None:
+                logger.info("Merge successful: %s", output_path)
                 self.conversion_finished.emit(output_path)
             else:
                 error_msg = "Merge failed - output file not created"
@@ -113,4 +131,6 @@ class ConversionWorker(QObject):
     def cancel(self):
         """Cancel the current conversion."""
         self._is_running = False
+        # Stop ffmpeg too, rather than letting it run to completion unseen
+        self.media_converter.cancel()
         logger.info("Conversion cancelled by user")
@@ -7,7 +7,7 @@ from typing import Optional
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
-    QCheckBox,
+    QButtonGroup,
     QDialog,
     QFileDialog,
     QGroupBox,
@@ -16,12 +16,39 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMessageBox,
     QPushButton,
+    QRadioButton,
     QTextEdit,
     QVBoxLayout,
 )
 
 from core.styles import StyleTheme
 
+# orjson is an optional speedup; both variants work on UTF-8 bytes
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    import json
+
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# Only this much of a selected file is shown in the preview box
+PREVIEW_MAX_BYTES = 4096
+
+# Every OAuth client ID issued by Google ends with this
+_GOOGLE_CLIENT_ID_SUFFIX = ".apps.googleusercontent.com"
+
 
 class CredentialsDialog(QDialog):
     """Dialog for configuring Google API credentials."""
@@ -29,12 +56,22 @@ class CredentialsDialog(QDialog):
     # Signal emitted when credentials are successfully configured
     credentials_configured = Signal()
 
+    # Parsed custom_credentials.json shared by all dialogs, keyed by st_mtime_ns
+    _config_cache: Optional[dict] = None
+    _config_mtime: int = -1
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Configure Google API Credentials")
         self.setModal(True)
         self.setMinimumWidth(500)
 
+        # The manual and file groups are built the first time they are needed
+        self.manual_group: Optional[QGroupBox] = None
+        self.file_group: Optional[QGroupBox] = None
+        self._manual_built = False
+        self._file_built = False
+
         self._setup_ui()
         self._load_existing_credentials()
 
@@ -61,11 +98,7 @@ class CredentialsDialog(QDialog):
         # Method selection
         self._setup_method_selection(layout)
 
-        # Manual credentials section
-        self._setup_manual_credentials(layout)
-
-        # File import section
-        self._setup_file_import(layout)
+        # Manual credentials and file import sections are inserted here on demand
 
         # Instructions section
         self._setup_instructions(layout)
@@ -78,17 +111,33 @@ class CredentialsDialog(QDialog):
         method_group = QGroupBox("Configuration Method")
         method_layout = QVBoxLayout(method_group)
 
-        self.manual_radio = QCheckBox("Enter credentials manually")
-        self.file_radio = QCheckBox("Import from client_secret.json file")
+        self.manual_radio = QRadioButton("Enter credentials manually")
+        self.file_radio = QRadioButton("Import from client_secret.json file")
 
-        self.manual_radio.toggled.connect(self._on_method_changed)
-        self.file_radio.toggled.connect(self._on_method_changed)
+        # Exclusive group: one idToggled(checked=True) per user switch
+        self._method_group = QButtonGroup(self)
+        self._method_group.setExclusive(True)
+        self._method_group.addButton(self.manual_radio, 0)
+        self._method_group.addButton(self.file_radio, 1)
+        self._method_group.idToggled.connect(self._on_method_changed_id)
 
         method_layout.addWidget(self.manual_radio)
         method_layout.addWidget(self.file_radio)
 
         layout.addWidget(method_group)
 
+    def _ensure_manual_group(self):
+        """Build the manual credentials group if it doesn't exist yet."""
+        if not self._manual_built:
+            self._manual_built = True
+            self._setup_manual_credentials(self.layout())
+
+    def _ensure_file_group(self):
+        """Build the file import group if it doesn't exist yet."""
+        if not self._file_built:
+            self._file_built = True
+            self._setup_file_import(self.layout())
+
     def _setup_manual_credentials(self, layout):
         """Setup manual credentials input fields."""
         self.manual_group = QGroupBox("Manual Credentials")
@@ -127,7 +176,9 @@ class CredentialsDialog(QDialog):
         token_uri_layout.addWidget(self.token_uri_edit)
         manual_layout.addLayout(token_uri_layout)
 
-        layout.addWidget(self.manual_group)
+        # Keep the manual group above the file group, whichever is built first
+        anchor = self.file_group if self._file_built else self.instructions_group
+        layout.insertWidget(layout.indexOf(anchor), self.manual_group)
         self.manual_group.setVisible(False)
 
     def _setup_file_import(self, layout):
@@ -155,13 +206,13 @@ class CredentialsDialog(QDialog):
         self.file_preview.setReadOnly(True)
         file_layout.addWidget(self.file_preview)
 
-        layout.addWidget(self.file_group)
+        layout.insertWidget(layout.indexOf(self.instructions_group), self.file_group)
         self.file_group.setVisible(False)
 
     def _setup_instructions(self, layout):
         """Setup instructions section."""
-        instructions_group = QGroupBox("How to Get Credentials")
-        instructions_layout = QVBoxLayout(instructions_group)
+        self.instructions_group = QGroupBox("How to Get Credentials")
+        instructions_layout = QVBoxLayout(self.instructions_group)
 
         instructions_text = """
 1. Go to <a href="https://console.cloud.google.com/">Google Cloud Console</a>
@@ -180,7 +231,7 @@ Note: You'll need to add your email as a test user in the OAuth consent screen.
         instructions_label.setWordWrap(True)
         instructions_layout.addWidget(instructions_label)
 
-        layout.addWidget(instructions_group)
+        layout.addWidget(self.instructions_group)
 
     def _setup_buttons(self, layout):
         """Setup dialog buttons."""
@@ -198,10 +249,22 @@ Note: You'll need to add your email as a test user in the OAuth consent screen.
 
         layout.addLayout(button_layout)
 
+    def _on_method_changed_id(self, button_id: int, checked: bool):
+        """Handle a toggle in the method group, ignoring the unchecked half."""
+        if checked:
+            self._on_method_changed()
+
     def _on_method_changed(self):
         """Handle method selection change."""
-        self.manual_group.setVisible(self.manual_radio.isChecked())
-        self.file_group.setVisible(self.file_radio.isChecked())
+        if self.manual_radio.isChecked():
+            self._ensure_manual_group()
+        if self.file_radio.isChecked():
+            self._ensure_file_group()
+
+        if self._manual_built:
+            self.manual_group.setVisible(self.manual_radio.isChecked())
+        if self._file_built:
+            self.file_group.setVisible(self.file_radio.isChecked())
 
     def _browse_file(self):
         """Browse for client secret file."""
@@ -213,33 +276,39 @@ Note: You'll need to add your email as a test user in the OAuth consent screen.
         )
 
         if file_path:
+            self._ensure_file_group()
             self.file_path_edit.setText(file_path)
             self._preview_file(file_path)
 
     def _preview_file(self, file_path: str):
         """Preview the contents of the selected file and prefill manual fields."""
+        self._ensure_file_group()
+        self._ensure_manual_group()
         try:
-            with open(file_path, "r") as f:
-                content = f.read()
-                self.file_preview.setPlainText(content)
-
-                # Parse JSON and prefill manual input fields
-                import json
-
-                data = json.loads(content)
-
-                if "installed" in data:
-                    installed = data["installed"]
-
-                    # Prefill manual input fields with values from JSON
-                    if "client_id" in installed:
-                        self.client_id_edit.setText(installed["client_id"])
-                    if "client_secret" in installed:
-                        self.client_secret_edit.setText(installed["client_secret"])
-                    if "auth_uri" in installed:
-                        self.auth_uri_edit.setText(installed["auth_uri"])
-                    if "token_uri" in installed:
-                        self.token_uri_edit.setText(installed["token_uri"])
+            with open(file_path, "rb") as f:
+                raw = f.read()
+
+            # Show only the head of the file; the preview box is small
+            preview = raw[:PREVIEW_MAX_BYTES].decode("utf-8", errors="replace")
+            if len(raw) > PREVIEW_MAX_BYTES:
+                preview += "\n… (truncated)"
+            self.file_preview.setPlainText(preview)
+
+            # Parse the raw bytes and prefill manual input fields
+            data = _json_loads(raw)
+
+            if "installed" in data:
+                installed = data["installed"]
+
+                # Prefill manual input fields with values from JSON
+                if "client_id" in installed:
+                    self.client_id_edit.setText(installed["client_id"])
+                if "client_secret" in installed:
+                    self.client_secret_edit.setText(installed["client_secret"])
+                if "auth_uri" in installed:
+                    self.auth_uri_edit.setText(installed["auth_uri"])
+                if "token_uri" in installed:
+                    self.token_uri_edit.setText(installed["token_uri"])
 
         except Exception as e:
             self.file_preview.setPlainText(f"Error reading file: {e}")
@@ -253,8 +322,8 @@ Note: You'll need to add your email as a test user in the OAuth consent screen.
         """Save the configured credentials."""
         try:
             # Check if we have a file selected and manual fields are filled
-            file_path = self.file_path_edit.text().strip()
-            manual_fields_filled = (
+            file_path = self._file_built and self.file_path_edit.text().strip()
+            manual_fields_filled = self._manual_built and (
                 self.client_id_edit.text().strip()
                 and self.client_secret_edit.text().strip()
             )
@@ -285,69 +354,84 @@ Note: You'll need to add your email as a test user in the OAuth consent screen.
 
     def _save_manual_credentials(self):
         """Save manually entered credentials."""
+        self._ensure_manual_group()
         client_id = self.client_id_edit.text().strip()
         client_secret = self.client_secret_edit.text().strip()
-        auth_uri = self.auth_uri_edit.text().strip()
-        token_uri = self.token_uri_edit.text().strip()
 
-        if not client_id or not client_secret:
+        if not (client_id and client_secret):
             raise ValueError("Client ID and Client Secret are required")
 
-        if not client_id.endswith(".apps.googleusercontent.com"):
+        if not client_id.endswith(_GOOGLE_CLIENT_ID_SUFFIX):
             raise ValueError("Invalid Client ID format")
 
         # Save to configuration file
         config = {
             "client_id": client_id,
             "client_secret": client_secret,
-            "auth_uri": auth_uri,
-            "token_uri": token_uri,
+            "auth_uri": self.auth_uri_edit.text().strip(),
+            "token_uri": self.token_uri_edit.text().strip(),
         }
 
         self._save_config_to_file(config)
 
     def _save_file_credentials(self):
         """Save credentials from file."""
+        self._ensure_file_group()
         file_path = self.file_path_edit.text().strip()
 
         if not file_path:
             raise ValueError("Please select a client secret file")
 
-        if not Path(file_path).exists():
+        if not Path(file_path).is_file():
             raise ValueError("Selected file does not exist")
 
         # Copy file to private directory
         private_dir = Path("private")
         private_dir.mkdir(exist_ok=True)
 
-        import shutil
-
-        shutil.copy2(file_path, private_dir / "client_secret.json")
+        # Client secret files are tiny, so copy them in one read and write
+        target = private_dir / "client_secret.json"
+        with open(file_path, "rb") as src, open(target, "wb") as dst:
+            dst.write(src.read())
+        self._invalidate_config_cache()
 
     def _save_config_to_file(self, config: dict):
         """Save configuration to file."""
-        import json
-
         config_dir = Path("private")
         config_dir.mkdir(exist_ok=True)
 
         config_file = config_dir / "custom_credentials.json"
-        with open(config_file, "w") as f:
-            json.dump(config, f, indent=2)
+        with open(config_file, "wb") as f:
+            f.write(_json_dumps(config))
+        self._invalidate_config_cache()
+
+    @staticmethod
+    def _invalidate_config_cache():
+        """Force the next get_credentials_config() to re-read the file."""
+        CredentialsDialog._config_cache = None
+        CredentialsDialog._config_mtime = -1
 
     def get_credentials_config(self) -> Optional[dict]:
         """Get the configured credentials for use by the auth manager."""
         try:
             config_file = Path("private/custom_credentials.json")
-            if config_file.exists():
-                import json
-
-                with open(config_file, "r") as f:
-                    return json.load(f)
+            try:
+                mtime = config_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+
+            if mtime is not None:
+                cls = CredentialsDialog
+                if mtime != cls._config_mtime:
+                    with open(config_file, "rb") as f:
+                        cls._config_cache = _json_loads(f.read())
+                    cls._config_mtime = mtime
+                # A copy, so callers can't change the cached config
+                return dict(cls._config_cache)
 
             # Check for file-based credentials
             client_secret_file = Path("private/client_secret.json")
-            if client_secret_file.exists():
+            if client_secret_file.is_file():
                 return {"type": "file", "path": str(client_secret_file)}
 
         except Exception:
@@ -2,25 +2,95 @@
 Folder chip bar component for filtering media by parent folders.
 """
 
+import os
+from os.path import basename, dirname, isdir
 from pathlib import Path
 from typing import Callable, Dict, List, Set
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QSignalBlocker, Qt, Signal
 from PySide6.QtWidgets import QHBoxLayout, QPushButton, QScrollArea, QWidget
 
 from core.styles import theme
 
+# Chip styles depend only on the session-wide theme, so build them once.
+# Visible state - green/active styling
+_CHIP_STYLE_VISIBLE = f"""
+    QPushButton {{
+        background: {theme.primary};
+        color: white;
+        border: 1px solid {theme.primary};
+        border-radius: 10px;
+        padding: 2px 6px;
+        font-size: 10px;
+        font-weight: 500;
+        min-width: 20px;
+        max-width: 80px;
+    }}
+    QPushButton:hover {{
+        background: {theme.primary_hover};
+        border-color: {theme.primary_hover};
+    }}
+    QPushButton:pressed {{
+        background: {theme.primary_hover};
+    }}
+"""
+
+# Hidden state - gray/inactive styling
+_CHIP_STYLE_HIDDEN = f"""
+    QPushButton {{
+        background: {theme.background_elevated};
+        color: {theme.text_secondary};
+        border: 1px solid {theme.border};
+        border-radius: 10px;
+        padding: 2px 6px;
+        font-size: 10px;
+        font-weight: 500;
+        min-width: 20px;
+        max-width: 80px;
+    }}
+    QPushButton:hover {{
+        background: {theme.background_secondary};
+        border-color: {theme.text_secondary};
+    }}
+    QPushButton:pressed {{
+        background: {theme.background_secondary};
+    }}
+"""
+
+# Detached chip buttons kept around for reuse by later update_folders calls
+_BUTTON_POOL_MAX = 32
+
+# Chip labels longer than _DISPLAY_MAX are cut to _DISPLAY_TRUNC + ellipsis
+_DISPLAY_MAX = 15
+_DISPLAY_TRUNC = 12
+_ELLIPSIS = "..."
+
+
+def _get_display_name(folder_path: str) -> str:
+    """Get display name for folder (truncated to 15 chars)."""
+    name = basename(folder_path)
+    return name if len(name) <= _DISPLAY_MAX else name[:_DISPLAY_TRUNC] + _ELLIPSIS
+
 
 class FolderChipBar(QWidget):
     """Chip bar showing parent folders with toggle functionality."""
 
     # Signal emitted when folder visibility is toggled
     folder_toggled = Signal(str, bool)  # folder_path, is_visible
+    # Signal emitted once after show/hide all
+    folders_bulk_changed = Signal(dict)  # folder_path -> is_visible
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.folder_states: Dict[str, bool] = {}  # folder_path -> is_visible
         self.folder_buttons: Dict[str, QPushButton] = {}
+        self._button_to_path: Dict[QPushButton, str] = {}
+        # Parent folders already confirmed to exist
+        self._existing_parent_cache: Dict[str, bool] = {}
+        # Folder path -> truncated chip label
+        self._display_name_cache: Dict[str, str] = {}
+        # Removed chips, still connected to _on_any_chip_toggled
+        self._button_pool: List[QPushButton] = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -52,70 +122,117 @@ class FolderChipBar(QWidget):
         self.scroll_area.setWidget(self.chip_container)
         layout.addWidget(self.scroll_area)
 
+        # Chips sit directly in the bar while they fit (see _update_scroll_mode)
+        self.setFixedHeight(28)
+        self._scrolling = True
+
     def update_folders(self, media_paths: List[Path]):
         """Update the folder chips based on media paths."""
         # Extract unique parent folders
         folders = self._extract_parent_folders(media_paths)
 
-        # Remove chips for folders that no longer exist
-        self._remove_old_chips(folders)
+        # Diff once against the live key view (no copy of the chip set)
+        existing = self.folder_buttons.keys()
+        to_remove = existing - folders
+        to_add = folders - existing
+        to_update = folders & existing
+
+        # Repaint once for the whole batch of chip changes
+        self.chip_container.setUpdatesEnabled(False)
+        try:
+            # Remove chips for folders that no longer exist
+            for folder_path in to_remove:
+                self._release_chip(self.folder_buttons.pop(folder_path))
+                self.folder_states.pop(folder_path, None)
+
+            # Update existing chips
+            for folder_path in to_update:
+                self._update_chip_styling(folder_path)
 
-        # Add new chips
-        self._add_new_chips(folders)
+            # Add new chips
+            for folder_path in to_add:
+                self._create_folder_chip(folder_path)
+        finally:
+            self.chip_container.setUpdatesEnabled(True)
+
+        self._update_scroll_mode()
+
+    def resizeEvent(self, event):
+        """Switch between direct and scrolled chips as the bar resizes."""
+        super().resizeEvent(event)
+        self._update_scroll_mode()
+
+    def _update_scroll_mode(self):
+        """Only wrap the chips in the scroll area when they overflow the bar."""
+        # Measure the buttons directly: chips added to a shown bar stay hidden
+        # (and out of the layout's size hint) until the next event loop pass
+        margins = self.chip_layout.contentsMargins()
+        chips_width = margins.left() + margins.right() + sum(
+            button.sizeHint().width() + self.chip_layout.spacing()
+            for button in self.folder_buttons.values()
+        )
+        needs_scroll = chips_width > self.width()
+        if needs_scroll == self._scrolling:
+            return
 
-        # Update existing chips
-        self._update_existing_chips(folders)
+        layout = self.layout()
+        if needs_scroll:
+            layout.removeWidget(self.chip_container)
+            # The scroll area needs the chips' real minimum width to scroll
+            self.chip_container.setMinimumWidth(0)
+            self.scroll_area.setWidget(self.chip_container)
+            self.scroll_area.show()
+        else:
+            self.scroll_area.takeWidget()
+            self.scroll_area.hide()
+            # Keep the chips from dictating the bar's minimum width
+            self.chip_container.setMinimumWidth(1)
+            layout.addWidget(self.chip_container)
+            self.chip_container.show()
+        self._scrolling = needs_scroll
 
     def _extract_parent_folders(self, media_paths: List[Path]) -> Set[str]:
         """Extract unique parent folder paths from media paths."""
+        # Siblings share a parent, so check each directory only once.
+        # The media files themselves are already known to the caller.
+        known = self._existing_parent_cache
+        seen = set()
         folders = set()
         for path in media_paths:
-            if path.exists():
-                parent = path.parent
-                if parent.exists():
-                    folders.add(str(parent))
+            # Matches str(path.parent), including "." for bare file names
+            parent = dirname(os.fspath(path)) or "."
+            if parent in seen:
+                continue
+            seen.add(parent)
+            if known.get(parent) or isdir(parent):
+                # Only remember hits, so a folder created later is picked up
+                known[parent] = True
+                folders.add(parent)
         return folders
 
-    def _remove_old_chips(self, current_folders: Set[str]):
-        """Remove chips for folders that no longer exist."""
-        folders_to_remove = set(self.folder_buttons.keys()) - current_folders
-        for folder_path in folders_to_remove:
-            if folder_path in self.folder_buttons:
-                button = self.folder_buttons.pop(folder_path)
-                self.chip_layout.removeWidget(button)
-                button.deleteLater()
-            if folder_path in self.folder_states:
-                del self.folder_states[folder_path]
-
-    def _add_new_chips(self, current_folders: Set[str]):
-        """Add new chips for folders that don't exist yet."""
-        new_folders = current_folders - set(self.folder_buttons.keys())
-        for folder_path in new_folders:
-            self._create_folder_chip(folder_path)
-
-    def _update_existing_chips(self, current_folders: Set[str]):
-        """Update existing chips (refresh styling, etc.)."""
-        for folder_path in current_folders:
-            if folder_path in self.folder_buttons:
-                self._update_chip_styling(folder_path)
-
     def _create_folder_chip(self, folder_path: str):
         """Create a new folder chip button."""
         folder_name = self._get_display_name(folder_path)
 
-        button = QPushButton(folder_name)
-        button.setCheckable(True)
-        button.setChecked(True)  # Default to visible
+        if self._button_pool:
+            # Reused buttons keep their toggled connection
+            button = self._button_pool.pop()
+            button.setText(folder_name)
+            with QSignalBlocker(button):
+                button.setChecked(True)  # Default to visible
+            button.show()
+        else:
+            button = QPushButton(folder_name)
+            button.setCheckable(True)
+            button.setChecked(True)  # Default to visible
+            # Connect signal; one shared slot looks the folder up from the sender
+            button.toggled.connect(self._on_any_chip_toggled)
         button.setToolTip(f"Toggle visibility for: {folder_path}")
 
         # Store references
         self.folder_buttons[folder_path] = button
         self.folder_states[folder_path] = True
-
-        # Connect signal
-        button.toggled.connect(
-            lambda checked, path=folder_path: self._on_chip_toggled(path, checked)
-        )
+        self._button_to_path[button] = folder_path
 
         # Style the button
         self._update_chip_styling(folder_path)
@@ -123,12 +240,23 @@ class FolderChipBar(QWidget):
         # Add to layout (before the stretch)
         self.chip_layout.insertWidget(self.chip_layout.count() - 1, button)
 
+    def _release_chip(self, button: QPushButton):
+        """Take a chip out of the bar, keeping it for reuse if the pool has room."""
+        self._button_to_path.pop(button, None)
+        self.chip_layout.removeWidget(button)
+        if len(self._button_pool) < _BUTTON_POOL_MAX:
+            button.hide()
+            self._button_pool.append(button)
+        else:
+            button.deleteLater()
+
     def _get_display_name(self, folder_path: str) -> str:
-        """Get display name for folder (truncated to 15 chars)."""
-        folder_name = Path(folder_path).name
-        if len(folder_name) > 15:
-            return folder_name[:12] + "..."
-        return folder_name
+        """Get the chip label for a folder, computed once per path."""
+        display_name = self._display_name_cache.get(folder_path)
+        if display_name is None:
+            display_name = _get_display_name(folder_path)
+            self._display_name_cache[folder_path] = display_name
+        return display_name
 
     def _update_chip_styling(self, folder_path: str):
         """Update the styling of a folder chip."""
@@ -138,54 +266,13 @@ class FolderChipBar(QWidget):
         button = self.folder_buttons[folder_path]
         is_visible = self.folder_states.get(folder_path, True)
 
-        if is_visible:
-            # Visible state - green/active styling
-            button.setStyleSheet(
-                f"""
-                QPushButton {{
-                    background: {theme.primary};
-                    color: white;
-                    border: 1px solid {theme.primary};
-                    border-radius: 10px;
-                    padding: 2px 6px;
-                    font-size: 10px;
-                    font-weight: 500;
-                    min-width: 20px;
-                    max-width: 80px;
-                }}
-                QPushButton:hover {{
-                    background: {theme.primary_hover};
-                    border-color: {theme.primary_hover};
-                }}
-                QPushButton:pressed {{
-                    background: {theme.primary_hover};
-                }}
-            """
-            )
-        else:
-            # Hidden state - gray/inactive styling
-            button.setStyleSheet(
-                f"""
-                QPushButton {{
-                    background: {theme.background_elevated};
-                    color: {theme.text_secondary};
-                    border: 1px solid {theme.border};
-                    border-radius: 10px;
-                    padding: 2px 6px;
-                    font-size: 10px;
-                    font-weight: 500;
-                    min-width: 20px;
-                    max-width: 80px;
-                }}
-                QPushButton:hover {{
-                    background: {theme.background_secondary};
-                    border-color: {theme.text_secondary};
-                }}
-                QPushButton:pressed {{
-                    background: {theme.background_secondary};
-                }}
-            """
-            )
+        button.setStyleSheet(_CHIP_STYLE_VISIBLE if is_visible else _CHIP_STYLE_HIDDEN)
+
+    def _on_any_chip_toggled(self, checked: bool):
+        """Route a chip's toggled signal to its folder."""
+        folder_path = self._button_to_path.get(self.sender())
+        if folder_path is not None:
+            self._on_chip_toggled(folder_path, checked)
 
     def _on_chip_toggled(self, folder_path: str, is_visible: bool):
         """Handle chip toggle event."""
@@ -201,28 +288,58 @@ class FolderChipBar(QWidget):
         """Get set of currently hidden folder paths."""
         return {path for path, visible in self.folder_states.items() if not visible}
 
-    def set_folder_visibility(self, folder_path: str, is_visible: bool):
-        """Programmatically set folder visibility."""
+    def set_folder_visibility(
+        self, folder_path: str, is_visible: bool, emit_signal: bool = False
+    ):
+        """Programmatically set folder visibility (silent unless emit_signal)."""
         if folder_path in self.folder_buttons:
             button = self.folder_buttons[folder_path]
-            button.setChecked(is_visible)
+            # Keep setChecked from re-running the toggle handler
+            with QSignalBlocker(button):
+                button.setChecked(is_visible)
             self.folder_states[folder_path] = is_visible
             self._update_chip_styling(folder_path)
+            if emit_signal:
+                self.folder_toggled.emit(folder_path, is_visible)
 
     def show_all_folders(self):
         """Show all folders."""
-        for folder_path in self.folder_buttons:
-            self.set_folder_visibility(folder_path, True)
+        self._set_all_folders(True)
 
     def hide_all_folders(self):
         """Hide all folders."""
-        for folder_path in self.folder_buttons:
-            self.set_folder_visibility(folder_path, False)
+        self._set_all_folders(False)
+
+    def _set_all_folders(self, is_visible: bool):
+        """Set every chip to the same state and notify listeners once."""
+        changed = []
+        self.chip_container.setUpdatesEnabled(False)
+        try:
+            for folder_path, button in self.folder_buttons.items():
+                if self.folder_states.get(folder_path, True) == is_visible:
+                    continue
+                with QSignalBlocker(button):
+                    button.setChecked(is_visible)
+                self.folder_states[folder_path] = is_visible
+                changed.append(folder_path)
+
+            for folder_path in changed:
+                self._update_chip_styling(folder_path)
+        finally:
+            self.chip_container.setUpdatesEnabled(True)
+
+        if changed:
+            self.folders_bulk_changed.emit(
+                {folder_path: is_visible for folder_path in self.folder_buttons}
+            )
 
     def clear(self):
         """Clear all folder chips."""
         for button in self.folder_buttons.values():
-            self.chip_layout.removeWidget(button)
-            button.deleteLater()
+            self._release_chip(button)
         self.folder_buttons.clear()
         self.folder_states.clear()
+        self._button_to_path.clear()
+        self._existing_parent_cache.clear()
+        self._display_name_cache.clear()
+        self._update_scroll_mode()
@@ -1,178 +1,371 @@
 # app/ui/history_widget.py
+import functools
+from collections import OrderedDict
 from datetime import datetime
-from pathlib import Path
-
-from PySide6.QtCore import Qt
+from os.path import basename
+from typing import List, NamedTuple, Optional
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QPoint,
+    QRect,
+    QRectF,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    QUrl,
+    Signal,
+)
+from PySide6.QtGui import (
+    QColor,
+    QDesktopServices,
+    QFont,
+    QFontMetrics,
+    QPainter,
+    QPixmap,
+)
 from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QFrame,
     QHBoxLayout,
     QLabel,
+    QListView,
     QPushButton,
-    QScrollArea,
+    QStyle,
+    QStyledItemDelegate,
     QVBoxLayout,
     QWidget,
 )
 
 from core.styles import LayoutHelper, StyleBuilder, theme
 
-
-class HistoryItemWidget(QWidget):
-    """Individual history item widget."""
-
-    def __init__(self, item_data: dict, parent=None):
+# The viewer's sheet depends only on the session-wide theme, so build it once.
+# Its object-name selectors style the header, stats, list and empty label.
+_VIEWER_QSS = f"""
+    QLabel#historyHeader {{
+        color: {theme.text_primary};
+        font-size: 16px;
+        font-weight: 600;
+    }}
+    QLabel#historyStats {{
+        color: {theme.text_secondary};
+        font-size: 11px;
+        padding: 4px 0px;
+    }}
+    QLabel#historyEmpty {{
+        color: {theme.text_secondary};
+        font-size: 12px;
+        text-align: center;
+        padding: 20px;
+    }}
+    QListView#historyList {{
+        border: none;
+        background: transparent;
+    }}
+"""
+
+_DATE_FMT = "%m/%d/%Y %H:%M"
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_date(iso: str) -> str:
+    """Format an ISO-8601 timestamp for display, or "" if it doesn't parse."""
+    if iso.endswith("Z"):
+        iso = iso[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(iso).strftime(_DATE_FMT)
+    except ValueError:
+        return ""
+
+
+class _HistoryRow(NamedTuple):
+    """Display strings for one history item, computed once per load."""
+
+    icon: str
+    title: str
+    details: str
+    date: str
+    url: str
+
+
+def _build_row(item_data: dict) -> _HistoryRow:
+    """Turn a history item into the strings shown for it."""
+    if item_data.get("item_type") == "upload":
+        icon = "📤"
+        title = item_data.get("title", "Unknown")
+        url = item_data.get("video_url", "")
+        details = f"🎥 {url}" if url else "🎥 No URL available"
+    else:
+        icon = "🔄"
+        # Show MP3 filename for conversions
+        title = basename(item_data.get("mp3_file", ""))
+        url = ""
+        details = f"📹 {basename(item_data.get('mp4_file', ''))}"
+
+    date_str = item_data.get("date", "")
+    date_text = _fmt_date(date_str) or date_str or "Unknown date"
+
+    return _HistoryRow(icon, title, details, date_text, url)
+
+
+class HistoryListModel(QAbstractListModel):
+    """List model holding the history items shown by HistoryWidget."""
+
+    # Role returning the row's precomputed _HistoryRow
+    RowRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.item_data = item_data
-        self._setup_ui()
-
-    def _setup_ui(self):
-        """Setup the history item UI."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 8, 12, 8)
-        layout.setSpacing(4)
-
-        # Main content area
-        content_layout = QHBoxLayout()
-        content_layout.setSpacing(12)
-
-        # Icon and type
-        icon_label = QLabel()
-        if self.item_data.get("item_type") == "upload":
-            icon_label.setText("📤")
-            type_text = "Upload"
-        else:
-            icon_label.setText("🔄")
-            type_text = "Conversion"
-
-        icon_label.setStyleSheet(
-            f"""
-            QLabel {{
-                font-size: 16px;
-                color: {theme.text_primary};
-            }}
-        """
+        self._items: List[dict] = []
+        self._rows: List[_HistoryRow] = []
+
+    def set_items(self, items: List[dict]):
+        """Replace the model contents with new history items."""
+        items = list(items)
+        rows = [_build_row(item) for item in items]
+        if rows == self._rows:
+            # Unchanged refresh: nothing for the view to redo
+            self._items = items
+            return
+
+        if len(rows) == len(self._rows):
+            # Same row count: rebind in place instead of resetting the view
+            self._items = items
+            self._rows = rows
+            self.dataChanged.emit(self.index(0), self.index(len(rows) - 1))
+            return
+
+        self.beginResetModel()
+        self._items = items
+        self._rows = rows
+        self.endResetModel()
+
+    def rows(self) -> List[_HistoryRow]:
+        """Get the display rows currently in the model."""
+        return self._rows
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return row.title
+        if role == Qt.ToolTipRole:
+            return row.url or None
+        if role == self.RowRole:
+            return row
+        if role == Qt.UserRole:
+            return self._items[index.row()]
+        return None
+
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """Paints history rows directly instead of building a widget per row."""
+
+    ROW_HEIGHT = 56
+    ROW_SPACING = 8
+    PIXMAP_CACHE_SIZE = 200
+
+    def sizeHint(self, option, index) -> QSize:
+        # No width of its own: the list stretches rows to the viewport
+        return QSize(0, self.ROW_HEIGHT)
+
+    def _card_rect(self, rect: QRect) -> QRect:
+        """Area of the rounded card within a row (the rest is spacing)."""
+        return rect.adjusted(0, 0, 0, -self.ROW_SPACING)
+
+    def _details_rect(self, rect: QRect) -> QRect:
+        """Area of the details line (URL or MP4 name) within a row."""
+        content = self._card_rect(rect).adjusted(12, 8, -12, -8)
+        return QRect(
+            content.left() + 28,
+            content.top() + content.height() // 2,
+            content.width() - 28,
+            content.height() - content.height() // 2,
         )
-        content_layout.addWidget(icon_label)
-
-        # Content
-        content_widget = QWidget()
-        content_layout_widget = QVBoxLayout(content_widget)
-        content_layout_widget.setContentsMargins(0, 0, 0, 0)
-        content_layout_widget.setSpacing(2)
-
-        # Title/File name
-        title_label = QLabel()
-        if self.item_data.get("item_type") == "upload":
-            title_label.setText(self.item_data.get("title", "Unknown"))
-        else:
-            # Show MP3 filename for conversions
-            mp3_path = Path(self.item_data.get("mp3_file", ""))
-            title_label.setText(mp3_path.name)
-
-        title_label.setStyleSheet(
-            f"""
-            QLabel {{
-                color: {theme.text_primary};
-                font-size: 12px;
-                font-weight: 600;
-            }}
-        """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Rendered rows keyed by (row, hovered), all at _cache_geometry
+        self._pixmap_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self._cache_geometry: Optional[tuple] = None  # (width, device pixel ratio)
+        self._load_colors()
+
+    def _load_colors(self):
+        """Resolve the theme colors used by _render once."""
+        self._card_pen = QColor(theme.border)
+        self._card_pen_hover = QColor(theme.primary)
+        self._card_brush = QColor(theme.background_elevated)
+        self._card_brush_hover = QColor(theme.background_secondary)
+        self._text_primary = QColor(theme.text_primary)
+        self._text_secondary = QColor(theme.text_secondary)
+        self._link = QColor(theme.primary)
+
+    def retain_rows(self, rows: List[_HistoryRow]):
+        """Drop rendered pixmaps of rows that are no longer shown."""
+        keep = set(rows)
+        stale = [key for key in self._pixmap_cache if key[0] not in keep]
+        for key in stale:
+            del self._pixmap_cache[key]
+
+    def clear_cache(self):
+        """Drop all rendered rows, e.g. after the theme or font changed."""
+        self._pixmap_cache.clear()
+        self._load_colors()
+
+    def paint(self, painter, option, index):
+        row = index.data(HistoryListModel.RowRole)
+        if row is None:
+            return
+
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        widget = option.widget
+        dpr = (
+            widget.devicePixelRatioF()
+            if widget is not None
+            else painter.device().devicePixelRatioF()
         )
-        content_layout_widget.addWidget(title_label)
-
-        # Details
-        if self.item_data.get("item_type") == "upload":
-            video_url = self.item_data.get("video_url", "")
-            if video_url:
-                # Create clickable link for YouTube URLs
-                link_style = f"color: {theme.primary}; text-decoration: none;"
-                details_link = QLabel(
-                    f"🎥 <a href='{video_url}' style='{link_style}'>{video_url}</a>"
-                )
-                details_link.setOpenExternalLinks(True)
-                details_link.setStyleSheet(
-                    f"""
-                    QLabel {{
-                        color: {theme.text_secondary};
-                        font-size: 10px;
-                        cursor: pointer;
-                    }}
-                    QLabel a {{
-                        color: {theme.primary};
-                        text-decoration: none;
-                    }}
-                    QLabel a:hover {{
-                        color: {theme.primary_hover};
-                        text-decoration: underline;
-                    }}
-                """
-                )
-                content_layout_widget.addWidget(details_link)
-            else:
-                details_label = QLabel("🎥 No URL available")
-                details_label.setStyleSheet(
-                    f"""
-                    QLabel {{
-                        color: {theme.text_secondary};
-                        font-size: 10px;
-                    }}
-                """
+        size = option.rect.size()
+        geometry = (size.width(), dpr)
+        if geometry != self._cache_geometry:
+            # Rows all share the viewport width, so pixmaps rendered at any
+            # other width (e.g. mid-resize) won't be drawn again
+            self._pixmap_cache.clear()
+            self._cache_geometry = geometry
+        key = (row, hovered)
+
+        cache = self._pixmap_cache
+        pixmap = cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(size * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            pixmap_painter = QPainter(pixmap)
+            try:
+                self._render(
+                    pixmap_painter, QRect(QPoint(0, 0), size), row, hovered, option.font
                 )
-                content_layout_widget.addWidget(details_label)
+            finally:
+                pixmap_painter.end()
+            cache[key] = pixmap
+            if len(cache) > self.PIXMAP_CACHE_SIZE:
+                cache.popitem(last=False)
         else:
-            mp4_path = Path(self.item_data.get("mp4_file", ""))
-            details_label = QLabel(f"📹 {mp4_path.name}")
-            details_label.setStyleSheet(
-                f"""
-                QLabel {{
-                    color: {theme.text_secondary};
-                    font-size: 10px;
-                }}
-            """
-            )
-            content_layout_widget.addWidget(details_label)
+            cache.move_to_end(key)
+
+        painter.drawPixmap(option.rect.topLeft(), pixmap)
+
+    def _render(self, painter, rect: QRect, row, hovered: bool, base_font: QFont):
+        """Draw one history row into rect."""
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Card background and border
+        card = self._card_rect(rect)
+        painter.setPen(self._card_pen_hover if hovered else self._card_pen)
+        painter.setBrush(self._card_brush_hover if hovered else self._card_brush)
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        content = card.adjusted(12, 8, -12, -8)
+        font = QFont(base_font)
+
+        # Icon
+        font.setPixelSize(16)
+        painter.setFont(font)
+        painter.setPen(self._text_primary)
+        painter.drawText(
+            QRect(content.left(), content.top(), 24, content.height()),
+            Qt.AlignLeft | Qt.AlignTop,
+            row.icon,
+        )
 
-        content_layout.addWidget(content_widget, 1)
+        # Date, right aligned
+        font.setPixelSize(10)
+        painter.setFont(font)
+        metrics = QFontMetrics(font)
+        date_width = metrics.horizontalAdvance(row.date)
+        painter.setPen(self._text_secondary)
+        painter.drawText(
+            QRect(content.right() - date_width, content.top(), date_width + 1, 16),
+            Qt.AlignRight | Qt.AlignTop,
+            row.date,
+        )
 
-        # Date
-        date_label = QLabel()
-        date_str = self.item_data.get("date", "")
-        if date_str:
-            try:
-                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                date_label.setText(dt.strftime("%m/%d/%Y %H:%M"))
-            except Exception:
-                date_label.setText(date_str)
-        else:
-            date_label.setText("Unknown date")
-
-        date_label.setStyleSheet(
-            f"""
-            QLabel {{
-                color: {theme.text_secondary};
-                font-size: 10px;
-                text-align: right;
-            }}
-        """
+        # Details line; upload URLs are drawn as links
+        details = self._details_rect(rect)
+        details.setRight(content.right() - date_width - 12)
+        painter.setPen(self._link if row.url else self._text_secondary)
+        painter.drawText(
+            details,
+            Qt.AlignLeft | Qt.AlignTop,
+            metrics.elidedText(row.details, Qt.ElideRight, details.width()),
         )
-        date_label.setAlignment(Qt.AlignRight | Qt.AlignTop)
-        content_layout.addWidget(date_label)
-
-        layout.addLayout(content_layout)
-
-        # Styling
-        self.setStyleSheet(
-            f"""
-            QWidget {{
-                background: {theme.background_elevated};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-            }}
-            QWidget:hover {{
-                background: {theme.background_secondary};
-                border-color: {theme.primary};
-            }}
-        """
+
+        # Title
+        font.setPixelSize(12)
+        font.setWeight(QFont.DemiBold)
+        painter.setFont(font)
+        painter.setPen(self._text_primary)
+        title = QRect(details.left(), content.top(), details.width(), 0)
+        title.setBottom(details.top() - 1)
+        painter.drawText(
+            title,
+            Qt.AlignLeft | Qt.AlignTop,
+            QFontMetrics(font).elidedText(row.title, Qt.ElideRight, title.width()),
         )
 
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        """Open an upload's YouTube URL when its details line is clicked."""
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+        ):
+            row = index.data(HistoryListModel.RowRole)
+            if (
+                row is not None
+                and row.url
+                and self._details_rect(option.rect).contains(event.position().toPoint())
+            ):
+                QDesktopServices.openUrl(QUrl(row.url))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class HistoryLoadWorkerSignals(QObject):
+    """Signals for HistoryLoadWorker; a QRunnable can't define its own."""
+
+    loaded = Signal(object, object)  # history items, stats
+    finished = Signal()
+
+
+class HistoryLoadWorker(QRunnable):
+    """Reads history items and stats on the thread pool."""
+
+    def __init__(self, history_manager, limit: int = 50):
+        super().__init__()
+        self.history_manager = history_manager
+        self.limit = limit
+        # Created on the GUI thread, so emits from the pool are queued there
+        self.signals = HistoryLoadWorkerSignals()
+
+    def run(self):
+        """Read the history and report it through signals."""
+        try:
+            items = self.history_manager.get_all_history(limit=self.limit)
+            stats = self.history_manager.get_stats()
+            self.signals.loaded.emit(items, stats)
+        finally:
+            self.signals.finished.emit()
+
 
 class HistoryWidget(QWidget):
     """History viewer widget."""
@@ -180,6 +373,11 @@ class HistoryWidget(QWidget):
     def __init__(self, history_manager, parent=None):
         super().__init__(parent)
         self.history_manager = history_manager
+        # (uploads, conversions, last_updated) of the stats line on screen
+        self._last_stats_key: Optional[tuple] = None
+        # A load is running on the pool / another was requested meanwhile
+        self._load_busy = False
+        self._reload_requested = False
         self._setup_ui()
         self._load_history()
 
@@ -188,20 +386,13 @@ class HistoryWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
+        self.setStyleSheet(_VIEWER_QSS)
 
         # Header
         header_layout = QHBoxLayout()
 
         title_label = QLabel("📋 History")
-        title_label.setStyleSheet(
-            f"""
-            QLabel {{
-                color: {theme.text_primary};
-                font-size: 16px;
-                font-weight: 600;
-            }}
-        """
-        )
+        title_label.setObjectName("historyHeader")
         header_layout.addWidget(title_label)
 
         header_layout.addStretch()
@@ -216,90 +407,92 @@ class HistoryWidget(QWidget):
 
         # Stats
         stats_label = QLabel()
-        stats_label.setStyleSheet(
-            f"""
-            QLabel {{
-                color: {theme.text_secondary};
-                font-size: 11px;
-                padding: 4px 0px;
-            }}
-        """
-        )
+        stats_label.setTextFormat(Qt.PlainText)
+        stats_label.setObjectName("historyStats")
         layout.addWidget(stats_label)
         self.stats_label = stats_label
 
-        # Scroll area for history items
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet(
-            """
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-        """
+        # List of history items; rows are painted by HistoryItemDelegate, so
+        # only the visible ones cost anything regardless of history length
+        self.history_model = HistoryListModel(self)
+        self.history_list = QListView()
+        self.history_list.setModel(self.history_model)
+        self.history_delegate = HistoryItemDelegate(self.history_list)
+        self.history_list.setItemDelegate(self.history_delegate)
+        self.history_list.setSelectionMode(QAbstractItemView.NoSelection)
+        # Rows all share the delegate's fixed height, so skip per-row sizing
+        self.history_list.setUniformItemSizes(True)
+        # Lay rows out 10 at a time between event loop passes
+        self.history_list.setLayoutMode(QListView.Batched)
+        self.history_list.setBatchSize(10)
+        self.history_list.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.history_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.history_list.setFrameShape(QFrame.NoFrame)
+        self.history_list.setMouseTracking(True)
+        self.history_list.setObjectName("historyList")
+        layout.addWidget(self.history_list, 1)
+
+        # Shown instead of the list when there is no history
+        self.empty_label = QLabel(
+            "No history yet. Uploads and conversions will appear here."
         )
-
-        # Container for history items
-        self.history_container = QWidget()
-        self.history_layout = QVBoxLayout(self.history_container)
-        self.history_layout.setContentsMargins(0, 0, 0, 0)
-        self.history_layout.setSpacing(8)
-        self.history_layout.addStretch()  # Push items to top
-
-        scroll_area.setWidget(self.history_container)
-        layout.addWidget(scroll_area)
+        self.empty_label.setObjectName("historyEmpty")
+        self.empty_label.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
+        self.empty_label.hide()
+        layout.addWidget(self.empty_label, 1)
 
     def _load_history(self):
-        """Load and display history items."""
-        # Clear existing items
-        while self.history_layout.count() > 1:  # Keep the stretch
-            item = self.history_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Get history items
-        history_items = self.history_manager.get_all_history(limit=50)
-
+        """Load history items on the thread pool; they are shown when read."""
+        if self._load_busy:
+            # Coalesce refreshes that arrive while a load is running
+            self._reload_requested = True
+            return
+
+        self.load_worker = HistoryLoadWorker(self.history_manager, limit=50)
+        signals = self.load_worker.signals
+        signals.loaded.connect(self._on_history_loaded)
+        signals.finished.connect(self._on_load_finished)
+        self._load_busy = True
+        QThreadPool.globalInstance().start(self.load_worker)
+
+    def _on_load_finished(self):
+        """Clear the busy flag and run a refresh requested during the load."""
+        self._load_busy = False
+        self.load_worker = None
+        if self._reload_requested:
+            self._reload_requested = False
+            self._load_history()
+
+    def _on_history_loaded(self, history_items: list, stats: dict):
+        """Display history items and stats read by the load worker."""
         # Update stats
-        stats = self.history_manager.get_stats()
-        stats_text = (
-            f"📊 {stats['total_uploads']} uploads • "
-            f"{stats['total_conversions']} conversions"
+        stats_key = (
+            stats["total_uploads"],
+            stats["total_conversions"],
+            stats["last_updated"],
         )
-        if stats["last_updated"]:
-            try:
-                dt = datetime.fromisoformat(
-                    stats["last_updated"].replace("Z", "+00:00")
-                )
-                stats_text += f" • Last updated: {dt.strftime('%m/%d/%Y %H:%M')}"
-            except Exception:
-                pass
-        self.stats_label.setText(stats_text)
-
-        # Add history items
-        for item_data in history_items:
-            history_item = HistoryItemWidget(item_data, self)
-            self.history_layout.insertWidget(
-                self.history_layout.count() - 1, history_item
-            )
-
-        # Show message if no history
-        if not history_items:
-            no_history_label = QLabel(
-                "No history yet. Uploads and conversions will appear here."
-            )
-            no_history_label.setStyleSheet(
-                f"""
-                QLabel {{
-                    color: {theme.text_secondary};
-                    font-size: 12px;
-                    text-align: center;
-                    padding: 20px;
-                }}
-            """
-            )
-            no_history_label.setAlignment(Qt.AlignCenter)
-            self.history_layout.insertWidget(
-                self.history_layout.count() - 1, no_history_label
+        stats_text = None
+        if stats_key != self._last_stats_key:
+            self._last_stats_key = stats_key
+            stats_text = (
+                f"📊 {stats['total_uploads']} uploads • "
+                f"{stats['total_conversions']} conversions"
             )
+            last_updated = stats["last_updated"] and _fmt_date(stats["last_updated"])
+            if last_updated:
+                stats_text += f" • Last updated: {last_updated}"
+
+        # Apply the stats, rows and empty-state swap as one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            if stats_text is not None:
+                self.stats_label.setText(stats_text)
+
+            # Show history items, or a message if there are none
+            self.history_model.set_items(history_items)
+            # Release pixmaps of rows that left in one pass
+            self.history_delegate.retain_rows(self.history_model.rows())
+            self.history_list.setVisible(bool(history_items))
+            self.empty_label.setVisible(not history_items)
+        finally:
+            self.setUpdatesEnabled(True)
@@ -1,8 +1,21 @@
+import functools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-from PySide6.QtCore import QSize, Qt, QTimer, QPropertyAnimation, QEasingCurve, QThread, Signal
+from PySide6.QtCore import (
+    QEasingCurve,
+    QObject,
+    QPropertyAnimation,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import (
-    QApplication,
     QCheckBox,
     QComboBox,
     QFileDialog,
@@ -20,6 +33,7 @@ from PySide6.QtWidgets import (
 )
 
 # Lazy imports for better performance
+from core import styles
 from core.config import WINDOW_MIN_SIZE, WINDOW_TITLE
 from core.models import MediaItem
 from .auth_widget import AuthWidget
@@ -28,19 +42,72 @@ from .media_row import MediaRow
 from .upload_summary import UploadSummaryWidget
 from core.upload_manager import UploadManager
 
+# Stale persistence entries are pruned at most once per this many seconds
+_CLEANUP_INTERVAL_SECONDS = 24 * 60 * 60
 
-class LazyLoadingThread(QThread):
-    """Thread for lazy loading media items to prevent UI blocking."""
-    
-    progress_updated = Signal(int, int)  # current, total
+# Checked with a single str.endswith call per file name
+_MEDIA_SUFFIXES = (".mp3", ".mp4", ".wav", ".flac", ".m4a", ".avi", ".mov", ".mkv")
+
+# Top-level subfolders walked at once; directory reads release the GIL
+_SCAN_THREADS = min(8, os.cpu_count() or 1)
+
+
+def _iter_media_entries(folder):
+    """Yield a DirEntry for every media file below folder.
+
+    Walks the tree once with os.scandir so file type checks come from the
+    directory listing instead of an extra stat() per path.
+    """
+    stack = [os.fspath(folder)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(
+                            _MEDIA_SUFFIXES
+                        ) and entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+@functools.lru_cache(maxsize=256)
+def _truncate_path(path_str: str, max_length: int = 60) -> str:
+    """Shorten a long path for display, keeping its most relevant end."""
+    if len(path_str) <= max_length:
+        return path_str
+    parts = path_str.split(os.sep)
+    if len(parts) > 2:
+        # Show last 2 parts with ellipsis
+        return "..." + os.sep + os.sep.join(parts[-2:])
+    # Just truncate from the beginning
+    return "..." + path_str[-(max_length - 3):]
+
+
+class LazyLoadingWorkerSignals(QObject):
+    """Signals for LazyLoadingWorker; a QRunnable can't define its own."""
+
+    progress_updated = Signal(int, int)  # current, total (0 while unknown)
     items_loaded = Signal(list)  # list of MediaItem paths
     loading_complete = Signal()
+
+
+class LazyLoadingWorker(QRunnable):
+    """Scans a folder for media items on the thread pool."""
     
-    def __init__(self, folder_path: Path, batch_size: int = 50):
+    def __init__(self, folder_path: Path, batch_size: int = 50, meta_cache=None):
         super().__init__()
         self.folder_path = folder_path
         self.batch_size = batch_size
+        self.meta_cache = meta_cache  # Optional MediaMetaCache
         self._is_cancelled = False
+        # Created on the GUI thread, so emits from the pool are queued there
+        self.signals = LazyLoadingWorkerSignals()
         
     def cancel(self):
         """Cancel the loading operation."""
@@ -49,59 +116,134 @@ class LazyLoadingThread(QThread):
     def run(self):
         """Scan folder and emit media items in batches."""
         try:
-            media_extensions = {".mp3", ".mp4", ".wav", ".flac", ".m4a", ".avi", ".mov", ".mkv"}
-            
-            # First pass: count total files
-            total_files = 0
-            for file_path in self.folder_path.rglob("*"):
-                if self._is_cancelled:
-                    return
-                if file_path.is_file() and file_path.suffix.lower() in media_extensions:
-                    total_files += 1
-            
-            if total_files == 0:
-                self.loading_complete.emit()
-                return
-            
-            # Second pass: emit items in batches
+            # Single pass: emit items in batches as they are found
             current_batch = []
+            batch_files = []  # (path, mtime, size) for metadata lookups
             processed_files = 0
             
-            for file_path in self.folder_path.rglob("*"):
+            for entry in self._iter_entries():
                 if self._is_cancelled:
                     return
-                    
-                if not file_path.is_file() or file_path.suffix.lower() not in media_extensions:
-                    continue
                 
                 try:
+                    file_path = Path(entry.path)
                     # Create lightweight MediaItem (no heavy operations)
                     media_item = MediaItem(
                         path=file_path,
                         title=file_path.stem,
                     )
+                    if self.meta_cache is not None:
+                        stat = entry.stat()
+                        # entry.path is already the string form of file_path
+                        batch_files.append(
+                            (entry.path, stat.st_mtime_ns, stat.st_size)
+                        )
                     current_batch.append(media_item)
                     processed_files += 1
                     
                     # Emit batch when full
                     if len(current_batch) >= self.batch_size:
-                        self.items_loaded.emit(current_batch)
-                        self.progress_updated.emit(processed_files, total_files)
+                        self._apply_cached_meta(current_batch, batch_files)
+                        self.signals.items_loaded.emit(current_batch)
+                        self.signals.progress_updated.emit(processed_files, 0)
                         current_batch = []
+                        batch_files = []
                         
                 except (OSError, PermissionError):
                     continue
             
             # Emit final batch
             if current_batch:
-                self.items_loaded.emit(current_batch)
-                self.progress_updated.emit(processed_files, total_files)
+                self._apply_cached_meta(current_batch, batch_files)
+                self.signals.items_loaded.emit(current_batch)
+                self.signals.progress_updated.emit(processed_files, 0)
             
-            self.loading_complete.emit()
+            self.signals.loading_complete.emit()
             
         except Exception as e:
-            print(f"Error in lazy loading thread: {e}")
-            self.loading_complete.emit()
+            print(f"Error in lazy loading worker: {e}")
+            self.signals.loading_complete.emit()
+
+    def _iter_entries(self):
+        """Yield media file entries, walking each top-level subfolder in parallel.
+
+        Files directly in the folder come first; each subfolder's files follow
+        as soon as its walk finishes, so the order between subfolders varies.
+        """
+        subfolders = []
+        try:
+            with os.scandir(self.folder_path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subfolders.append(entry.path)
+                        elif entry.name.lower().endswith(
+                            _MEDIA_SUFFIXES
+                        ) and entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            return
+
+        if not subfolders:
+            return
+        with ThreadPoolExecutor(max_workers=_SCAN_THREADS) as pool:
+            futures = [pool.submit(self._scan_subfolder, path) for path in subfolders]
+            for future in as_completed(futures):
+                if self._is_cancelled:
+                    return  # Running walks see the flag and stop early
+                yield from future.result()
+
+    def _scan_subfolder(self, folder: str) -> list:
+        """Collect the media file entries below one subfolder (pool thread)."""
+        entries = []
+        for entry in _iter_media_entries(folder):
+            if self._is_cancelled:
+                break
+            if self.meta_cache is not None:
+                try:
+                    entry.stat()  # Cached on the entry for the merge loop
+                except OSError:
+                    continue
+            entries.append(entry)
+        return entries
+
+    def _apply_cached_meta(self, items: list, files: list):
+        """Fill in cached titles and durations for a batch with one lookup."""
+        if not files:
+            return
+        cached = self.meta_cache.lookup(files)
+        for item, (path_str, _, _) in zip(items, files):
+            meta = cached.get(path_str)
+            if meta is not None:
+                item.title = meta.title or item.title
+                item.duration_ms = meta.duration
+
+
+class PersistenceCleanupWorkerSignals(QObject):
+    """Signals for PersistenceCleanupWorker."""
+
+    finished = Signal(int)  # number of removed entries
+    failed = Signal(str)  # error message
+
+
+class PersistenceCleanupWorker(QRunnable):
+    """Removes persisted data for missing files on the thread pool."""
+
+    def __init__(self, persistence_service):
+        super().__init__()
+        self.persistence_service = persistence_service
+        self.signals = PersistenceCleanupWorkerSignals()
+
+    def run(self):
+        """Run the cleanup and report the result through signals."""
+        try:
+            removed = self.persistence_service.cleanup_invalid_paths()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(removed)
 
 
 class VirtualScrollArea(QScrollArea):
@@ -206,44 +348,46 @@ class MainWindow(QMainWindow):
         # Initialize managers (defer auth setup to avoid blocking)
         self.auth_widget = None  # Will be initialized after window shows
         self.upload_manager = None  # Will be initialized after auth
-        from core.history_manager import HistoryManager
-
-        self.history_manager = HistoryManager()
-
-        # Initialize settings manager
-        from core.settings_manager import SettingsManager
-        try:
-            self.settings_manager = SettingsManager()
-        except Exception as e:
-            # If settings manager fails to initialize, create a minimal one
-            print(f"Warning: Failed to initialize settings manager: {e}")
-            self.settings_manager = None
-
-        # Initialize media persistence service
-        from core.media_persistence_service import MediaPersistenceService
-        try:
-            self.media_persistence_service = MediaPersistenceService()
+        # (signal, slot) pairs connected from the current upload manager
+        self._upload_signal_connections = []
 
-            # Perform initial cleanup of invalid paths
-            if self.media_persistence_service:
-                cleaned_count = self.media_persistence_service.cleanup_invalid_paths()
-                if cleaned_count > 0:
-                    print(f"🧹 Initial cleanup: Removed {cleaned_count} invalid paths")
-
-        except Exception as e:
-            # If persistence service fails to initialize, create a minimal one
-            print(f"Warning: Failed to initialize media persistence service: {e}")
-            self.media_persistence_service = None
+        # Services are created after the window first shows (see showEvent)
+        self.history_manager = None
+        self.settings_manager = None
+        self.media_persistence_service = None
+        self.media_meta_cache = None  # Opened by the first scan
+        self._services_scheduled = False
+        self._cleanup_worker = None
 
         # Initialize sorting state
         self.current_sort_field = "name"
         self.current_sort_reverse = False
+        # (field, reverse) the items are currently sorted by, None if unsorted
+        self._applied_sort = None
+
+        # Coalesce bursts of sort/filter changes into one pass per frame
+        self._sort_timer = QTimer(self)
+        self._sort_timer.setSingleShot(True)
+        self._sort_timer.setInterval(16)
+        self._sort_timer.timeout.connect(self._apply_sorting)
+        self._visibility_timer = QTimer(self)
+        self._visibility_timer.setSingleShot(True)
+        self._visibility_timer.setInterval(16)
+        self._visibility_timer.timeout.connect(self._update_media_visibility)
+        # Checked rows, kept up to date from each row's toggled signal
+        self._selected_count = 0
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(16)
+        self._selection_timer.timeout.connect(self._update_upload_button_state)
 
         # Lazy loading state
         self.all_media_items = []  # All MediaItem objects (lightweight)
         self.media_rows = []  # Only visible MediaRow widgets
-        self.lazy_loading_thread = None
+        self.lazy_loading_worker = None
         self.is_loading = False
+        # File stat results for sorting, cleared on every scan
+        self._stat_cache: dict = {}
 
         # Top toolbar with fixed height
         toolbar_container = QWidget()
@@ -256,42 +400,9 @@ class MainWindow(QMainWindow):
 
         # Combined folder button and path display
         self.folder_btn = QPushButton()
-        from core.styles import theme
-
-        self.folder_btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                padding: 4px 12px;
-                background: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: 6px;
-                font-size: 10px;
-                font-weight: 500;
-                min-height: 16px;
-                min-width: 50px;
-                text-align: left;
-            }}
-            QPushButton:hover {{
-                background: {theme.background_secondary};
-                border-color: {theme.primary};
-            }}
-            QPushButton:pressed {{
-                background: {theme.background_tertiary};
-            }}
-        """
-        )
-        # Initialize with current directory or last used path
-        try:
-            last_media_path = self.settings_manager.get_last_media_path() if self.settings_manager else None
-            if last_media_path:
-                self.current_folder = last_media_path
-            else:
-                self.current_folder = Path.cwd()
-        except Exception as e:
-            # If there's any error, fall back to current directory
-            print(f"Warning: Failed to load last media path: {e}")
-            self.current_folder = Path.cwd()
+        self.folder_btn.setStyleSheet(styles.FOLDER_BTN_QSS)
+        # Start in the current directory; _init_settings restores the last used path
+        self.current_folder = Path.cwd()
 
         self.folder_btn.clicked.connect(self._choose_folder)
         self._update_folder_button_text()
@@ -326,15 +437,7 @@ class MainWindow(QMainWindow):
         status_layout.setContentsMargins(20, 0, 20, 0)  # Left padding for alignment
 
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet(
-            f"""
-            QLabel {{
-                color: {theme.text_secondary};
-                font-size: 11px;
-                margin: 0px;
-            }}
-        """
-        )
+        self.status_label.setStyleSheet(styles.STATUS_LABEL_QSS)
         status_layout.addWidget(self.status_label)
         layout.addWidget(status_container)
 
@@ -364,6 +467,9 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.scroll_area)
 
         self.media_rows: list[MediaRow] = []
+        # all_media_items before this index have been given rows, unless
+        # their folder was hidden at the time
+        self._next_item_index = 0
         self.hidden_folders: set[str] = set()  # Track hidden folders
         # Defer initial scan to avoid blocking startup
         # self._scan_current_folder()
@@ -379,12 +485,98 @@ class MainWindow(QMainWindow):
         if self.auth_widget is None:
             self._initialize_auth()
 
+        # Create services once the first frame is up; settings first, since
+        # the scan below reads the last media path from them
+        if not self._services_scheduled:
+            self._services_scheduled = True
+            QTimer.singleShot(0, self._init_settings)
+            QTimer.singleShot(50, self._init_history)
+            QTimer.singleShot(100, self._init_persistence)
+
         # Trigger initial folder scan after window is shown
         QTimer.singleShot(100, self._scan_current_folder)
         
         # Start fade-in animation after a short delay
         QTimer.singleShot(50, self._start_fade_in_animation)
 
+    def _init_settings(self):
+        """Create the settings manager and restore the last media folder."""
+        from core.settings_manager import SettingsManager
+
+        try:
+            self.settings_manager = SettingsManager()
+        except Exception as e:
+            # If settings manager fails to initialize, run without one
+            print(f"Warning: Failed to initialize settings manager: {e}")
+            self.settings_manager = None
+            return
+
+        try:
+            last_media_path = self.settings_manager.get_last_media_path()
+            if last_media_path:
+                self.current_folder = last_media_path
+                self._update_folder_button_text()
+        except Exception as e:
+            # If there's any error, stay in the current directory
+            print(f"Warning: Failed to load last media path: {e}")
+
+    def _init_history(self):
+        """Create the history manager if it doesn't exist yet."""
+        if self.history_manager is None:
+            from core.history_manager import HistoryManager
+
+            self.history_manager = HistoryManager()
+
+    def _init_persistence(self):
+        """Create the media persistence service and schedule its cleanup."""
+        from core.media_persistence_service import MediaPersistenceService
+
+        try:
+            self.media_persistence_service = MediaPersistenceService()
+        except Exception as e:
+            # If persistence service fails to initialize, run without one
+            print(f"Warning: Failed to initialize media persistence service: {e}")
+            self.media_persistence_service = None
+            return
+
+        self._start_persistence_cleanup()
+
+    def _init_meta_cache(self):
+        """Open the media metadata cache if it isn't open yet."""
+        if self.media_meta_cache is None:
+            from core.media_meta_cache import MediaMetaCache
+
+            try:
+                self.media_meta_cache = MediaMetaCache()
+            except Exception as e:
+                # Scans still work without the cache, just without its shortcuts
+                print(f"Warning: Failed to open media metadata cache: {e}")
+
+    def _start_persistence_cleanup(self):
+        """Prune entries for missing files in the background, at most once a day."""
+        if self.settings_manager:
+            last_cleanup = self.settings_manager.get_setting("last_cleanup_ts", 0)
+            if time.time() - last_cleanup < _CLEANUP_INTERVAL_SECONDS:
+                return
+
+        self._cleanup_worker = PersistenceCleanupWorker(self.media_persistence_service)
+        self._cleanup_worker.signals.finished.connect(self._on_cleanup_finished)
+        self._cleanup_worker.signals.failed.connect(self._on_cleanup_failed)
+        QThreadPool.globalInstance().start(self._cleanup_worker)
+
+    def _on_cleanup_finished(self, cleaned_count: int):
+        """Record when the persistence cleanup last ran."""
+        self._cleanup_worker = None
+        if self.settings_manager:
+            self.settings_manager.set_setting("last_cleanup_ts", time.time())
+        if cleaned_count > 0:
+            print(f"🧹 Initial cleanup: Removed {cleaned_count} invalid paths")
+
+    def _on_cleanup_failed(self, error: str):
+        """Report a failed persistence cleanup; it is retried on the next launch."""
+        self._cleanup_worker = None
+        print(f"Warning: Failed to clean up persisted media data: {error}")
+
     def _start_fade_in_animation(self):
         """Start the fade-in animation for smooth appearance."""
         # Hide loading overlay first
@@ -436,40 +628,61 @@ class MainWindow(QMainWindow):
             self.hidden_folders.add(folder_path)
 
         # Update media row visibility
-        self._update_media_visibility()
+        self._visibility_timer.start()
+
+    def _on_folders_bulk_changed(self, folder_states: dict):
+        """Handle show/hide all folders with a single visibility refresh."""
+        for folder_path, is_visible in folder_states.items():
+            if is_visible:
+                self.hidden_folders.discard(folder_path)
+            else:
+                self.hidden_folders.add(folder_path)
+
+        self._visibility_timer.start()
 
     def _update_media_visibility(self):
-        """Update visibility of media rows based on folder filters."""
-        # Filter the all_media_items list first
-        visible_items = []
-        for item in self.all_media_items:
-            item_parent = str(item.path.parent)
-            if item_parent not in self.hidden_folders:
-                visible_items.append(item)
-        
-        # Update the all_media_items list with filtered items
-        self.all_media_items = visible_items
-        
-        # Recreate visible widgets
+        """Update visibility of media rows based on folder filters.
+
+        Rows of hidden folders are hidden rather than deleted; rows are only
+        created for items whose folder is shown.
+        """
         self._recreate_visible_widgets()
 
     def _connect_upload_manager_signals(self):
         """Connect upload manager signals to UI handlers."""
-        self.upload_manager.upload_started.connect(self._on_upload_started)
-        self.upload_manager.upload_progress.connect(self._on_upload_progress)
-        self.upload_manager.upload_completed.connect(self._on_upload_completed)
-        self.upload_manager.batch_progress.connect(self._on_batch_progress)
-        self.upload_manager.batch_completed.connect(self._on_batch_completed)
+        # Never leave a previous manager's connections behind to double-deliver
+        self._disconnect_upload_manager_signals()
+        self._upload_signal_connections = [
+            (self.upload_manager.upload_started, self._on_upload_started),
+            (self.upload_manager.upload_progress, self._on_upload_progress),
+            (self.upload_manager.upload_completed, self._on_upload_completed),
+            (self.upload_manager.batch_progress, self._on_batch_progress),
+            (self.upload_manager.batch_completed, self._on_batch_completed),
+        ]
+        for signal, slot in self._upload_signal_connections:
+            signal.connect(slot)
+
+    def _disconnect_upload_manager_signals(self):
+        """Disconnect the connections made by _connect_upload_manager_signals."""
+        for signal, slot in self._upload_signal_connections:
+            try:
+                signal.disconnect(slot)
+            except (RuntimeError, TypeError):
+                pass  # Already disconnected or the manager is gone
+        self._upload_signal_connections = []
 
     def _on_auth_state_changed(self, is_authenticated: bool):
         """Handle authentication state changes."""
-        # Update upload manager with new auth manager
-        self.upload_manager = UploadManager(self.auth_widget.auth_manager)
-        self._connect_upload_manager_signals()
+        if self.upload_manager is None:
+            self.upload_manager = UploadManager(self.auth_widget.auth_manager)
+            self._connect_upload_manager_signals()
 
-        # Update all visible media rows with new upload manager
-        for row in self.media_rows:
-            row.set_upload_manager(self.upload_manager)
+            # Update all visible media rows with the new upload manager
+            for row in self.media_rows:
+                row.set_upload_manager(self.upload_manager)
+        else:
+            # Rows and signal connections keep using the same manager
+            self.upload_manager.update_auth(self.auth_widget.auth_manager)
 
         self._update_upload_button_state()
 
@@ -485,13 +698,16 @@ class MainWindow(QMainWindow):
             if self.upload_manager
             else False
         )
-        # Check selection across all items, not just visible widgets
-        has_selected = any(
-            hasattr(item, 'is_selected') and item.is_selected() 
-            for item in self.all_media_items
-        ) or any(row.is_selected() for row in self.media_rows)
+        if is_ready and self.upload_manager.get_active_uploads():
+            return  # Left as "Uploading..." until the batch completes
+        selected_count = self._selected_count
+        has_selected = selected_count > 0
 
         self.batch_upload_btn.setEnabled(is_ready and has_selected)
+        if has_selected:
+            self.batch_upload_btn.setText(f"🚀 Upload Selected ({selected_count})")
+        else:
+            self.batch_upload_btn.setText("🚀 Upload Selected")
 
         if not is_ready:
             self.batch_upload_btn.setToolTip(
@@ -519,22 +735,7 @@ class MainWindow(QMainWindow):
 
     def _update_folder_button_text(self):
         """Update the folder button text with truncated path."""
-        path_str = str(self.current_folder)
-
-        # Truncate path if too long
-        max_length = 60
-        if len(path_str) > max_length:
-            # Try to show the most relevant part (end of path)
-            parts = path_str.split("\\")
-            if len(parts) > 2:
-                # Show last 2 parts with ellipsis
-                truncated = "..." + "\\" + "\\".join(parts[-2:])
-            else:
-                # Just truncate from the beginning
-                truncated = "..." + path_str[-(max_length - 3):]
-            path_str = truncated
-
-        self.folder_btn.setText(f"📁 {path_str}")
+        self.folder_btn.setText(f"📁 {_truncate_path(str(self.current_folder))}")
 
     def _scan_current_folder(self):
         """Start lazy loading of the current folder."""
@@ -547,18 +748,22 @@ class MainWindow(QMainWindow):
     def _start_lazy_loading(self, folder_path: Path):
         """Start lazy loading of media items from a folder."""
         if self.is_loading:
-            # Cancel previous loading operation
-            if self.lazy_loading_thread:
-                self.lazy_loading_thread.cancel()
-                self.lazy_loading_thread.wait()
+            # Cancel previous loading operation; its late signals are ignored
+            if self.lazy_loading_worker:
+                self.lazy_loading_worker.cancel()
         
         try:
             # Clear existing items and widgets
             self.all_media_items.clear()
+            self._stat_cache.clear()
+            self._applied_sort = None
             for row in self.media_rows:
                 row.cleanup()
                 row.deleteLater()
             self.media_rows.clear()
+            self._next_item_index = 0
+            self._selected_count = 0
+            self._selection_timer.start()
             
             # Clear the media layout
             while self.media_layout.count() > 1:  # Keep the stretch item
@@ -568,31 +773,49 @@ class MainWindow(QMainWindow):
             
             # Show scanning indicator
             self.status_label.setText("🔍 Scanning folder...")
-            QApplication.processEvents()
             
-            # Start lazy loading thread
+            # Save durations learned since the last scan so this one can use them
+            self._init_meta_cache()
+            if self.media_meta_cache:
+                self.media_meta_cache.flush()
+
+            # Start the scan on the thread pool
             self.is_loading = True
-            self.lazy_loading_thread = LazyLoadingThread(folder_path, batch_size=20)
-            self.lazy_loading_thread.progress_updated.connect(self._on_loading_progress)
-            self.lazy_loading_thread.items_loaded.connect(self._on_items_loaded)
-            self.lazy_loading_thread.loading_complete.connect(self._on_loading_complete)
-            self.lazy_loading_thread.start()
+            self.lazy_loading_worker = LazyLoadingWorker(
+                folder_path, batch_size=20, meta_cache=self.media_meta_cache
+            )
+            signals = self.lazy_loading_worker.signals
+            signals.progress_updated.connect(self._on_loading_progress)
+            signals.items_loaded.connect(self._on_items_loaded)
+            signals.loading_complete.connect(self._on_loading_complete)
+            QThreadPool.globalInstance().start(self.lazy_loading_worker)
             
         except Exception as e:
             self.status_label.setText(f"❌ Error starting scan: {e}")
             self.is_loading = False
 
+    def _is_stale_scan(self) -> bool:
+        """Check whether the signal being handled comes from a cancelled scan."""
+        sender = self.sender()
+        worker = self.lazy_loading_worker
+        return sender is not None and (worker is None or sender is not worker.signals)
+
     def _on_loading_progress(self, current: int, total: int):
         """Handle loading progress updates."""
+        if self._is_stale_scan():
+            return
         if total > 0:
             progress = min(100, int(current / total * 100))
             self.status_label.setText(f"🔍 Scanning... {progress}% ({current}/{total} files)")
+        elif current > 0:
+            self.status_label.setText(f"🔍 Scanning... {current} files found")
         else:
             self.status_label.setText("🔍 Scanning folder...")
-        QApplication.processEvents()
 
     def _on_items_loaded(self, items: list):
         """Handle new items loaded from the background thread."""
+        if self._is_stale_scan():
+            return
         try:
             # Add items to our collection
             self.all_media_items.extend(items)
@@ -609,6 +832,8 @@ class MainWindow(QMainWindow):
 
     def _on_loading_complete(self):
         """Handle completion of lazy loading."""
+        if self._is_stale_scan():
+            return
         try:
             self.is_loading = False
             
@@ -634,34 +859,59 @@ class MainWindow(QMainWindow):
     def _create_initial_widgets(self):
         """Create widgets for the first visible items."""
         try:
-            # Create widgets for first 10 items (or all if less than 10)
-            initial_count = min(10, len(self.all_media_items))
-            
-            for i in range(initial_count):
-                item = self.all_media_items[i]
-                row = self._create_media_row(item)
-                self.media_rows.append(row)
-                self.media_layout.insertWidget(i, row)  # Insert before stretch
+            # Create widgets for first 10 shown items (or all if less than 10)
+            self._append_media_rows(10)
                 
         except Exception as e:
             print(f"Error creating initial widgets: {e}")
 
+    def _insert_media_rows(self, items: list):
+        """Create rows for items and append them to the list in one layout pass."""
+        rows = [self._create_media_row(item) for item in items]
+        start = len(self.media_rows)
+
+        self.media_container.setUpdatesEnabled(False)
+        try:
+            for offset, row in enumerate(rows):
+                self.media_layout.insertWidget(start + offset, row)  # Before stretch
+            self.media_layout.activate()
+        finally:
+            self.media_container.setUpdatesEnabled(True)
+
+        self.media_rows.extend(rows)
+
     def _create_media_row(self, item: MediaItem):
         """Create a MediaRow widget for a MediaItem."""
         from .media_row import MediaRow
-        return MediaRow(item, self)
+
+        # Rows read upload/conversion status from the history on creation
+        self._init_history()
+        row = MediaRow(item, self)
+        # Computed once here instead of on every filter pass
+        row._parent_str = str(item.path.parent)
+        if row._parent_str in self.hidden_folders:
+            row.hide()  # Stays hidden when added to the layout
+        # Only rows that can be uploaded (i.e. shown) count as selected
+        if row.is_selected() and not row.isHidden():
+            self._selected_count += 1
+            self._selection_timer.start()
+        row.select_box.toggled.connect(self._on_row_selection_toggled)
+        return row
 
     def _apply_sorting_to_items(self):
         """Apply sorting to the all_media_items list."""
         try:
             if self.current_sort_field == "name":
                 self.all_media_items.sort(key=lambda x: x.filename.lower(), reverse=self.current_sort_reverse)
-            elif self.current_sort_field == "size":
-                self.all_media_items.sort(key=lambda x: x.size_mb, reverse=self.current_sort_reverse)
             elif self.current_sort_field == "duration":
                 self.all_media_items.sort(key=lambda x: x.duration_ms or 0, reverse=self.current_sort_reverse)
-            elif self.current_sort_field == "date":
-                self.all_media_items.sort(key=lambda x: x.path.stat().st_mtime, reverse=self.current_sort_reverse)
+            elif self.current_sort_field in ("size", "date", "type", "uploaded", "rendered"):
+                history_paths = self._history_paths(self.current_sort_field)
+                self.all_media_items.sort(
+                    key=lambda x: self._get_sort_key(x, history_paths),
+                    reverse=self.current_sort_reverse,
+                )
+            self._applied_sort = (self.current_sort_field, self.current_sort_reverse)
                 
         except Exception as e:
             print(f"Error applying sorting: {e}")
@@ -681,34 +931,34 @@ class MainWindow(QMainWindow):
 
     def _load_more_widgets(self):
         """Load more widgets when user scrolls near the bottom."""
-        if self.is_loading or len(self.media_rows) >= len(self.all_media_items):
+        if self.is_loading:
             return
-            
+
         # Load next batch of widgets
-        current_count = len(self.media_rows)
-        batch_size = 5
-        end_index = min(current_count + batch_size, len(self.all_media_items))
-        
-        for i in range(current_count, end_index):
-            item = self.all_media_items[i]
-            row = self._create_media_row(item)
-            self.media_rows.append(row)
-            self.media_layout.insertWidget(i, row)  # Insert before stretch
-
-    def _update_batch_button(self):
-        selected_count = sum(1 for row in self.media_rows if row.is_selected())
-        self.batch_upload_btn.setEnabled(
-            self.upload_manager.is_ready() and selected_count > 0
-        )
-        if selected_count > 0:
-            self.batch_upload_btn.setText(f"🚀 Upload Selected ({selected_count})")
-        else:
-            self.batch_upload_btn.setText("🚀 Upload Selected")
+        self._append_media_rows(5)
+
+    def _append_media_rows(self, count: int):
+        """Add rows for the next count items that aren't in a hidden folder."""
+        items = self.all_media_items
+        hidden_folders = self.hidden_folders
+        index = self._next_item_index
+        batch = []
+        while index < len(items) and len(batch) < count:
+            item = items[index]
+            index += 1
+            if str(item.path.parent) not in hidden_folders:
+                batch.append(item)
+        self._next_item_index = index
+        if batch:
+            self._insert_media_rows(batch)
+
+    def _on_row_selection_toggled(self, checked: bool):
+        """Track a row being checked or unchecked."""
+        self._selected_count += 1 if checked else -1
+        self._selection_timer.start()
 
     def _setup_sorting_ui(self, parent_layout: QVBoxLayout):
         """Setup the sorting controls UI with two-column layout."""
-        from core.styles import theme
-
         # Create a container widget with fixed height for the sorting row
         sort_row_container = QWidget()
         sort_row_container.setFixedHeight(36)  # Fixed height for sorting row
@@ -726,16 +976,7 @@ class MainWindow(QMainWindow):
 
         # Sort label
         sort_label = QLabel("Sort by:")
-        sort_label.setStyleSheet(
-            f"""
-            QLabel {{
-                color: {theme.text_secondary};
-                font-size: 10px;
-                font-weight: 500;
-                padding: 2px 0px;
-            }}
-        """
-        )
+        sort_label.setStyleSheet(styles.SORT_LABEL_QSS)
         sort_layout.addWidget(sort_label)
 
         # Sort field dropdown
@@ -744,34 +985,7 @@ class MainWindow(QMainWindow):
             ["Name", "Size", "Duration", "Date", "Type", "Uploaded", "Rendered"]
         )
         self.sort_field_combo.setCurrentText("Name")
-        self.sort_field_combo.setStyleSheet(
-            f"""
-            QComboBox {{
-                padding: 2px 6px;
-                background: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: 4px;
-                font-size: 10px;
-                min-width: 80px;
-                max-width: 120px;
-            }}
-            QComboBox:hover {{
-                border-color: {theme.primary};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 16px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid {theme.text_secondary};
-                margin-right: 4px;
-            }}
-        """
-        )
+        self.sort_field_combo.setStyleSheet(styles.SORT_FIELD_COMBO_QSS)
         self.sort_field_combo.currentTextChanged.connect(self._on_sort_field_changed)
         sort_layout.addWidget(self.sort_field_combo)
 
@@ -780,75 +994,21 @@ class MainWindow(QMainWindow):
         self.sort_direction_btn.setToolTip(
             "Toggle sort direction (Ascending/Descending)"
         )
-        self.sort_direction_btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                padding: 2px 6px;
-                background: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: 4px;
-                font-size: 10px;
-                font-weight: bold;
-                min-width: 20px;
-                max-width: 20px;
-            }}
-            QPushButton:hover {{
-                border-color: {theme.primary};
-                background: {theme.background_secondary};
-            }}
-        """
-        )
+        self.sort_direction_btn.setStyleSheet(styles.SORT_DIRECTION_BTN_QSS)
         self.sort_direction_btn.clicked.connect(self._on_sort_direction_changed)
         sort_layout.addWidget(self.sort_direction_btn)
 
         # Clear sort button
         self.clear_sort_btn = QPushButton("Clear")
         self.clear_sort_btn.setToolTip("Clear sorting and restore original order")
-        self.clear_sort_btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                padding: 2px 6px;
-                background: {theme.background_elevated};
-                color: {theme.text_secondary};
-                border: 1px solid {theme.border};
-                border-radius: 4px;
-                font-size: 10px;
-                min-width: 40px;
-            }}
-            QPushButton:hover {{
-                border-color: {theme.primary};
-                background: {theme.background_secondary};
-            }}
-        """
-        )
+        self.clear_sort_btn.setStyleSheet(styles.CLEAR_SORT_BTN_QSS)
         self.clear_sort_btn.clicked.connect(self._on_clear_sort)
         sort_layout.addWidget(self.clear_sort_btn)
 
         # Reload button
         self.reload_btn = QPushButton("🔄")
         self.reload_btn.setToolTip("Rescan and reload current directory")
-        self.reload_btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                padding: 4px 8px;
-                background: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: 6px;
-                font-size: 12px;
-                min-width: 24px;
-                max-width: 24px;
-            }}
-            QPushButton:hover {{
-                border-color: {theme.primary};
-                background: {theme.background_secondary};
-            }}
-            QPushButton:pressed {{
-                background: {theme.background_tertiary};
-            }}
-        """
-        )
+        self.reload_btn.setStyleSheet(styles.RELOAD_BTN_QSS)
         self.reload_btn.clicked.connect(self._reload_current_folder)
         sort_layout.addWidget(self.reload_btn)
 
@@ -861,6 +1021,9 @@ class MainWindow(QMainWindow):
 
         self.folder_chip_bar = FolderChipBar()
         self.folder_chip_bar.folder_toggled.connect(self._on_folder_toggled)
+        self.folder_chip_bar.folders_bulk_changed.connect(
+            self._on_folders_bulk_changed
+        )
         sort_row_layout.addWidget(self.folder_chip_bar, 1)  # Take remaining space
 
         # Add the two-column row to parent layout
@@ -869,13 +1032,13 @@ class MainWindow(QMainWindow):
     def _on_sort_field_changed(self, field: str):
         """Handle sort field change."""
         self.current_sort_field = field.lower()
-        self._apply_sorting()
+        self._sort_timer.start()
 
     def _on_sort_direction_changed(self):
         """Handle sort direction toggle."""
         self.current_sort_reverse = not self.current_sort_reverse
         self.sort_direction_btn.setText("↓" if self.current_sort_reverse else "↑")
-        self._apply_sorting()
+        self._sort_timer.start()
 
     def _on_clear_sort(self):
         """Clear sorting and restore original order."""
@@ -883,96 +1046,138 @@ class MainWindow(QMainWindow):
         self.current_sort_reverse = False
         self.sort_field_combo.setCurrentText("Name")
         self.sort_direction_btn.setText("↑")
-        self._apply_sorting()
+        self._sort_timer.start()
 
     def _apply_sorting(self):
         """Apply sorting to media rows (for backward compatibility)."""
         # This method now delegates to the new lazy loading system
-        if self.all_media_items:
-            self._apply_sorting_to_items()
-            self._recreate_visible_widgets()
+        if not self.all_media_items:
+            return
+        # Nothing to do if the items are already in this order
+        if self._applied_sort == (self.current_sort_field, self.current_sort_reverse):
+            return
+        self._apply_sorting_to_items()
+        self._recreate_visible_widgets()
 
     def _recreate_visible_widgets(self):
-        """Recreate visible widgets after sorting."""
+        """Rebuild the rows after sorting or filtering.
+
+        Items are walked in order until as many rows are shown as before (at
+        least 10). Existing rows are reused, hidden if their folder is hidden;
+        new rows are only created for items in shown folders. The layout is
+        refilled and visibility toggled with updates disabled, so it is laid
+        out and painted once.
+        """
         try:
-            # Clear existing widgets
-            for row in self.media_rows:
-                row.cleanup()
-                row.deleteLater()
-            self.media_rows.clear()
-            
-            # Clear the media layout
-            while self.media_layout.count() > 1:  # Keep the stretch item
-                child = self.media_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-            
-            # Recreate initial widgets
-            self._create_initial_widgets()
-            
+            hidden_folders = self.hidden_folders
+            target = max(sum(1 for row in self.media_rows if not row.isHidden()), 10)
+            items = self.all_media_items
+            old_rows = {id(row.media_item): row for row in self.media_rows}
+            new_rows = []
+            shown = 0
+            index = 0
+            while index < len(items) and shown < target:
+                item = items[index]
+                index += 1
+                row = old_rows.pop(id(item), None)
+                if row is None:
+                    if str(item.path.parent) in hidden_folders:
+                        continue
+                    row = self._create_media_row(item)
+                new_rows.append(row)
+                if row._parent_str not in hidden_folders:
+                    shown += 1
+            self._next_item_index = index
+
+            toggled = [
+                row
+                for row in new_rows
+                if row.isHidden() != (row._parent_str in hidden_folders)
+            ]
+            reordered = new_rows != self.media_rows
+            # Already showing these rows in this order
+            if not reordered and not toggled:
+                return
+
+            self.media_container.setUpdatesEnabled(False)
+            try:
+                if reordered:
+                    for row in self.media_rows:
+                        self.media_layout.removeWidget(row)
+                    for row in old_rows.values():
+                        if row.is_selected() and not row.isHidden():
+                            self._selected_count -= 1
+                            self._selection_timer.start()
+                        row.cleanup()
+                        row.deleteLater()
+                    for position, row in enumerate(new_rows):
+                        self.media_layout.insertWidget(position, row)  # Before stretch
+                for row in toggled:
+                    visible = row._parent_str not in hidden_folders
+                    row.setVisible(visible)
+                    if row.is_selected():
+                        self._selected_count += 1 if visible else -1
+                        self._selection_timer.start()
+                self.media_layout.activate()
+            finally:
+                self.media_container.setUpdatesEnabled(True)
+
+            self.media_rows = new_rows
+
         except Exception as e:
             print(f"Error recreating widgets: {e}")
 
-    def _get_sort_key(self, row):
-        """Get sort key for a media row."""
+    def _stat(self, path: Path):
+        """Get a file's stat result (None if unreadable), cached until the next scan."""
+        try:
+            return self._stat_cache[path]
+        except KeyError:
+            pass
+        try:
+            result = path.stat()
+        except OSError:
+            result = None
+        self._stat_cache[path] = result
+        return result
+
+    def _history_paths(self, field: str) -> frozenset:
+        """Get the uploaded or rendered file paths from history in one lookup."""
+        try:
+            if field == "uploaded":
+                uploads = self.history_manager.get_recent_uploads(limit=1000)
+                return frozenset(upload.get("original_file") for upload in uploads)
+            if field == "rendered":
+                conversions = self.history_manager.get_recent_conversions(limit=1000)
+                return frozenset(conversion.get("mp3_file") for conversion in conversions)
+        except Exception:
+            pass
+        return frozenset()
+
+    def _get_sort_key(self, row, history_paths: frozenset = frozenset()):
+        """Get sort key for a media row.
+
+        history_paths is the set from _history_paths() for the "uploaded" and
+        "rendered" fields, built once per sort rather than once per row.
+        """
         field = self.current_sort_field
 
         if field == "name":
             return row.path.name.lower()
 
         elif field == "size":
-            try:
-                return row.path.stat().st_size
-            except Exception:
-                return 0
-
-        elif field == "duration":
-            try:
-                # Try to get duration from media info widget
-                duration_text = row.media_info.duration_label.text()
-                if duration_text and duration_text != "Unknown":
-                    # Parse MM:SS format
-                    if ":" in duration_text:
-                        parts = duration_text.split(":")
-                        return int(parts[0]) * 60 + int(parts[1])
-                return 0
-            except Exception:
-                return 0
+            stat = self._stat(row.path)
+            return stat.st_size if stat else 0
 
         elif field == "date":
-            try:
-                return row.path.stat().st_mtime
-            except Exception:
-                return 0
+            stat = self._stat(row.path)
+            return stat.st_mtime if stat else 0
 
         elif field == "type":
             return row.path.suffix.lower()
 
-        elif field == "uploaded":
-            # Check if this file has been uploaded to YouTube
-            try:
-                uploads = self.history_manager.get_recent_uploads(
-                    limit=1000
-                )  # Get all uploads
-                for upload in uploads:
-                    if upload.get("original_file") == str(row.path):
-                        return 1  # Has been uploaded
-                return 0  # Not uploaded
-            except Exception:
-                return 0
-
-        elif field == "rendered":
-            # Check if this file has been converted/rendered
-            try:
-                conversions = self.history_manager.get_recent_conversions(
-                    limit=1000
-                )  # Get all conversions
-                for conversion in conversions:
-                    if conversion.get("mp3_file") == str(row.path):
-                        return 1  # Has been rendered/converted
-                return 0  # Not rendered
-            except Exception:
-                return 0
+        elif field in ("uploaded", "rendered"):
+            # 1 if this file has been uploaded to YouTube / converted
+            return 1 if str(row.path) in history_paths else 0
 
         else:
             return row.path.name.lower()
@@ -980,6 +1185,8 @@ class MainWindow(QMainWindow):
     def refresh_sorting(self):
         """Refresh sorting when media info is updated."""
         if self.current_sort_field != "name":
+            # Sort keys may have changed even though the sort field hasn't
+            self._applied_sort = None
             self._apply_sorting()
 
     def _show_history(self):
@@ -1002,6 +1209,8 @@ class MainWindow(QMainWindow):
         # Add history widget
         from .history_widget import HistoryWidget
 
+        self._init_history()
+
         history_widget = HistoryWidget(self.history_manager, dialog)
         layout.addWidget(history_widget)
 
@@ -1017,7 +1226,9 @@ class MainWindow(QMainWindow):
             )
             return
 
-        selected_rows = [row for row in self.media_rows if row.is_selected()]
+        selected_rows = [
+            row for row in self.media_rows if row.is_selected() and not row.isHidden()
+        ]
         if not selected_rows:
             return
 
@@ -1068,6 +1279,9 @@ class MainWindow(QMainWindow):
         for row in self.media_rows:
             row.on_upload_completed(request_id, success, info)
 
+        # Selection changes aren't shown on the button while uploads run
+        self._selection_timer.start()
+
     def _on_batch_progress(self, total: int, completed: int, failed: int):
         """Handle batch upload progress."""
         self.upload_summary.update_progress(completed, failed)
@@ -1075,8 +1289,7 @@ class MainWindow(QMainWindow):
     def _on_batch_completed(self, total_completed: int, total_failed: int):
         """Handle batch upload completion."""
         # Update UI
-        self.batch_upload_btn.setEnabled(True)
-        self.batch_upload_btn.setText("🚀 Upload Selected")
+        self._update_upload_button_state()
 
         # Complete the summary widget
         self.upload_summary.complete_batch(total_completed, total_failed)
@@ -1099,6 +1312,11 @@ class MainWindow(QMainWindow):
                 self.media_persistence_service.shutdown()
                 print("✅ Persistence service shutdown completed")
 
+            # Write pending media metadata
+            if self.media_meta_cache:
+                self.media_meta_cache.close()
+                self.media_meta_cache = None
+
             # Cleanup settings manager
             if hasattr(self, 'settings_manager') and self.settings_manager:
                 # Settings are auto-saved, just log
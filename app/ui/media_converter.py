@@ -1,8 +1,9 @@
 # app/ui/media_converter.py
 import subprocess
+import tempfile
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from PySide6.QtWidgets import QMessageBox
 
@@ -39,6 +40,38 @@ class MediaConverter:
 
     def __init__(self, progress_callback=None):
         self.progress_callback = progress_callback
+        # Running ffmpeg/ffprobe process, so cancel() can stop it
+        self._process: Optional[subprocess.Popen] = None
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Cancel the current conversion, terminating any running ffmpeg process."""
+        self._cancelled = True
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
+
+    def _run(self, cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """Run a command like subprocess.run, tracking the process for cancel()."""
+        if self._cancelled:
+            raise ConversionError("Conversion cancelled")
+
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        ) as process:
+            self._process = process
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+            finally:
+                self._process = None
+
+        if self._cancelled:
+            raise ConversionError("Conversion cancelled")
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
 
     def convert_mp3_to_mp4_with_overlay(
         self,
@@ -48,6 +81,7 @@ class MediaConverter:
         overlay_config: Dict[str, Any] = None,
     ) -> Path:
         """Convert MP3 + image to MP4 with optional overlay effects."""
+        self._cancelled = False
 
         if overlay_type == "waveform":
             if image_path:
@@ -115,7 +149,7 @@ class MediaConverter:
             # Update progress - starting waveform conversion
             self._update_progress(30, "Generating waveform visualization...")
 
-            result = subprocess.run(waveform_cmd, capture_output=True, text=True, timeout=300)
+            result = self._run(waveform_cmd, timeout=300)
             if result.returncode != 0:
                 raise ConversionError(
                     f"FFmpeg waveform conversion failed: {result.stderr}"
@@ -189,7 +223,7 @@ class MediaConverter:
             # Update progress - starting waveform conversion
             self._update_progress(30, "Generating waveform visualization...")
 
-            result = subprocess.run(waveform_cmd, capture_output=True, text=True, timeout=300)
+            result = self._run(waveform_cmd, timeout=300)
             if result.returncode != 0:
                 raise ConversionError(
                     f"FFmpeg waveform conversion failed: {result.stderr}"
@@ -220,6 +254,11 @@ class MediaConverter:
         except Exception as e:
             raise ConversionError(f"Unexpected waveform-only conversion error: {e}")
 
+    def convert_mp3_to_mp4_black(self, mp3_path: Path) -> Path:
+        """Convert MP3 to MP4 over a black background, with no overlay."""
+        self._cancelled = False
+        return self._convert_audio_only(mp3_path)
+
     def _convert_audio_only(self, mp3_path: Path) -> Path:
         """Convert MP3 to MP4 with black background (no image, no overlay)."""
         try:
@@ -256,7 +295,7 @@ class MediaConverter:
             # Update progress - starting conversion
             self._update_progress(30, "Converting audio to video...")
 
-            result = subprocess.run(audio_cmd, capture_output=True, text=True, timeout=300)
+            result = self._run(audio_cmd, timeout=300)
             if result.returncode != 0:
                 raise ConversionError(
                     f"FFmpeg audio-only conversion failed: {result.stderr}"
@@ -340,7 +379,7 @@ class MediaConverter:
             # Update progress - generating rain effect
             self._update_progress(30, "Generating rain effect...")
 
-            result = subprocess.run(rain_cmd, capture_output=True, text=True, timeout=300)
+            result = self._run(rain_cmd, timeout=300)
             if result.returncode != 0:
                 raise ConversionError(
                     f"FFmpeg rain effect conversion failed: {result.stderr}"
@@ -423,7 +462,7 @@ class MediaConverter:
             # Update progress - generating combined effects
             self._update_progress(30, "Generating waveform and rain effects...")
 
-            result = subprocess.run(combined_cmd, capture_output=True, text=True, timeout=300)
+            result = self._run(combined_cmd, timeout=300)
             if result.returncode != 0:
                 raise ConversionError(
                     f"FFmpeg combined effects conversion failed: {result.stderr}"
@@ -456,6 +495,7 @@ class MediaConverter:
 
     def convert_mp3_to_mp4(self, mp3_path: Path, image_path: Path) -> Path:
         """Convert MP3 + image to MP4 using ffmpeg."""
+        self._cancelled = False
         try:
             print(f"[CONVERT] Starting conversion: {mp3_path} + {image_path}")
             
@@ -492,7 +532,7 @@ class MediaConverter:
             
             print(f"[CONVERT] Running ffprobe command: {' '.join(duration_cmd)}")
 
-            result = subprocess.run(duration_cmd, capture_output=True, text=True, timeout=30)
+            result = self._run(duration_cmd, timeout=30)
             print(f"[CONVERT] ffprobe return code: {result.returncode}")
             print(f"[CONVERT] ffprobe stdout: {result.stdout.strip()}")
             print(f"[CONVERT] ffprobe stderr: {result.stderr.strip()}")
@@ -536,7 +576,7 @@ class MediaConverter:
             
             try:
                 # Add a shorter timeout for testing (2 minutes instead of 5)
-                result = subprocess.run(convert_cmd, capture_output=True, text=True, timeout=120)
+                result = self._run(convert_cmd, timeout=120)
                 print(f"[CONVERT] FFmpeg completed with return code: {result.returncode}")
                 print(f"[CONVERT] FFmpeg stdout length: {len(result.stdout)}")
                 print(f"[CONVERT] FFmpeg stderr length: {len(result.stderr)}")
@@ -601,6 +641,7 @@ class MediaConverter:
 
     def merge_mp3s_to_mp4(self, mp3_paths: list[Path], image_path: Path) -> Path:
         """Merge multiple MP3 files into a single MP4 with the given image."""
+        self._cancelled = False
         try:
             # Verify input files exist
             for mp3_path in mp3_paths:
@@ -620,49 +661,16 @@ class MediaConverter:
                 10, f"Preparing to merge {len(mp3_paths)} MP3 files..."
             )
 
-            # Create a temporary file list for ffmpeg
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".txt", delete=False
-            ) as f:
-                temp_file_list = Path(f.name)
-                for mp3_path in mp3_paths:
-                    f.write(f"file '{mp3_path.absolute()}'\n")
+            # Create a temporary file list for ffmpeg's concat demuxer
+            temp_file_list = self._write_concat_list(mp3_paths)
 
             try:
-                # Update progress - merging audio
-                self._update_progress(20, "Merging audio files...")
-
-                # First, merge all MP3 files into a single audio file
-                merged_audio_path = first_mp3.with_suffix("").with_name(
-                    f"{first_mp3.stem}_merged_audio.mp3"
-                )
-
-                merge_audio_cmd = [
-                    "ffmpeg",
-                    "-y",  # Overwrite output file
-                    "-f",
-                    "concat",
-                    "-safe",
-                    "0",
-                    "-i",
-                    str(temp_file_list),
-                    "-c",
-                    "copy",
-                    str(merged_audio_path),
-                ]
+                # Update progress - merging and converting in one pass
+                self._update_progress(20, "Merging audio files into video...")
 
-                result = subprocess.run(merge_audio_cmd, capture_output=True, text=True, timeout=300)
-                if result.returncode != 0:
-                    raise ConversionError(
-                        f"Failed to merge audio files: {result.stderr}"
-                    )
-
-                # Update progress - converting to video
-                self._update_progress(50, "Converting merged audio to video...")
-
-                # Convert merged audio + image to MP4
+                # Convert image + concatenated audio to MP4. The concat demuxer
+                # feeds the MP3s straight into the encode, so there is no
+                # intermediate merged audio file to write and read back.
                 convert_cmd = [
                     "ffmpeg",
                     "-y",  # Overwrite output file
@@ -670,8 +678,12 @@ class MediaConverter:
                     "1",  # Loop the image
                     "-i",
                     str(image_path),  # Input image
+                    "-f",
+                    "concat",
+                    "-safe",
+                    "0",
                     "-i",
-                    str(merged_audio_path),  # Input merged audio
+                    str(temp_file_list),  # Input MP3s, concatenated
                     "-c:v",
                     "libx264",  # Video codec
                     "-c:a",
@@ -682,17 +694,13 @@ class MediaConverter:
                     str(output_path),  # Output file
                 ]
 
-                result = subprocess.run(convert_cmd, capture_output=True, text=True, timeout=300)
+                result = self._run(convert_cmd, timeout=300)
                 if result.returncode != 0:
                     raise ConversionError(f"FFmpeg conversion failed: {result.stderr}")
 
                 # Update progress - finalizing
                 self._update_progress(90, "Finalizing merged video...")
 
-                # Clean up temporary files
-                if merged_audio_path.exists():
-                    merged_audio_path.unlink()
-
                 # Verify the output file was created
                 if not output_path.exists():
                     raise ConversionError(f"Output file was not created: {output_path}")
@@ -722,6 +730,7 @@ class MediaConverter:
 
     def merge_mp3s_to_mp4_black(self, mp3_paths: list[Path]) -> Path:
         """Merge multiple MP3 files into a single MP4 with black background."""
+        self._cancelled = False
         try:
             # Verify input files exist
             for mp3_path in mp3_paths:
@@ -740,26 +749,18 @@ class MediaConverter:
                 f"Preparing to merge {len(mp3_paths)} MP3 files with black background...",
             )
 
-            # Create a temporary file list for ffmpeg
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".txt", delete=False
-            ) as f:
-                temp_file_list = Path(f.name)
-                for mp3_path in mp3_paths:
-                    f.write(f"file '{mp3_path.absolute()}'\n")
+            # Create a temporary file list for ffmpeg's concat demuxer
+            temp_file_list = self._write_concat_list(mp3_paths)
 
             try:
-                # Update progress - merging audio
-                self._update_progress(20, "Merging audio files...")
-
-                # First, merge all MP3 files into a single audio file
-                merged_audio_path = first_mp3.with_suffix("").with_name(
-                    f"{first_mp3.stem}_merged_audio.mp3"
+                # Update progress - merging and converting in one pass
+                self._update_progress(
+                    20, "Merging audio files into video with black background..."
                 )
 
-                merge_audio_cmd = [
+                # Convert concatenated audio + black background to MP4 in one
+                # pass, without an intermediate merged audio file
+                convert_cmd = [
                     "ffmpeg",
                     "-y",  # Overwrite output file
                     "-f",
@@ -767,29 +768,7 @@ class MediaConverter:
                     "-safe",
                     "0",
                     "-i",
-                    str(temp_file_list),
-                    "-c",
-                    "copy",
-                    str(merged_audio_path),
-                ]
-
-                result = subprocess.run(merge_audio_cmd, capture_output=True, text=True, timeout=300)
-                if result.returncode != 0:
-                    raise ConversionError(
-                        f"Failed to merge audio files: {result.stderr}"
-                    )
-
-                # Update progress - converting to video
-                self._update_progress(
-                    50, "Converting merged audio to video with black background..."
-                )
-
-                # Convert merged audio + black background to MP4
-                convert_cmd = [
-                    "ffmpeg",
-                    "-y",  # Overwrite output file
-                    "-i",
-                    str(merged_audio_path),  # Input merged audio
+                    str(temp_file_list),  # Input MP3s, concatenated
                     "-f",
                     "lavfi",  # Use lavfi for generating video
                     "-i",
@@ -804,17 +783,13 @@ class MediaConverter:
                     str(output_path),  # Output file
                 ]
 
-                result = subprocess.run(convert_cmd, capture_output=True, text=True, timeout=300)
+                result = self._run(convert_cmd, timeout=300)
                 if result.returncode != 0:
                     raise ConversionError(f"FFmpeg conversion failed: {result.stderr}")
 
                 # Update progress - finalizing
                 self._update_progress(90, "Finalizing merged video...")
 
-                # Clean up temporary files
-                if merged_audio_path.exists():
-                    merged_audio_path.unlink()
-
                 # Verify the output file was created
                 if not output_path.exists():
                     raise ConversionError(f"Output file was not created: {output_path}")
@@ -842,6 +817,18 @@ class MediaConverter:
         except Exception as e:
             raise ConversionError(f"Unexpected merge error: {e}")
 
+    @staticmethod
+    def _write_concat_list(mp3_paths: List[Path]) -> Path:
+        """Write an ffmpeg concat demuxer list for the given files."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".txt", delete=False, encoding="utf-8"
+        ) as f:
+            for mp3_path in mp3_paths:
+                # Entries are single-quoted; an embedded quote is written as '\''
+                escaped = str(mp3_path.absolute()).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        return Path(f.name)
+
     def _update_progress(self, percent: int, message: str):
         """Update progress if callback is provided."""
         if self.progress_callback:
@@ -2,6 +2,7 @@
 import subprocess
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from PySide6.QtCore import Qt, QTimer, QUrl
 from PySide6.QtMultimedia import QMediaPlayer
@@ -9,15 +10,23 @@ from PySide6.QtWidgets import QHBoxLayout, QLabel, QWidget
 
 # Import constants from core config
 from core.config import SUPPORTED_EXTENSIONS
+from core.models import MediaItem
 from core.styles import theme
 
 
 class MediaInfoWidget(QWidget):
     """Compact widget displaying media file metadata."""
 
-    def __init__(self, path: Path, parent=None):
+    def __init__(
+        self, path: Path, parent=None, media_item: Optional[MediaItem] = None
+    ):
         super().__init__(parent)
         self.path = path
+        # Item whose duration_ms is kept in step with duration_label for sorting
+        self.media_item = media_item
+        # Duration already known from the media metadata cache
+        self._cached_duration_ms = media_item.duration_ms if media_item else None
+        self._stat = None
         self._setup_ui()
         self._load_media_info()
 
@@ -153,27 +162,32 @@ class MediaInfoWidget(QWidget):
     def _load_media_info(self):
         """Load and display media file information."""
         try:
+            self._stat = self.path.stat()
+
             # File size
-            size_bytes = self.path.stat().st_size
-            self.size_label.setText(self._format_file_size(size_bytes))
+            self.size_label.setText(self._format_file_size(self._stat.st_size))
 
             # File date
-            mtime = self.path.stat().st_mtime
-            self.date_label.setText(self._format_date(mtime))
+            self.date_label.setText(self._format_date(self._stat.st_mtime))
 
             # Media-specific info
             if self.path.suffix.lower() == ".mp4":
                 self._load_video_info()
             elif self.path.suffix.lower() == ".mp3":
-                self._load_audio_info()
+                if self._cached_duration_ms is not None:
+                    # Probed on an earlier run and the file hasn't changed
+                    self._set_duration(self._cached_duration_ms / 1000.0)
+                    self.dimensions_label.setText("Audio")
+                else:
+                    self._load_audio_info()
             else:
-                self.duration_label.setText("Unknown")
+                self._set_duration(None)
                 self.dimensions_label.setText("Unknown")
 
         except Exception:
             # Set fallback values instead of "Error"
             self.size_label.setText("Unknown")
-            self.duration_label.setText("Unknown")
+            self._set_duration(None)
             self.dimensions_label.setText("Unknown")
             self.date_label.setText("Unknown")
 
@@ -202,13 +216,14 @@ class MediaInfoWidget(QWidget):
                     width = int(parts[1]) if parts[1] != "N/A" else 0
                     height = int(parts[2]) if parts[2] != "N/A" else 0
 
-                    self.duration_label.setText(self._format_duration(duration))
+                    self._set_duration(duration)
+                    self._remember_duration(duration)
                     self.dimensions_label.setText(f"{width}×{height}")
                 else:
-                    self.duration_label.setText("Unknown")
+                    self._set_duration(None)
                     self.dimensions_label.setText("Unknown")
             else:
-                self.duration_label.setText("Unknown")
+                self._set_duration(None)
                 self.dimensions_label.setText("Unknown")
 
         except Exception:
@@ -239,9 +254,10 @@ class MediaInfoWidget(QWidget):
                     if result.stdout.strip() != "N/A"
                     else 0
                 )
-                self.duration_label.setText(self._format_duration(duration))
+                self._set_duration(duration)
+                self._remember_duration(duration)
             else:
-                self.duration_label.setText("Unknown")
+                self._set_duration(None)
 
             # Audio files don't have dimensions
             self.dimensions_label.setText("Audio")
@@ -264,6 +280,17 @@ class MediaInfoWidget(QWidget):
 
         return f"{size_bytes:.1f} {size_names[i]}"
 
+    def _set_duration(self, seconds: Optional[float]):
+        """Show a duration (None for unknown) and store it on the media item."""
+        if seconds is None:
+            duration_ms = None
+            self.duration_label.setText("Unknown")
+        else:
+            duration_ms = int(seconds * 1000) if seconds > 0 else 0
+            self.duration_label.setText(self._format_duration(seconds))
+        if self.media_item is not None:
+            self.media_item.duration_ms = duration_ms
+
     def _format_duration(self, seconds: float) -> str:
         """Format duration in MM:SS format."""
         if seconds <= 0:
@@ -291,7 +318,7 @@ class MediaInfoWidget(QWidget):
             )
 
         except Exception:
-            self.duration_label.setText("Unknown")
+            self._set_duration(None)
 
     def _update_duration_from_player(self, player):
         """Update duration from Qt media player."""
@@ -299,16 +326,42 @@ class MediaInfoWidget(QWidget):
             duration_ms = player.duration()
             if duration_ms > 0:
                 duration_sec = duration_ms / 1000.0
-                self.duration_label.setText(self._format_duration(duration_sec))
+                self._set_duration(duration_sec)
             else:
-                self.duration_label.setText("Unknown")
+                self._set_duration(None)
         except Exception:
-            self.duration_label.setText("Unknown")
+            self._set_duration(None)
         finally:
             player.deleteLater()
             # Notify parent to refresh sorting if needed
             self._notify_sorting_refresh()
 
+    def _remember_duration(self, seconds: float):
+        """Queue a probed duration in the window's media metadata cache."""
+        if self._stat is None or seconds <= 0:
+            return
+        try:
+            # Walk up the widget hierarchy to find the main window
+            parent = self.parent()
+            while parent:
+                meta_cache = getattr(parent, "media_meta_cache", None)
+                if meta_cache is not None:
+                    from core.media_meta_cache import MediaMeta
+
+                    meta_cache.put(
+                        MediaMeta(
+                            str(self.path),
+                            self._stat.st_mtime_ns,
+                            self._stat.st_size,
+                            int(seconds * 1000),
+                            self.path.stem,
+                        )
+                    )
+                    break
+                parent = parent.parent()
+        except Exception:
+            pass
+
     def _notify_sorting_refresh(self):
         """Notify parent window to refresh sorting."""
         try:
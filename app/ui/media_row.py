@@ -33,6 +33,7 @@ class MediaRow(QWidget):
         super().__init__(parent)
         self.media_item = media_item
         self.path = media_item.path
+        self._path_str = str(self.path)  # Compared against history entries
 
         # Initialize components
         self.upload_manager = parent.upload_manager if parent else None
@@ -132,7 +133,7 @@ class MediaRow(QWidget):
         parent_layout.addWidget(self.description)
 
         # Media info widget (includes status indicators)
-        self.media_info = MediaInfoWidget(self.path, self)
+        self.media_info = MediaInfoWidget(self.path, self, media_item=self.media_item)
         parent_layout.addWidget(self.media_info)
 
         # Update status indicators
@@ -154,7 +155,7 @@ class MediaRow(QWidget):
             # Check upload status
             uploads = history_manager.get_recent_uploads(limit=1000)
             is_uploaded = any(
-                upload.get("original_file") == str(self.path) for upload in uploads
+                upload.get("original_file") == self._path_str for upload in uploads
             )
 
             if is_uploaded:
@@ -188,7 +189,7 @@ class MediaRow(QWidget):
             if self.is_mp3:
                 conversions = history_manager.get_recent_conversions(limit=1000)
                 is_rendered = any(
-                    conversion.get("mp3_file") == str(self.path)
+                    conversion.get("mp3_file") == self._path_str
                     for conversion in conversions
                 )
 
@@ -813,7 +814,7 @@ class MediaRow(QWidget):
             while parent:
                 if hasattr(parent, "history_manager"):
                     parent.history_manager.add_upload(
-                        original_file=str(self.path),
+                        original_file=self._path_str,
                         title=self.title.text().strip(),
                         video_url=video_url,
                         video_id=video_id,
@@ -4,32 +4,90 @@ Build script for Media Uploader application.
 Creates a standalone executable using PyInstaller.
 """
 
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+# Qt modules the app never imports (it only uses QtCore, QtGui, QtWidgets,
+# QtMultimedia and QtMultimediaWidgets). QtNetwork stays because
+# QtMultimedia links against it.
+EXCLUDED_MODULES = [
+    "PySide6.QtQml",
+    "PySide6.QtQuick",
+    "PySide6.QtQuickWidgets",
+    "PySide6.QtDesigner",
+    "PySide6.QtHelp",
+    "PySide6.QtDBus",
+    "PySide6.QtTest",
+    "PySide6.QtPdf",
+    "PySide6.QtWebEngineCore",
+    "PySide6.QtWebEngineWidgets",
+]
+
+# Qt data folders PyInstaller still collects that the app never loads: it
+# installs no QTranslator and has no QML. PySide6 keeps them under Qt/ on
+# Linux and macOS and directly in the package folder on Windows.
+PRUNED_QT_DATA = [
+    "PySide6/Qt/translations",
+    "PySide6/Qt/qml",
+    "PySide6/translations",
+    "PySide6/qml",
+]
+
+
+DIST_DIR = Path("dist")
+APP_NAME = "MediaUploader"
+SPLASH_BASE = Path("assets/splash_base.png")
+
+
+def prerender_splash():
+    """Render the static splash layers to a PNG bundled with the app."""
+    from PySide6.QtWidgets import QApplication
+
+    from app.splash_screen import SplashScreen
+
+    app = QApplication.instance() or QApplication([])
+    if not SplashScreen.render_base_pixmap().save(str(SPLASH_BASE)):
+        print(f"⚠️ Could not write {SPLASH_BASE}; splash will render at startup")
+        return False
+    print(f"🖼️ Splash pre-rendered: {SPLASH_BASE}")
+    return True
+
 
 def build_exe():
     """Build the Media Uploader executable."""
     print("🔨 Building Media Uploader executable...")
 
-    # PyInstaller command
+    # PyInstaller command. A one-folder build starts without unpacking the
+    # whole bundle to a temp dir on every launch; the libraries are kept in
+    # a "lib" sub-folder next to the executable.
     cmd = [
         "pyinstaller",
-        "--onefile",
+        "--onedir",
+        "--contents-directory=lib",
         "--windowed",
-        "--name=MediaUploader",
+        "--noupx",
+        # Strip docstrings and asserts from the bundled bytecode
+        "--optimize=2",
+        # Keep the bytecode as plain .pyc files in lib/ rather than in a
+        # zlib-compressed archive, so imports skip decompression
+        "--debug=noarchive",
+        f"--name={APP_NAME}",
         "--icon=assets/icon.ico" if Path("assets/icon.ico").exists() else "",
+        f"--add-data={SPLASH_BASE}{os.pathsep}assets" if SPLASH_BASE.exists() else "",
+        *(f"--exclude-module={module}" for module in EXCLUDED_MODULES),
         "app/main.py",
     ]
 
-    # Remove empty icon argument if no icon exists
+    # Remove empty icon/data arguments if the files don't exist
     cmd = [arg for arg in cmd if arg]
 
     try:
         result = subprocess.run(cmd, check=True, capture_output=True, text=True)
         print("✅ Build successful!")
-        print(f"📁 Executable created: dist/MediaUploader.exe")
+        print(f"📁 Executable created: {DIST_DIR / APP_NAME / APP_NAME}.exe")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Build failed: {e}")
@@ -38,11 +96,31 @@ def build_exe():
         return False
 
 
+def prune_dist():
+    """Delete unused Qt data folders from the one-folder build."""
+    lib_dir = DIST_DIR / APP_NAME / "lib"
+    for relative in PRUNED_QT_DATA:
+        folder = lib_dir / relative
+        if folder.is_dir():
+            shutil.rmtree(folder)
+            print(f"🧹 Removed {folder}")
+
+
+def package_zip():
+    """Zip the one-folder build for distribution."""
+    archive = shutil.make_archive(str(DIST_DIR / APP_NAME), "zip", DIST_DIR, APP_NAME)
+    print(f"📦 Distribution archive created: {archive}")
+    return archive
+
+
 def main():
     """Main build function."""
+    prerender_splash()
     if build_exe():
+        prune_dist()
+        package_zip()
         print("\n🎉 Build completed successfully!")
-        print("📁 Location: dist/MediaUploader.exe")
+        print(f"📁 Location: {DIST_DIR / APP_NAME}")
         return 0
     else:
         print("\n💥 Build failed!")
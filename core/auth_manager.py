@@ -4,6 +4,7 @@ Handles OAuth2 authentication with persistent login across app sessions.
 """
 
 import base64
+import functools
 import hashlib
 import json
 import logging
@@ -116,6 +117,8 @@ class GoogleAuthManager:
         self._user_info_cache: Optional[Dict[str, Any]] = None
         self._last_refresh_attempt: Optional[datetime] = None
         self._refresh_cooldown_seconds = 30  # Prevent frequent refresh attempts
+        # One transport (and HTTP session) for all refreshes, so keep-alive holds
+        self._http_request: Optional[Request] = None
 
         # Load existing authentication state
         self._load_auth_state()
@@ -330,6 +333,12 @@ class GoogleAuthManager:
 
         return None
 
+    def _get_http_request(self) -> Request:
+        """Get the shared transport request used for token refreshes."""
+        if self._http_request is None:
+            self._http_request = Request()
+        return self._http_request
+
     def is_authenticated(self) -> bool:
         """Check if user is currently authenticated."""
         if not self._auth_state.is_authenticated:
@@ -358,7 +367,7 @@ class GoogleAuthManager:
                 try:
                     self._last_refresh_attempt = datetime.now()
                     logger.info("Refreshing expired credentials")
-                    self._credentials.refresh(Request())
+                    self._credentials.refresh(self._get_http_request())
                     self._save_credentials(self._credentials)
                     self._update_auth_state()
                     return True
@@ -411,7 +420,7 @@ class GoogleAuthManager:
                     and self._credentials.refresh_token
                 ):
                     logger.info("Refreshing expired credentials")
-                    self._credentials.refresh(Request())
+                    self._credentials.refresh(self._get_http_request())
                 else:
                     logger.info("Starting new OAuth flow")
 
@@ -578,3 +587,9 @@ class GoogleAuthManager:
         except Exception as e:
             logger.error(f"Failed to create {service_name} service: {e}")
             raise AuthError(f"Service creation failed: {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def get_auth_manager() -> GoogleAuthManager:
+    """Get the application-wide GoogleAuthManager, creating it on first use."""
+    return GoogleAuthManager()
@@ -0,0 +1,119 @@
+"""
+Media metadata cache for the Media Uploader application.
+
+Keeps metadata that is slow to compute (durations probed with ffprobe) in a
+local SQLite database so rescanning an unchanged folder doesn't probe every
+file again. Entries are keyed by path and only trusted while the file's
+modification time and size still match.
+"""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from .config import get_data_dir
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Paths per SELECT, well below SQLite's bound-parameter limit
+_LOOKUP_CHUNK_SIZE = 500
+
+
+class MediaMeta(NamedTuple):
+    """Cached metadata for one media file."""
+
+    path: str
+    mtime: int  # st_mtime_ns
+    size: int
+    duration: Optional[int]  # milliseconds
+    title: str
+
+
+class MediaMetaCache:
+    """SQLite-backed media metadata keyed by (path, mtime, size).
+
+    Lookups may come from the scan worker thread; writes are queued with
+    put() and written in one transaction by flush().
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or get_data_dir() / "media_meta.db"
+        self._lock = threading.Lock()
+        self._pending: Dict[str, MediaMeta] = {}
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS media_meta ("
+            "path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, "
+            "duration INTEGER, title TEXT)"
+        )
+        self._conn.commit()
+
+    def lookup(self, files: Iterable[Tuple[str, int, int]]) -> Dict[str, MediaMeta]:
+        """Get current metadata for (path, mtime, size) triples, keyed by path.
+
+        Files with no entry, or whose mtime or size changed, are left out.
+        """
+        wanted = {path: (mtime, size) for path, mtime, size in files}
+        paths = list(wanted)
+        found: Dict[str, MediaMeta] = {}
+
+        with self._lock:
+            try:
+                for start in range(0, len(paths), _LOOKUP_CHUNK_SIZE):
+                    chunk = paths[start : start + _LOOKUP_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        "SELECT path, mtime, size, duration, title FROM media_meta "
+                        f"WHERE path IN ({placeholders})",
+                        chunk,
+                    )
+                    for row in rows:
+                        meta = MediaMeta(*row)
+                        found[meta.path] = meta
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to read media metadata cache: {e}")
+
+            # Entries not yet flushed are newer than the database
+            for path in paths:
+                if path in self._pending:
+                    found[path] = self._pending[path]
+
+        return {
+            path: meta
+            for path, meta in found.items()
+            if wanted[path] == (meta.mtime, meta.size)
+        }
+
+    def put(self, meta: MediaMeta) -> None:
+        """Queue metadata to be written by the next flush()."""
+        with self._lock:
+            self._pending[meta.path] = meta
+
+    def flush(self) -> int:
+        """Write queued metadata in one transaction. Returns the number written."""
+        with self._lock:
+            if not self._pending:
+                return 0
+            rows = list(self._pending.values())
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO media_meta "
+                        "(path, mtime, size, duration, title) VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to write media metadata cache: {e}")
+                return 0
+            self._pending.clear()
+            return len(rows)
+
+    def close(self) -> None:
+        """Write queued metadata and close the database."""
+        self.flush()
+        with self._lock:
+            self._conn.close()
@@ -477,6 +477,128 @@ class StyleBuilder:
         """
 
 
+# Main window stylesheets, formatted once at import
+FOLDER_BTN_QSS = f"""
+    QPushButton {{
+        padding: 4px 12px;
+        background: {theme.background_elevated};
+        color: {theme.text_primary};
+        border: 1px solid {theme.border};
+        border-radius: 6px;
+        font-size: 10px;
+        font-weight: 500;
+        min-height: 16px;
+        min-width: 50px;
+        text-align: left;
+    }}
+    QPushButton:hover {{
+        background: {theme.background_secondary};
+        border-color: {theme.primary};
+    }}
+    QPushButton:pressed {{
+        background: {theme.background_tertiary};
+    }}
+"""
+
+STATUS_LABEL_QSS = f"""
+    QLabel {{
+        color: {theme.text_secondary};
+        font-size: 11px;
+        margin: 0px;
+    }}
+"""
+
+SORT_LABEL_QSS = f"""
+    QLabel {{
+        color: {theme.text_secondary};
+        font-size: 10px;
+        font-weight: 500;
+        padding: 2px 0px;
+    }}
+"""
+
+SORT_FIELD_COMBO_QSS = f"""
+    QComboBox {{
+        padding: 2px 6px;
+        background: {theme.background_elevated};
+        color: {theme.text_primary};
+        border: 1px solid {theme.border};
+        border-radius: 4px;
+        font-size: 10px;
+        min-width: 80px;
+        max-width: 120px;
+    }}
+    QComboBox:hover {{
+        border-color: {theme.primary};
+    }}
+    QComboBox::drop-down {{
+        border: none;
+        width: 16px;
+    }}
+    QComboBox::down-arrow {{
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 4px solid {theme.text_secondary};
+        margin-right: 4px;
+    }}
+"""
+
+SORT_DIRECTION_BTN_QSS = f"""
+    QPushButton {{
+        padding: 2px 6px;
+        background: {theme.background_elevated};
+        color: {theme.text_primary};
+        border: 1px solid {theme.border};
+        border-radius: 4px;
+        font-size: 10px;
+        font-weight: bold;
+        min-width: 20px;
+        max-width: 20px;
+    }}
+    QPushButton:hover {{
+        border-color: {theme.primary};
+        background: {theme.background_secondary};
+    }}
+"""
+
+CLEAR_SORT_BTN_QSS = f"""
+    QPushButton {{
+        padding: 2px 6px;
+        background: {theme.background_elevated};
+        color: {theme.text_secondary};
+        border: 1px solid {theme.border};
+        border-radius: 4px;
+        font-size: 10px;
+        min-width: 40px;
+    }}
+    QPushButton:hover {{
+        border-color: {theme.primary};
+        background: {theme.background_secondary};
+    }}
+"""
+
+RELOAD_BTN_QSS = f"""
+    QPushButton {{
+        padding: 4px 8px;
+        background: {theme.background_elevated};
+        color: {theme.text_primary};
+        border: 1px solid {theme.border};
+        border-radius: 6px;
+        font-size: 12px;
+        min-width: 24px;
+        max-width: 24px;
+    }}
+    QPushButton:hover {{
+        border-color: {theme.primary};
+        background: {theme.background_secondary};
+    }}
+    QPushButton:pressed {{
+        background: {theme.background_tertiary};
+    }}
+"""
+
+
 class LayoutHelper:
     """Helper class for consistent layout spacing."""
 
@@ -86,6 +86,10 @@ class UploadManager(QObject):
         """Get current authentication status."""
         return self.auth_manager.get_auth_info()
 
+    def update_auth(self, auth_manager: GoogleAuthManager):
+        """Switch to a new auth manager, keeping this manager and its uploads."""
+        self.auth_manager = auth_manager
+
     def validate_upload_request(
         self, path: Path, title: str, description: str
     ) -> tuple[bool, str]:
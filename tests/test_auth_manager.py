@@ -10,7 +10,13 @@ from pathlib import Path
 import pytest
 from unittest.mock import MagicMock, Mock, patch
 
-from core.auth_manager import AuthError, AuthState, ClientSecretError, GoogleAuthManager
+from core.auth_manager import (
+    AuthError,
+    AuthState,
+    ClientSecretError,
+    GoogleAuthManager,
+    get_auth_manager,
+)
 
 
 class TestAuthState:
@@ -187,6 +193,23 @@ class TestGoogleAuthManager:
         assert auth_manager.is_authenticated() is True
         mock_credentials.refresh.assert_called_once_with(mock_request.return_value)
 
+    @patch("core.auth_manager.Request")
+    def test_refresh_reuses_transport(
+        self, mock_request, auth_manager, mock_credentials
+    ):
+        """Test repeated refreshes share one transport request."""
+        auth_manager._auth_state = AuthState(is_authenticated=True)
+        mock_credentials.expired = True
+        mock_credentials.refresh_token = "refresh_token"
+        auth_manager._credentials = mock_credentials
+
+        auth_manager.is_authenticated()
+        auth_manager._last_refresh_attempt = None
+        auth_manager.is_authenticated()
+
+        assert mock_credentials.refresh.call_count == 2
+        mock_request.assert_called_once_with()
+
     @patch("core.auth_manager.Request")
     def test_is_authenticated_refresh_fails(
         self, mock_request, auth_manager, mock_credentials
@@ -348,3 +371,20 @@ class TestGoogleAuthManager:
             assert info["is_authenticated"] is True
             assert info["user_email"] == "test@example.com"
             assert "scopes" in info
+
+
+class TestGetAuthManager:
+    """Test the shared auth manager accessor."""
+
+    def test_returns_shared_instance(self):
+        """Test get_auth_manager creates one manager and reuses it."""
+        get_auth_manager.cache_clear()
+        try:
+            with patch("core.auth_manager.GoogleAuthManager") as mock_manager:
+                first = get_auth_manager()
+                second = get_auth_manager()
+
+            assert first is second
+            mock_manager.assert_called_once_with()
+        finally:
+            get_auth_manager.cache_clear()
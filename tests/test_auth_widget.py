@@ -0,0 +1,198 @@
+"""
+Tests for the authentication widget.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.ui.auth_widget import AuthWidget, AuthWorker
+
+
+@pytest.fixture
+def auth_manager(tmp_path):
+    """Create a mock auth manager with a token path in a temp directory."""
+    manager = Mock()
+    manager.credentials_path = tmp_path / "token.pickle"
+    manager.is_authenticated.return_value = False
+    manager.is_setup_ready.return_value = (True, "Ready")
+    manager.get_credentials.return_value = None
+    return manager
+
+
+@pytest.fixture
+def widget(qtbot, auth_manager):
+    """Create an AuthWidget backed by the mock auth manager."""
+    with patch("app.ui.auth_widget.get_auth_manager", return_value=auth_manager):
+        with patch.object(AuthWidget, "_load_credentials_config", return_value=None):
+            w = AuthWidget()
+    qtbot.addWidget(w)
+    return w
+
+
+class TestAuthWorker:
+    """Test the thread pool auth worker."""
+
+    def test_login_success_signals(self, qtbot, auth_manager):
+        """A successful login reports the user email, then finishes."""
+        auth_manager.login.return_value = True
+        auth_manager.get_user_email.return_value = "user@example.com"
+        worker = AuthWorker(auth_manager, "login")
+
+        with qtbot.waitSignal(worker.signals.login_success) as success:
+            with qtbot.waitSignal(worker.signals.finished):
+                worker.run()
+
+        assert success.args == ["user@example.com"]
+
+    def test_verification_error_signal(self, qtbot, auth_manager):
+        """Verification errors are reported with the special marker."""
+        auth_manager.login.side_effect = Exception("verification not completed")
+        worker = AuthWorker(auth_manager, "login")
+
+        with qtbot.waitSignal(worker.signals.login_failed) as failed:
+            worker.run()
+
+        assert failed.args == ["VERIFICATION_REQUIRED"]
+
+    def test_logout_runs_on_pool(self, qtbot, widget, auth_manager):
+        """Logout runs on the pool and clears the busy flag when done."""
+        with qtbot.waitSignal(widget.auth_state_changed, timeout=5000):
+            widget._logout()
+            assert widget._auth_busy
+            # A second request while busy is ignored
+            widget._logout()
+
+        qtbot.waitUntil(lambda: not widget._auth_busy)
+        auth_manager.logout.assert_called_once()
+        assert widget.auth_button.isEnabled()
+
+
+class TestAuthCache:
+    """Test caching of auth/setup checks."""
+
+    def test_repeated_checks_hit_cache(self, widget, auth_manager):
+        """Checks within the TTL reuse the previous result."""
+        auth_manager.is_authenticated.reset_mock()
+        auth_manager.is_setup_ready.reset_mock()
+
+        for _ in range(3):
+            widget.is_authenticated()
+            widget.is_setup_ready()
+
+        auth_manager.is_authenticated.assert_not_called()
+        auth_manager.is_setup_ready.assert_not_called()
+
+    def test_cache_expires_after_ttl(self, widget, auth_manager):
+        """Checks after the TTL ask the auth manager again."""
+        auth_manager.is_authenticated.reset_mock()
+
+        with patch("app.ui.auth_widget.time.monotonic", return_value=1e9):
+            widget.is_authenticated()
+
+        auth_manager.is_authenticated.assert_called_once()
+
+    def test_token_change_busts_cache(self, widget, auth_manager):
+        """A new token file invalidates the cached auth result."""
+        auth_manager.is_authenticated.reset_mock()
+        auth_manager.credentials_path.write_bytes(b"token")
+
+        widget.is_authenticated()
+
+        auth_manager.is_authenticated.assert_called_once()
+
+    def test_login_success_invalidates_cache(self, widget, auth_manager):
+        """Login success refreshes the display from a fresh check."""
+        auth_manager.is_authenticated.return_value = True
+
+        widget._on_login_success("user@example.com")
+
+        assert widget.auth_button.text() == "Logout"
+
+
+class TestAuthDisplay:
+    """Test updates of the auth button."""
+
+    def test_unchanged_state_skips_restyle(self, widget):
+        """Refreshing with the same state leaves the button alone."""
+        with patch.object(widget.auth_button, "setStyleSheet") as set_style:
+            widget._update_auth_display()
+
+        set_style.assert_not_called()
+
+    def test_display_restored_after_failed_login(self, widget, auth_manager):
+        """A failed login puts the login button back despite the same state."""
+        with patch("app.ui.auth_widget.QThreadPool"):
+            widget._login()
+        assert widget.auth_button.text() == "Logging in..."
+
+        with patch("app.ui.auth_widget.QMessageBox.warning"):
+            widget._on_login_failed("boom")
+
+        assert widget.auth_button.text() == "Login with Google"
+
+
+class TestAuthCheckTimer:
+    """Test the expiry-driven auth check."""
+
+    def test_no_polling_when_logged_out(self, widget):
+        """Nothing is scheduled while logged out."""
+        assert not widget._auth_check_timer.isActive()
+
+    def test_login_schedules_check_before_expiry(self, widget, auth_manager):
+        """Login arms a single-shot check ahead of token expiry."""
+        auth_manager.is_authenticated.return_value = True
+        auth_manager.get_credentials.return_value = Mock(
+            expiry=datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+        )
+
+        widget._on_login_success("user@example.com")
+
+        timer = widget._auth_check_timer
+        assert timer.isActive()
+        assert timer.isSingleShot()
+        assert 3000000 < timer.interval() <= 3300000
+
+    def test_logout_stops_check(self, widget, auth_manager):
+        """Logout cancels the scheduled check."""
+        widget._auth_check_timer.start(60000)
+
+        widget._on_logout_success()
+
+        assert not widget._auth_check_timer.isActive()
+
+
+class TestCredentialsConfig:
+    """Test loading of the custom credentials config."""
+
+    def test_config_parsed_once_per_mtime(self, widget, tmp_path, monkeypatch):
+        """Unchanged config files are not re-parsed."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "private").mkdir()
+        (tmp_path / "private" / "custom_credentials.json").write_text(
+            '{"type": "file"}'
+        )
+
+        with patch("app.ui.auth_widget.json.load", return_value={"type": "file"}) as load:
+            first = widget._load_credentials_config()
+            second = widget._load_credentials_config()
+
+        assert first == second == {"type": "file"}
+        load.assert_called_once()
+
+    def test_missing_config_returns_none(self, widget, tmp_path, monkeypatch):
+        """A missing config file yields None."""
+        monkeypatch.chdir(tmp_path)
+        assert widget._load_credentials_config() is None
+
+    def test_manual_config_applies_default_uris(self, widget, auth_manager):
+        """Manual credentials without URIs fall back to Google's endpoints."""
+        widget._apply_manual_creds({"client_id": "id", "client_secret": "secret"})
+
+        auth_manager.set_custom_credentials.assert_called_once_with(
+            client_id="id",
+            client_secret="secret",
+            auth_uri="https://accounts.google.com/o/oauth2/auth",
+            token_uri="https://oauth2.googleapis.com/token",
+        )
@@ -0,0 +1,141 @@
+"""
+Tests for the conversion worker and media converter process handling.
+"""
+
+import sys
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.ui.conversion_worker import ConversionWorker
+from app.ui.media_converter import ConversionError, MediaConverter
+
+
+@pytest.fixture
+def worker(qtbot):
+    """Create a conversion worker with progress emits recorded."""
+    w = ConversionWorker()
+    w._emit_progress = Mock()
+    w._is_running = True
+    return w
+
+
+class TestProgressThrottle:
+    """Test coalescing of progress updates."""
+
+    def test_repeated_percent_is_coalesced(self, worker):
+        """Repeats of the same percent within the interval are dropped."""
+        worker._update_progress(10, "a")
+        worker._update_progress(10, "b")
+        worker._update_progress(11, "c")
+
+        assert [c.args for c in worker._emit_progress.call_args_list] == [
+            (10, "a"),
+            (11, "c"),
+        ]
+
+    def test_completion_always_emitted(self, worker):
+        """The 100% update is never dropped."""
+        worker._update_progress(100, "done")
+        worker._update_progress(100, "done")
+
+        assert worker._emit_progress.call_count == 2
+
+    def test_no_emit_when_not_running(self, worker):
+        """Nothing is emitted outside a conversion."""
+        worker._is_running = False
+        worker._update_progress(50, "x")
+
+        worker._emit_progress.assert_not_called()
+
+
+class TestCancel:
+    """Test cancellation of running conversions."""
+
+    def test_worker_cancel_propagates(self, worker):
+        """Cancelling the worker cancels the converter."""
+        with patch.object(worker.media_converter, "cancel") as cancel:
+            worker.cancel()
+
+        cancel.assert_called_once()
+        assert worker._is_running is False
+
+    def test_cancel_terminates_running_process(self):
+        """cancel() stops the tracked process and the run fails."""
+        converter = MediaConverter()
+        timer = threading.Timer(0.2, converter.cancel)
+        timer.start()
+
+        with pytest.raises(ConversionError, match="cancelled"):
+            converter._run(
+                [sys.executable, "-c", "import time; time.sleep(30)"], timeout=60
+            )
+        timer.join()
+        assert converter._process is None
+
+    def test_run_returns_completed_process(self):
+        """_run behaves like subprocess.run with captured text output."""
+        result = MediaConverter()._run(
+            [sys.executable, "-c", "print('ok')"], timeout=30
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == "ok"
+
+
+class TestDispatch:
+    """Test converter method selection in convert_single_mp3."""
+
+    @pytest.mark.parametrize(
+        "image, overlay, method",
+        [
+            (None, "none", "convert_mp3_to_mp4_black"),
+            ("cover.png", "none", "convert_mp3_to_mp4"),
+            ("cover.png", "waveform", "convert_mp3_to_mp4_with_overlay"),
+            (None, "waveform", "convert_mp3_to_mp4_with_overlay"),
+        ],
+    )
+    def test_method_selection(self, worker, tmp_path, image, overlay, method):
+        """Each image/overlay combination uses the matching converter."""
+        image_path = tmp_path / image if image else None
+        with patch.object(worker.media_converter, method) as convert:
+            convert.return_value = tmp_path / "out.mp4"
+            worker.convert_single_mp3(tmp_path / "a.mp3", image_path, overlay)
+
+        convert.assert_called_once()
+
+
+class TestMerge:
+    """Test single-pass MP3 merging."""
+
+    def test_concat_list_escapes_quotes(self, tmp_path):
+        """Paths with quotes are escaped for the concat demuxer."""
+        mp3 = tmp_path / "it's.mp3"
+        list_path = MediaConverter._write_concat_list([mp3])
+        try:
+            content = list_path.read_text(encoding="utf-8")
+        finally:
+            list_path.unlink()
+
+        assert content == "file '{}'\n".format(str(mp3).replace("'", "'\\''"))
+
+    def test_merge_runs_single_ffmpeg_pass(self, tmp_path):
+        """Merging feeds the concat list straight into one encode."""
+        mp3s = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+        for mp3 in mp3s:
+            mp3.write_bytes(b"")
+        output = tmp_path / "a_merged.mp4"
+
+        def fake_run(cmd, timeout):
+            output.write_bytes(b"video")
+            return Mock(returncode=0, stderr="")
+
+        converter = MediaConverter()
+        with patch.object(converter, "_run", side_effect=fake_run) as run:
+            assert converter.merge_mp3s_to_mp4_black(mp3s) == output
+
+        run.assert_called_once()
+        cmd = run.call_args.args[0]
+        assert cmd[cmd.index("concat") - 1] == "-f"
+        assert not (tmp_path / "a_merged_audio.mp3").exists()
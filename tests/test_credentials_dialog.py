@@ -10,7 +10,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 from unittest.mock import Mock, patch
 
-from app.ui.credentials_dialog import CredentialsDialog
+from app.ui.credentials_dialog import CredentialsDialog, _json_loads
 
 
 @pytest.fixture
@@ -43,6 +43,7 @@ class TestCredentialsDialog:
     def test_manual_credentials_invalid_client_id(self, app):
         """Test manual credentials with invalid client ID."""
         dialog = CredentialsDialog()
+        dialog.manual_radio.setChecked(True)
 
         # Set invalid client ID
         dialog.client_id_edit.setText("invalid-id")
@@ -55,6 +56,7 @@ class TestCredentialsDialog:
     def test_manual_credentials_valid(self, app, tmp_path):
         """Test manual credentials with valid data."""
         dialog = CredentialsDialog()
+        dialog.manual_radio.setChecked(True)
 
         # Set valid credentials
         dialog.client_id_edit.setText("123456789.apps.googleusercontent.com")
@@ -83,25 +85,29 @@ class TestCredentialsDialog:
     def test_file_credentials_nonexistent_file(self, app):
         """Test file credentials with nonexistent file."""
         dialog = CredentialsDialog()
+        dialog.file_radio.setChecked(True)
         dialog.file_path_edit.setText("/nonexistent/file.json")
 
         with pytest.raises(ValueError, match="Selected file does not exist"):
             dialog._save_file_credentials()
 
-    def test_file_credentials_valid(self, app, tmp_path):
+    def test_file_credentials_valid(self, app, tmp_path, monkeypatch):
         """Test file credentials with valid file."""
         dialog = CredentialsDialog()
+        dialog.file_radio.setChecked(True)
+        monkeypatch.chdir(tmp_path)
 
         # Create a test client secret file
-        test_file = tmp_path / "client_secret.json"
-        test_file.write_text('{"installed": {"client_id": "test"}}')
+        test_file = tmp_path / "source.json"
+        test_content = b'{"installed": {"client_id": "test"}}'
+        test_file.write_bytes(test_content)
         dialog.file_path_edit.setText(str(test_file))
 
-        with patch("shutil.copy2") as mock_copy:
-            dialog._save_file_credentials()
+        dialog._save_file_credentials()
 
-            # Verify the file was copied
-            mock_copy.assert_called_once()
+        # Verify the file was copied
+        copied = tmp_path / "private" / "client_secret.json"
+        assert copied.read_bytes() == test_content
 
     def test_save_config_to_file(self, app, tmp_path):
         """Test saving configuration to file."""
@@ -121,20 +127,23 @@ class TestCredentialsDialog:
         except Exception as e:
             assert False, f"Method raised unexpected exception: {e}"
 
-    def test_get_credentials_config_nonexistent(self, app):
+    def test_get_credentials_config_nonexistent(self, app, tmp_path, monkeypatch):
         """Test getting credentials config when file doesn't exist."""
         dialog = CredentialsDialog()
+        monkeypatch.chdir(tmp_path)
 
-        with patch("pathlib.Path.exists", return_value=False):
-            config = dialog.get_credentials_config()
-            assert config is None
+        config = dialog.get_credentials_config()
+        assert config is None
 
-    def test_get_credentials_config_valid(self, app, tmp_path):
+    def test_get_credentials_config_valid(self, app, tmp_path, monkeypatch):
         """Test getting credentials config from valid file."""
         dialog = CredentialsDialog()
+        monkeypatch.chdir(tmp_path)
+        CredentialsDialog._invalidate_config_cache()
 
         # Create a test config file
-        config_file = tmp_path / "custom_credentials.json"
+        config_file = tmp_path / "private" / "custom_credentials.json"
+        config_file.parent.mkdir()
         config_data = {
             "client_id": "test.apps.googleusercontent.com",
             "client_secret": "test_secret",
@@ -143,35 +152,87 @@ class TestCredentialsDialog:
         }
         config_file.write_text(json.dumps(config_data))
 
-        with patch("pathlib.Path") as mock_path:
-            mock_path.return_value = config_file
+        config = dialog.get_credentials_config()
+        assert config == config_data
 
-            config = dialog.get_credentials_config()
-            assert config == config_data
+    def test_get_credentials_config_cached(self, app, tmp_path, monkeypatch):
+        """Test an unchanged config file is parsed only once."""
+        dialog = CredentialsDialog()
+        monkeypatch.chdir(tmp_path)
+        CredentialsDialog._invalidate_config_cache()
+
+        config_file = tmp_path / "private" / "custom_credentials.json"
+        config_file.parent.mkdir()
+        config_file.write_text('{"client_id": "a"}')
+
+        with patch(
+            "app.ui.credentials_dialog._json_loads", wraps=_json_loads
+        ) as load:
+            assert dialog.get_credentials_config() == {"client_id": "a"}
+            assert dialog.get_credentials_config() == {"client_id": "a"}
+            load.assert_called_once()
+
+            # Changing a returned config leaves the cached one alone
+            dialog.get_credentials_config()["client_id"] = "changed"
+            assert dialog.get_credentials_config() == {"client_id": "a"}
+
+            # Saving through the dialog invalidates the cache
+            dialog._save_config_to_file({"client_id": "b"})
+            assert dialog.get_credentials_config() == {"client_id": "b"}
+
+    def test_method_groups_built_lazily(self, app):
+        """Test the manual and file groups are not built until chosen."""
+        dialog = CredentialsDialog()
+
+        # Test the method directly
+        dialog._on_method_changed()
+
+        # Since no method is checked by default, neither group exists yet
+        assert dialog.manual_group is None
+        assert dialog.file_group is None
 
     def test_method_selection_manual(self, app):
         """Test manual method selection."""
         dialog = CredentialsDialog()
+        dialog.show()
 
-        # Test the method directly
-        dialog._on_method_changed()
+        dialog.manual_radio.setChecked(True)
 
-        # The groups should be visible based on radio button states
-        # Since no radio button is checked by default, both should be hidden
-        assert dialog.manual_group.isVisible() is False
-        assert dialog.file_group.isVisible() is False
+        assert dialog.manual_group.isVisible() is True
+        assert dialog.file_group is None
 
     def test_method_selection_file(self, app):
         """Test file method selection."""
         dialog = CredentialsDialog()
+        dialog.show()
 
-        # Test the method directly
-        dialog._on_method_changed()
+        dialog.file_radio.setChecked(True)
+        assert dialog.file_group.isVisible() is True
+
+        # The options are exclusive, so picking manual hides the file group
+        dialog.manual_radio.setChecked(True)
 
-        # The groups should be visible based on radio button states
-        # Since no radio button is checked by default, both should be hidden
-        assert dialog.manual_group.isVisible() is False
+        layout = dialog.layout()
+        assert dialog.file_radio.isChecked() is False
         assert dialog.file_group.isVisible() is False
+        assert dialog.manual_group.isVisible() is True
+        # Groups keep their order regardless of which was built first
+        assert layout.indexOf(dialog.manual_group) < layout.indexOf(
+            dialog.file_group
+        )
+        assert layout.indexOf(dialog.file_group) < layout.indexOf(
+            dialog.instructions_group
+        )
+
+    def test_method_switch_handled_once(self, app):
+        """Test switching methods runs the change handler once per click."""
+        dialog = CredentialsDialog()
+        dialog.manual_radio.setChecked(True)
+
+        with patch.object(dialog, "_on_method_changed") as changed:
+            dialog.file_radio.setChecked(True)
+
+        changed.assert_called_once()
 
     def test_browse_file(self, app):
         """Test file browsing functionality."""
@@ -198,6 +259,27 @@ class TestCredentialsDialog:
 
         assert dialog.file_preview.toPlainText() == test_content
 
+    def test_preview_file_large_is_truncated(self, app, tmp_path):
+        """Test large files are only partially previewed but still parsed."""
+        dialog = CredentialsDialog()
+
+        test_file = tmp_path / "client_secret.json"
+        test_file.write_text(
+            json.dumps(
+                {
+                    "installed": {"client_id": "big.apps.googleusercontent.com"},
+                    "padding": "x" * 20000,
+                }
+            )
+        )
+
+        dialog._preview_file(str(test_file))
+
+        preview = dialog.file_preview.toPlainText()
+        assert len(preview) < 5000
+        assert preview.endswith("\n… (truncated)")
+        assert dialog.client_id_edit.text() == "big.apps.googleusercontent.com"
+
     def test_preview_file_error(self, app):
         """Test file preview with read error."""
         dialog = CredentialsDialog()
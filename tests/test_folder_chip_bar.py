@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 from PySide6.QtWidgets import QApplication
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from app.ui.folder_chip_bar import FolderChipBar
 
@@ -90,6 +90,21 @@ class TestFolderChipBar:
 
         assert folders == set()
 
+    def test_extract_parent_folders_checks_each_parent_once(self, app, temp_dir):
+        """Test shared parents are stat'ed once and remembered."""
+        chip_bar = FolderChipBar()
+
+        media_paths = [
+            temp_dir / "music" / "song1.mp3",
+            temp_dir / "music" / "song2.mp3",
+        ]
+
+        with patch("app.ui.folder_chip_bar.isdir", return_value=True) as is_dir:
+            chip_bar._extract_parent_folders(media_paths)
+            chip_bar._extract_parent_folders(media_paths)
+
+        assert is_dir.call_count == 1
+
     def test_get_display_name_normal(self, app):
         """Test display name generation for normal folder names."""
         chip_bar = FolderChipBar()
@@ -110,6 +125,17 @@ class TestFolderChipBar:
         assert display_name.endswith("...")
         assert display_name.startswith("very_long_fo")
 
+    def test_get_display_name_cached(self, app):
+        """Test display names are computed once per folder."""
+        chip_bar = FolderChipBar()
+
+        folder_path = "/path/to/music"
+        with patch("app.ui.folder_chip_bar.basename", return_value="music") as name:
+            chip_bar._get_display_name(folder_path)
+            chip_bar._get_display_name(folder_path)
+
+        assert name.call_count == 1
+
     def test_create_folder_chip(self, app):
         """Test folder chip creation."""
         chip_bar = FolderChipBar()
@@ -244,6 +270,21 @@ class TestFolderChipBar:
         assert button.isChecked() is True
         assert chip_bar.folder_states[folder_path] is True
 
+    def test_set_folder_visibility_signal(self, app, temp_dir):
+        """Test programmatic changes only notify when asked to."""
+        chip_bar = FolderChipBar()
+        chip_bar.update_folders([temp_dir / "music" / "song1.mp3"])
+        folder_path = str(temp_dir / "music")
+
+        mock_handler = Mock()
+        chip_bar.folder_toggled.connect(mock_handler)
+
+        chip_bar.set_folder_visibility(folder_path, False)
+        mock_handler.assert_not_called()
+
+        chip_bar.set_folder_visibility(folder_path, True, emit_signal=True)
+        mock_handler.assert_called_once_with(folder_path, True)
+
     def test_show_all_folders(self, app, temp_dir):
         """Test showing all folders."""
         chip_bar = FolderChipBar()
@@ -292,6 +333,50 @@ class TestFolderChipBar:
         assert len(chip_bar.get_visible_folders()) == 0
         assert chip_bar.get_hidden_folders() == expected_folders
 
+    def test_hide_all_folders_signals(self, app, temp_dir):
+        """Test bulk hide emits one aggregate signal instead of per-folder ones."""
+        chip_bar = FolderChipBar()
+
+        media_paths = [
+            temp_dir / "music" / "song1.mp3",
+            temp_dir / "videos" / "video1.mp4",
+        ]
+        chip_bar.update_folders(media_paths)
+        chip_bar.set_folder_visibility(str(temp_dir / "videos"), False)
+
+        toggled_handler = Mock()
+        bulk_handler = Mock()
+        chip_bar.folder_toggled.connect(toggled_handler)
+        chip_bar.folders_bulk_changed.connect(bulk_handler)
+
+        chip_bar.hide_all_folders()
+
+        toggled_handler.assert_not_called()
+        bulk_handler.assert_called_once_with(
+            {str(temp_dir / "music"): False, str(temp_dir / "videos"): False}
+        )
+        assert chip_bar.chip_container.updatesEnabled()
+
+        # Nothing changes on a repeat, so nothing is emitted
+        chip_bar.hide_all_folders()
+        bulk_handler.assert_called_once()
+
+    def test_scroll_area_only_when_chips_overflow(self, app, temp_dir):
+        """Test the scroll area is bypassed while the chips fit."""
+        chip_bar = FolderChipBar()
+        chip_bar.show()
+        chip_bar.resize(2000, 28)
+
+        chip_bar.update_folders([temp_dir / "music" / "song1.mp3"])
+
+        assert chip_bar.scroll_area.isHidden()
+        assert chip_bar.chip_container.parent() is chip_bar
+
+        chip_bar.resize(10, 28)
+
+        assert not chip_bar.scroll_area.isHidden()
+        assert chip_bar.scroll_area.widget() is chip_bar.chip_container
+
     def test_clear(self, app, temp_dir):
         """Test clearing all folder chips."""
         chip_bar = FolderChipBar()
@@ -307,6 +392,29 @@ class TestFolderChipBar:
         assert len(chip_bar.folder_buttons) == 0
         assert len(chip_bar.folder_states) == 0
 
+    def test_removed_chips_are_reused(self, app, temp_dir):
+        """Test a removed chip button is recycled for the next new folder."""
+        chip_bar = FolderChipBar()
+
+        chip_bar.update_folders([temp_dir / "music" / "song1.mp3"])
+        button = chip_bar.folder_buttons[str(temp_dir / "music")]
+        chip_bar.set_folder_visibility(str(temp_dir / "music"), False)
+
+        chip_bar.update_folders([temp_dir / "videos" / "video1.mp4"])
+
+        videos = str(temp_dir / "videos")
+        assert chip_bar.folder_buttons[videos] is button
+        assert button.text() == "videos"
+        assert button.isChecked() is True
+        assert chip_bar._button_pool == []
+
+        # The recycled button reports toggles for its new folder only, once
+        mock_handler = Mock()
+        chip_bar.folder_toggled.connect(mock_handler)
+        button.click()
+
+        mock_handler.assert_called_once_with(videos, False)
+
     def test_chip_styling_visible(self, app, temp_dir):
         """Test chip styling for visible state."""
         chip_bar = FolderChipBar()
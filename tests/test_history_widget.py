@@ -0,0 +1,267 @@
+"""
+Tests for the history viewer.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from PySide6.QtCore import QEvent, QPoint, QPointF, QRect, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QListView, QStyleOptionViewItem
+
+from app.ui import history_widget
+from app.ui.history_widget import HistoryItemDelegate, HistoryListModel, HistoryWidget
+
+UPLOAD = {
+    "item_type": "upload",
+    "title": "Test Video",
+    "video_url": "https://youtube.com/watch?v=123",
+    "date": "2024-01-01T12:00:00Z",
+}
+CONVERSION = {
+    "item_type": "conversion",
+    "mp3_file": "/music/song.mp3",
+    "mp4_file": "/music/song.mp4",
+    "date": "2024-01-02T08:30:00",
+}
+STATS = {"total_uploads": 1, "total_conversions": 1, "last_updated": None}
+
+
+@pytest.fixture
+def history_manager():
+    """Create a mock history manager with one upload and one conversion."""
+    manager = Mock()
+    manager.get_all_history.return_value = [CONVERSION, UPLOAD]
+    manager.get_stats.return_value = dict(STATS)
+    return manager
+
+
+@pytest.fixture
+def widget(qtbot, history_manager):
+    """Create a HistoryWidget backed by the mock history manager."""
+    w = HistoryWidget(history_manager)
+    qtbot.addWidget(w)
+    qtbot.waitUntil(lambda: not w._load_busy)
+    return w
+
+
+def _reload(qtbot, widget):
+    """Refresh the widget and wait for the background load to be shown."""
+    widget._load_history()
+    qtbot.waitUntil(lambda: not widget._load_busy)
+
+
+class TestHistoryListModel:
+    """Test the history list model."""
+
+    def test_rows_are_precomputed(self, qtbot):
+        """Rows expose display strings for uploads and conversions."""
+        model = HistoryListModel()
+        model.set_items([UPLOAD, CONVERSION])
+
+        assert model.rowCount() == 2
+        upload = model.index(0).data(HistoryListModel.RowRole)
+        assert upload.title == "Test Video"
+        assert upload.url == UPLOAD["video_url"]
+        assert upload.date == "01/01/2024 12:00"
+
+        conversion = model.index(1).data(HistoryListModel.RowRole)
+        assert conversion.title == "song.mp3"
+        assert conversion.details == "📹 song.mp4"
+        assert conversion.url == ""
+
+    def test_refresh_without_reset(self, qtbot):
+        """Unchanged or same-sized refreshes don't reset the model."""
+        model = HistoryListModel()
+        model.set_items([UPLOAD, CONVERSION])
+        reset = Mock()
+        changed = Mock()
+        model.modelReset.connect(reset)
+        model.dataChanged.connect(changed)
+
+        model.set_items([UPLOAD, CONVERSION])
+        changed.assert_not_called()
+
+        model.set_items([CONVERSION, UPLOAD])
+        changed.assert_called_once()
+        assert model.index(0).data() == "song.mp3"
+
+        reset.assert_not_called()
+        model.set_items([UPLOAD])
+        reset.assert_called_once()
+
+    def test_raw_item_and_tooltip_roles(self, qtbot):
+        """The raw item and URL tooltip are available through roles."""
+        model = HistoryListModel()
+        model.set_items([UPLOAD])
+
+        index = model.index(0)
+        assert index.data(Qt.UserRole) == UPLOAD
+        assert index.data(Qt.ToolTipRole) == UPLOAD["video_url"]
+
+
+class TestFmtDate:
+    """Test history date formatting."""
+
+    def test_formats_utc_and_naive_timestamps(self):
+        """Trailing-Z and naive ISO timestamps both format."""
+        assert history_widget._fmt_date("2024-01-01T12:00:00Z") == "01/01/2024 12:00"
+        assert history_widget._fmt_date("2024-01-02T08:30:00") == "01/02/2024 08:30"
+
+    def test_unparseable_returns_empty(self):
+        """Bad or missing dates return an empty string for the caller to replace."""
+        assert history_widget._fmt_date("yesterday") == ""
+        assert history_widget._fmt_date("") == ""
+
+    def test_stats_show_last_updated(self, qtbot, widget, history_manager):
+        """The stats line includes a formatted last-updated time."""
+        history_manager.get_stats.return_value = dict(
+            STATS, last_updated="2024-01-01T12:00:00Z"
+        )
+
+        _reload(qtbot, widget)
+
+        assert widget.stats_label.text().endswith("Last updated: 01/01/2024 12:00")
+
+
+class TestHistoryWidget:
+    """Test the history viewer widget."""
+
+    def test_items_shown_in_list(self, widget):
+        """History items populate the list view."""
+        assert widget.history_model.rowCount() == 2
+        assert not widget.history_list.isHidden()
+        assert widget.empty_label.isHidden()
+        assert widget.stats_label.text().startswith("📊 1 uploads")
+
+    def test_rows_laid_out_in_batches(self, widget):
+        """The list lays out rows in small batches."""
+        assert widget.history_list.layoutMode() == QListView.Batched
+        assert widget.history_list.batchSize() == 10
+
+    def test_refreshes_during_load_are_coalesced(self, qtbot, widget):
+        """Refreshes while a load runs queue a single follow-up load."""
+        history_manager = widget.history_manager
+        history_manager.get_all_history.reset_mock()
+
+        with patch("app.ui.history_widget.QThreadPool") as pool:
+            widget._load_history()
+            widget._load_history()
+            widget._load_history()
+            worker = pool.globalInstance().start.call_args.args[0]
+            assert pool.globalInstance().start.call_count == 1
+
+            worker.run()
+            qtbot.waitUntil(lambda: pool.globalInstance().start.call_count == 2)
+
+        assert widget._reload_requested is False
+
+    def test_unchanged_stats_not_reformatted(self, qtbot, widget):
+        """Refreshing with the same stats leaves the stats label alone."""
+        with patch.object(widget.stats_label, "setText") as set_text:
+            _reload(qtbot, widget)
+
+        set_text.assert_not_called()
+
+    def test_empty_history_shows_message(self, qtbot, widget, history_manager):
+        """An empty history replaces the list with a message."""
+        history_manager.get_all_history.return_value = []
+
+        _reload(qtbot, widget)
+
+        assert widget.history_list.isHidden()
+        assert not widget.empty_label.isHidden()
+        assert widget.updatesEnabled()
+
+    def test_children_styled_by_viewer_sheet(self, widget):
+        """The viewer's one sheet styles its children through object names."""
+        assert widget.styleSheet() == history_widget._VIEWER_QSS
+        assert widget.stats_label.objectName() == "historyStats"
+        assert widget.history_list.objectName() == "historyList"
+        assert widget.empty_label.objectName() == "historyEmpty"
+        assert widget.stats_label.styleSheet() == ""
+
+    def test_rows_render(self, widget):
+        """Painting the list through the delegate works."""
+        widget.resize(600, 400)
+        widget.show()
+
+        assert not widget.history_list.grab().isNull()
+
+
+class TestHistoryItemDelegate:
+    """Test the history row delegate."""
+
+    def _release(self, pos):
+        return QMouseEvent(
+            QEvent.MouseButtonRelease,
+            QPointF(pos),
+            QPointF(pos),
+            Qt.LeftButton,
+            Qt.LeftButton,
+            Qt.NoModifier,
+        )
+
+    def test_fixed_row_height(self, qtbot):
+        """Every row has the same height."""
+        delegate = HistoryItemDelegate()
+        option = QStyleOptionViewItem()
+
+        assert delegate.sizeHint(option, None).height() == delegate.ROW_HEIGHT
+
+    def test_rendered_rows_are_cached(self, qtbot, widget):
+        """Repainting an unchanged row reuses its cached pixmap."""
+        widget.resize(600, 400)
+        widget.show()
+        delegate = widget.history_list.itemDelegate()
+        widget.history_list.grab()
+
+        with patch.object(delegate, "_render") as render:
+            widget.history_list.grab()
+
+        render.assert_not_called()
+        assert len(delegate._pixmap_cache) == 2
+
+        # Rows that leave the history drop their pixmaps on the next load
+        widget.history_manager.get_all_history.return_value = [UPLOAD]
+        _reload(qtbot, widget)
+        assert len(delegate._pixmap_cache) == 1
+
+        delegate.clear_cache()
+        assert not delegate._pixmap_cache
+
+    def test_resize_drops_pixmaps_at_old_width(self, qtbot, widget):
+        """Only pixmaps at the current row width are kept."""
+        widget.resize(600, 400)
+        widget.show()
+        delegate = widget.history_list.itemDelegate()
+        widget.history_list.grab()
+        assert len(delegate._pixmap_cache) == 2
+
+        old_width = delegate._cache_geometry[0]
+        widget.resize(700, 400)
+        viewport = widget.history_list.viewport()
+        qtbot.waitUntil(lambda: viewport.width() != old_width)
+        widget.history_list.grab()
+
+        assert len(delegate._pixmap_cache) == 2
+        assert delegate._cache_geometry[0] == viewport.width()
+
+    def test_click_on_url_opens_it(self, qtbot):
+        """Clicking an upload's details line opens the video URL."""
+        model = HistoryListModel()
+        model.set_items([UPLOAD, CONVERSION])
+        delegate = HistoryItemDelegate()
+        option = QStyleOptionViewItem()
+        option.rect = QRect(0, 0, 400, delegate.ROW_HEIGHT)
+        details = delegate._details_rect(option.rect).center()
+
+        with patch("app.ui.history_widget.QDesktopServices.openUrl") as open_url:
+            upload, conversion = model.index(0), model.index(1)
+            assert delegate.editorEvent(self._release(details), model, option, upload)
+            # Conversions have no URL, and clicks elsewhere do nothing
+            delegate.editorEvent(self._release(details), model, option, conversion)
+            delegate.editorEvent(self._release(QPoint(1, 1)), model, option, upload)
+
+        open_url.assert_called_once()
+        assert open_url.call_args.args[0].toString() == UPLOAD["video_url"]
@@ -0,0 +1,374 @@
+"""
+Unit tests for MainWindow sorting, filtering and scanning helpers.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.ui.main_window import (
+    LazyLoadingWorker,
+    MainWindow,
+    _iter_media_entries,
+    _truncate_path,
+)
+from core.media_meta_cache import MediaMeta, MediaMetaCache
+from core.models import MediaItem
+
+
+@pytest.fixture
+def main_window(qtbot):
+    """Create a MainWindow without showing it."""
+    window = MainWindow()
+    qtbot.addWidget(window)
+    return window
+
+
+class TestTruncatePath:
+    """Test folder path shortening for the folder button."""
+
+    def test_short_paths_unchanged(self):
+        """Paths within the limit are shown as-is."""
+        assert _truncate_path("/home/user/media") == "/home/user/media"
+
+    def test_long_paths_keep_last_two_parts(self):
+        """Long paths are shortened to their last two components."""
+        path = os.sep.join(["", "very" * 10, "long" * 10, "Music", "Albums"])
+
+        assert _truncate_path(path) == "..." + os.sep + os.sep.join(["Music", "Albums"])
+
+    def test_long_single_part_truncated_from_start(self):
+        """A long path without separators keeps its last characters."""
+        path = "x" * 100
+
+        assert _truncate_path(path, max_length=20) == "..." + "x" * 17
+
+
+class TestIterMediaEntries:
+    """Test the recursive media file walk."""
+
+    def test_finds_media_in_subfolders(self, tmp_path):
+        """Media files are found at any depth, case-insensitively."""
+        (tmp_path / "album" / "disc1").mkdir(parents=True)
+        (tmp_path / "album" / "disc1" / "track.MP3").touch()
+        (tmp_path / "video.mp4").touch()
+        (tmp_path / "notes.txt").touch()
+        (tmp_path / "mp3").touch()  # No extension
+
+        names = sorted(entry.name for entry in _iter_media_entries(tmp_path))
+
+        assert names == ["track.MP3", "video.mp4"]
+
+    def test_missing_folder_yields_nothing(self, tmp_path):
+        """An unreadable folder is skipped rather than raising."""
+        assert list(_iter_media_entries(tmp_path / "missing")) == []
+
+
+class TestLazyLoadingWorker:
+    """Test the background folder scan."""
+
+    def test_merges_subfolder_walks(self, qtbot, tmp_path):
+        """Files from the top folder and every subfolder are emitted once."""
+        expected = {tmp_path / "top.mp3"}
+        (tmp_path / "top.mp3").touch()
+        for i in range(5):
+            folder = tmp_path / f"artist{i}" / "album"
+            folder.mkdir(parents=True)
+            for j in range(3):
+                (folder / f"track{j}.mp3").touch()
+                expected.add(folder / f"track{j}.mp3")
+
+        worker = LazyLoadingWorker(tmp_path, batch_size=4)
+        loaded = []
+        worker.signals.items_loaded.connect(loaded.extend)
+        worker.run()
+
+        assert sorted(item.path for item in loaded) == sorted(expected)
+
+    def test_cached_metadata_applied(self, qtbot, tmp_path):
+        """Titles and durations come from the cache for unchanged files."""
+        (tmp_path / "sub").mkdir()
+        for name in ("a.mp3", "sub/b.mp3"):
+            (tmp_path / name).write_bytes(b"x")
+        cached = tmp_path / "sub" / "b.mp3"
+        meta_cache = MediaMetaCache(tmp_path / "media_meta.db")
+        stat = cached.stat()
+        meta_cache.put(
+            MediaMeta(str(cached), stat.st_mtime_ns, stat.st_size, 61000, "Cached")
+        )
+
+        worker = LazyLoadingWorker(tmp_path, meta_cache=meta_cache)
+        loaded = []
+        worker.signals.items_loaded.connect(loaded.extend)
+        try:
+            worker.run()
+        finally:
+            meta_cache.close()
+
+        items = {item.path.name: item for item in loaded}
+        assert (items["b.mp3"].title, items["b.mp3"].duration_ms) == ("Cached", 61000)
+        assert (items["a.mp3"].title, items["a.mp3"].duration_ms) == ("a", None)
+
+    def test_cancel_stops_scan(self, qtbot, tmp_path):
+        """A cancelled scan emits nothing further."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "a.mp3").touch()
+
+        worker = LazyLoadingWorker(tmp_path)
+        loaded = []
+        worker.signals.items_loaded.connect(loaded.extend)
+        worker.cancel()
+        worker.run()
+
+        assert loaded == []
+
+
+class TestSortDebounce:
+    """Test that bursts of sort and filter changes are coalesced."""
+
+    def test_sort_changes_coalesced(self, qtbot, main_window):
+        """Several sort changes in a row trigger one sort."""
+        main_window.all_media_items = [MediaItem(path=Path("a.mp3"))]
+
+        with patch.object(main_window, "_apply_sorting_to_items") as sort_items, \
+                patch.object(main_window, "_recreate_visible_widgets"):
+            main_window._on_sort_field_changed("Size")
+            main_window._on_sort_direction_changed()
+            main_window._on_sort_field_changed("Date")
+            sort_items.assert_not_called()
+
+            qtbot.waitUntil(lambda: sort_items.called)
+            qtbot.wait(50)
+
+        sort_items.assert_called_once()
+        assert main_window.current_sort_field == "date"
+        assert main_window.current_sort_reverse is True
+
+    def test_folder_toggles_coalesced(self, qtbot, main_window):
+        """Several folder toggles in a row trigger one visibility update."""
+        with patch.object(main_window, "_recreate_visible_widgets") as rebuild:
+            main_window._on_folder_toggled("/music/a", False)
+            main_window._on_folder_toggled("/music/b", False)
+            main_window._on_folders_bulk_changed({"/music/a": True})
+
+            qtbot.waitUntil(lambda: rebuild.called)
+            qtbot.wait(50)
+
+        rebuild.assert_called_once()
+        assert main_window.hidden_folders == {"/music/b"}
+
+
+class TestSorting:
+    """Test reordering the media rows."""
+
+    def test_unchanged_order_skips_layout(self, main_window):
+        """Sorting that leaves the rows in place doesn't touch the layout."""
+        main_window.all_media_items = [
+            MediaItem(path=Path(name)) for name in ("a.mp3", "b.mp3", "c.mp3")
+        ]
+        main_window._recreate_visible_widgets()
+        rows = list(main_window.media_rows)
+
+        with patch.object(main_window.media_layout, "insertWidget") as insert:
+            main_window.current_sort_field = "type"
+            main_window._apply_sorting()
+        insert.assert_not_called()
+
+        main_window.current_sort_field = "name"
+        main_window.current_sort_reverse = True
+        main_window._apply_sorting()
+        assert main_window.media_rows == rows[::-1]
+        assert main_window.media_layout.itemAt(0).widget() is rows[2]
+
+    def test_sort_by_probed_duration(self, main_window):
+        """Durations shown by the rows sort items that had none cached."""
+        main_window.all_media_items = [
+            MediaItem(path=Path(name)) for name in ("a.mp3", "b.mp3", "c.mp3")
+        ]
+        main_window._recreate_visible_widgets()
+        rows = list(main_window.media_rows)
+        for row, seconds in zip(rows, (90, 30, 60)):
+            row.media_info._set_duration(seconds)
+
+        main_window.current_sort_field = "duration"
+        main_window._apply_sorting()
+
+        assert main_window.media_rows == [rows[1], rows[2], rows[0]]
+
+
+class TestSelectionCount:
+    """Test the batch upload button's selection tracking."""
+
+    def test_count_follows_row_toggles(self, qtbot, main_window):
+        """Checking rows updates the count, and one refresh covers a burst."""
+        main_window.all_media_items = [
+            MediaItem(path=Path(name)) for name in ("a.mp4", "b.mp4", "c.mp4")
+        ]
+        main_window._recreate_visible_widgets()
+        rows = main_window.media_rows
+
+        with patch.object(main_window.batch_upload_btn, "setText") as set_text:
+            for row in rows:
+                row.select_box.setChecked(True)
+            rows[0].select_box.setChecked(False)
+            assert main_window._selected_count == 2
+
+            qtbot.waitUntil(lambda: set_text.called)
+            qtbot.wait(50)
+
+        set_text.assert_called_once_with("🚀 Upload Selected (2)")
+
+    def test_button_refreshed_after_uploads(self, qtbot, main_window):
+        """The button reflects the selection once uploads finish."""
+        main_window.upload_manager = Mock()
+        main_window.upload_manager.is_ready.return_value = True
+        main_window.upload_manager.get_active_uploads.return_value = ["req"]
+        main_window.all_media_items = [MediaItem(path=Path("a.mp4"))]
+        main_window._recreate_visible_widgets()
+        main_window.batch_upload_btn.setText("⏳ Uploading...")
+
+        # Held back while an upload runs
+        main_window.media_rows[0].select_box.setChecked(True)
+        qtbot.wait(50)
+        assert main_window.batch_upload_btn.text() == "⏳ Uploading..."
+
+        main_window.upload_manager.get_active_uploads.return_value = []
+        with patch.object(main_window.upload_summary, "complete_batch"):
+            main_window._on_batch_completed(1, 0)
+        assert main_window.batch_upload_btn.text() == "🚀 Upload Selected (1)"
+
+        main_window.media_rows[0].select_box.setChecked(False)
+        main_window.upload_manager.get_active_uploads.return_value = ["req"]
+        qtbot.wait(50)
+        main_window.upload_manager.get_active_uploads.return_value = []
+        main_window._on_upload_completed("req", True, "video")
+        qtbot.waitUntil(
+            lambda: main_window.batch_upload_btn.text() == "🚀 Upload Selected"
+        )
+        assert not main_window.batch_upload_btn.isEnabled()
+
+    def test_removed_rows_leave_count(self, main_window):
+        """Rows dropped from the view no longer count as selected."""
+        main_window.all_media_items = [MediaItem(path=Path("a.mp4"))]
+        main_window._recreate_visible_widgets()
+        main_window.media_rows[0].select_box.setChecked(True)
+
+        main_window.all_media_items = [MediaItem(path=Path("b.mp4"))]
+        main_window._recreate_visible_widgets()
+
+        assert main_window._selected_count == 0
+
+    def test_hidden_rows_leave_count(self, qtbot, main_window):
+        """Selected rows in a hidden folder don't count until shown again."""
+        main_window.all_media_items = [
+            MediaItem(path=Path("/media/keep/a.mp4")),
+            MediaItem(path=Path("/media/hide/b.mp4")),
+        ]
+        main_window._recreate_visible_widgets()
+        for row in main_window.media_rows:
+            row.select_box.setChecked(True)
+
+        main_window.hidden_folders.add("/media/hide")
+        main_window._update_media_visibility()
+        assert main_window._selected_count == 1
+        qtbot.waitUntil(
+            lambda: main_window.batch_upload_btn.text() == "🚀 Upload Selected (1)"
+        )
+
+        main_window.hidden_folders.discard("/media/hide")
+        main_window._update_media_visibility()
+        assert main_window._selected_count == 2
+
+
+class TestFolderFilter:
+    """Test hiding media rows by folder."""
+
+    @pytest.fixture
+    def media_folder(self, tmp_path):
+        """Create two folders with media files."""
+        for folder, count in (("keep", 3), ("hide", 12)):
+            (tmp_path / folder).mkdir()
+            for i in range(count):
+                (tmp_path / folder / f"{folder}{i:02d}.mp3").write_bytes(b"x")
+        return tmp_path
+
+    def test_hidden_rows_can_be_shown_again(self, main_window, media_folder):
+        """Hiding a folder keeps its items so showing it restores them."""
+        items = [MediaItem(path=path) for path in sorted(media_folder.rglob("*.mp3"))]
+        main_window.all_media_items = list(items)
+        main_window._recreate_visible_widgets()
+        hidden = str(media_folder / "hide")
+
+        main_window.hidden_folders.add(hidden)
+        main_window._update_media_visibility()
+
+        assert len(main_window.all_media_items) == len(items)
+        visible = [row for row in main_window.media_rows if not row.isHidden()]
+        assert all(str(row.path.parent) != hidden for row in visible)
+        # Rows are loaded further until the unfiltered folder is on screen
+        assert len(visible) == 3
+
+        main_window.hidden_folders.discard(hidden)
+        main_window._update_media_visibility()
+
+        assert not any(row.isHidden() for row in main_window.media_rows)
+
+    def test_no_rows_created_for_hidden_folders(self, main_window):
+        """Hiding every folder doesn't build rows for the rest of the items."""
+        items = [
+            MediaItem(path=Path("/music") / f"album{i % 4}" / f"{i:03d}.mp3")
+            for i in range(200)
+        ]
+        main_window.all_media_items = list(items)
+        main_window._recreate_visible_widgets()
+        assert len(main_window.media_rows) == 10
+
+        with patch.object(main_window, "_create_media_row") as create_row:
+            main_window.hidden_folders.update(f"/music/album{i}" for i in range(4))
+            main_window._update_media_visibility()
+            main_window._load_more_widgets()
+
+        create_row.assert_not_called()
+        assert len(main_window.media_rows) == 10
+        assert all(row.isHidden() for row in main_window.media_rows)
+
+        # Showing a folder again only fills the screen, not the whole folder
+        main_window.hidden_folders.discard(str(Path("/music/album1")))
+        main_window._update_media_visibility()
+        visible = [row for row in main_window.media_rows if not row.isHidden()]
+        assert len(visible) == 10
+
+
+class TestAuthStateChange:
+    """Test upload manager handling on login and logout."""
+
+    def test_upload_manager_reused(self, main_window):
+        """Auth changes update the existing upload manager in place."""
+        main_window.auth_widget = Mock()
+        main_window._on_auth_state_changed(False)
+        upload_manager = main_window.upload_manager
+
+        new_auth_manager = Mock()
+        main_window.auth_widget.auth_manager = new_auth_manager
+        main_window._on_auth_state_changed(True)
+
+        assert main_window.upload_manager is upload_manager
+        assert upload_manager.auth_manager is new_auth_manager
+
+    def test_reconnecting_does_not_duplicate_signals(self, main_window):
+        """Connecting a new upload manager drops the old manager's connections."""
+        main_window.auth_widget = Mock()
+        main_window._on_auth_state_changed(True)
+        old_manager = main_window.upload_manager
+
+        main_window.upload_manager = type(old_manager)(Mock())
+        main_window._connect_upload_manager_signals()
+        main_window._connect_upload_manager_signals()
+
+        with patch.object(main_window.upload_summary, "update_progress") as update:
+            old_manager.batch_progress.emit(2, 1, 0)
+            main_window.upload_manager.batch_progress.emit(2, 1, 0)
+
+        update.assert_called_once_with(1, 0)
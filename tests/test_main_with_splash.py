@@ -10,31 +10,56 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 from unittest.mock import MagicMock, Mock, patch
 
-from app.main import main
+from app.main import _ModulePreloader, main
 from app.splash_screen import show_splash_screen
 
 
 @pytest.fixture
 def app():
-    """Create QApplication instance for testing."""
-    return QApplication([])
+    """Create QApplication instance for testing and hand it to main()."""
+    qapp = QApplication.instance() or QApplication([])
+    with patch("app.main.QApplication", return_value=qapp):
+        yield qapp
+
+
+@pytest.fixture
+def mock_main_window():
+    """Replace the deferred MainWindow import with a mock class.
+
+    The background preload is reported synchronously so main() creates the
+    window before returning.
+    """
+    main_window_class = Mock()
+    fake_module = Mock(MainWindow=main_window_class)
+    with patch.dict(sys.modules, {"app.ui.main_window": fake_module}):
+        with patch.object(
+            _ModulePreloader, "start", lambda preloader: preloader.loaded.emit()
+        ):
+            yield main_window_class
+
+
+@pytest.fixture
+def immediate_timers():
+    """Run QTimer.singleShot callbacks synchronously."""
+    with patch(
+        "app.main.QTimer.singleShot",
+        side_effect=lambda _msec, callback: callback(),
+    ) as mock_single_shot:
+        yield mock_single_shot
 
 
 class TestMainWithSplashScreen:
     """Test main application with splash screen integration."""
 
-    @patch("app.main.MainWindow")
     @patch("app.main.show_splash_screen")
-    def test_main_shows_splash_screen(self, mock_show_splash, mock_main_window, app):
+    def test_main_shows_splash_screen(
+        self, mock_show_splash, mock_main_window, immediate_timers, app
+    ):
         """Test that main function shows splash screen."""
         # Mock the splash screen
         mock_splash = Mock()
         mock_show_splash.return_value = mock_splash
 
-        # Mock the main window
-        mock_window = Mock()
-        mock_main_window.return_value = mock_window
-
         # Mock sys.exit to prevent actual exit
         with patch("sys.exit"):
             # Mock app.exec to prevent actual event loop
@@ -44,9 +69,44 @@ class TestMainWithSplashScreen:
         # Verify splash screen was shown
         mock_show_splash.assert_called_once()
 
-    @patch("app.main.MainWindow")
     @patch("app.main.show_splash_screen")
-    def test_main_finishes_splash_screen(self, mock_show_splash, mock_main_window, app):
+    def test_main_defers_main_window_creation(
+        self, mock_show_splash, mock_main_window, app
+    ):
+        """Test that main window creation waits for the module preload."""
+        mock_show_splash.return_value = Mock()
+
+        with patch.object(_ModulePreloader, "start") as mock_start:
+            with patch("sys.exit"):
+                with patch.object(app, "exec", return_value=0):
+                    main()
+
+        # Main window is only created once the preload reports back
+        mock_start.assert_called_once()
+        mock_main_window.assert_not_called()
+
+    @patch("app.main.MIN_SPLASH_MS", 60000)
+    @patch("app.main.show_splash_screen")
+    def test_main_keeps_splash_for_minimum_time(
+        self, mock_show_splash, mock_main_window, immediate_timers, app
+    ):
+        """Test that a fast main window still waits out the minimum splash time."""
+        mock_splash = Mock()
+        mock_show_splash.return_value = mock_splash
+
+        with patch("sys.exit"):
+            with patch.object(app, "exec", return_value=0):
+                main()
+
+        # Showing the window is delayed by the remaining splash time
+        immediate_timers.assert_called_once()
+        assert 0 < immediate_timers.call_args[0][0] <= 60000
+        mock_splash.update_progress.assert_called_once_with(100)
+
+    @patch("app.main.show_splash_screen")
+    def test_main_finishes_splash_screen(
+        self, mock_show_splash, mock_main_window, immediate_timers, app
+    ):
         """Test that main function finishes splash screen with main window."""
         # Mock the splash screen
         mock_splash = Mock()
@@ -65,9 +125,10 @@ class TestMainWithSplashScreen:
         # Verify splash screen was finished with main window
         mock_splash.finish.assert_called_once_with(mock_window)
 
-    @patch("app.main.MainWindow")
     @patch("app.main.show_splash_screen")
-    def test_main_shows_main_window(self, mock_show_splash, mock_main_window, app):
+    def test_main_shows_main_window(
+        self, mock_show_splash, mock_main_window, immediate_timers, app
+    ):
         """Test that main function shows main window."""
         # Mock the splash screen
         mock_splash = Mock()
@@ -86,9 +147,10 @@ class TestMainWithSplashScreen:
         # Verify main window was shown
         mock_window.show.assert_called_once()
 
-    @patch("app.main.MainWindow")
     @patch("app.main.show_splash_screen")
-    def test_main_creates_main_window(self, mock_show_splash, mock_main_window, app):
+    def test_main_creates_main_window(
+        self, mock_show_splash, mock_main_window, immediate_timers, app
+    ):
         """Test that main function creates main window."""
         # Mock the splash screen
         mock_splash = Mock()
@@ -104,21 +166,19 @@ class TestMainWithSplashScreen:
             with patch.object(app, "exec", return_value=0):
                 main()
 
-        # Verify main window was created
+        # Verify main window was created and kept alive on the application
         mock_main_window.assert_called_once()
+        assert app.main_window is mock_window
 
-    @patch("app.main.MainWindow")
     @patch("app.main.show_splash_screen")
-    def test_main_signal_handler_setup(self, mock_show_splash, mock_main_window, app):
+    def test_main_signal_handler_setup(
+        self, mock_show_splash, mock_main_window, immediate_timers, app
+    ):
         """Test that main function sets up signal handler."""
         # Mock the splash screen
         mock_splash = Mock()
         mock_show_splash.return_value = mock_splash
 
-        # Mock the main window
-        mock_window = Mock()
-        mock_main_window.return_value = mock_window
-
         # Mock signal.signal to capture the handler
         with patch("signal.signal") as mock_signal:
             # Mock sys.exit to prevent actual exit
@@ -130,41 +190,55 @@ class TestMainWithSplashScreen:
         # Verify signal handler was set up
         mock_signal.assert_called_once()
 
-    @patch("app.main.MainWindow")
     @patch("app.main.show_splash_screen")
-    def test_main_timer_setup(self, mock_show_splash, mock_main_window, app):
-        """Test that main function sets up timer for signal processing."""
+    def test_main_signal_wakeup_setup(self, mock_show_splash, mock_main_window, app):
+        """Test that main function wakes the event loop for signals."""
         # Mock the splash screen
         mock_splash = Mock()
         mock_show_splash.return_value = mock_splash
 
-        # Mock the main window
-        mock_window = Mock()
-        mock_main_window.return_value = mock_window
-
-        # Mock QTimer to capture timer setup
-        with patch("app.main.QTimer") as mock_timer_class:
-            mock_timer = Mock()
-            mock_timer_class.return_value = mock_timer
-
+        with patch("app.main.install_signal_wakeup") as mock_install:
             # Mock sys.exit to prevent actual exit
             with patch("sys.exit"):
                 # Mock app.exec to prevent actual event loop
                 with patch.object(app, "exec", return_value=0):
                     main()
 
-        # Verify timer was set up
-        mock_timer.start.assert_called_once_with(500)
-        mock_timer.timeout.connect.assert_called_once()
+        # Verify the wakeup notifier was installed on the application
+        mock_install.assert_called_once_with(app)
+
+
+class TestModulePreloader:
+    """Test the background module preloader."""
+
+    def test_preloader_imports_module_off_gui_thread(self, app):
+        """Test that the module is imported and loaded fires on the GUI thread."""
+        import threading
+        import time
+
+        loaded_on = []
+        preloader = _ModulePreloader("json")
+        preloader.loaded.connect(
+            lambda: loaded_on.append(threading.current_thread())
+        )
+        preloader.start()
+
+        for _ in range(50):
+            app.processEvents()
+            if loaded_on:
+                break
+            time.sleep(0.01)
+
+        assert loaded_on == [threading.main_thread()]
+        assert "json" in sys.modules
 
 
 class TestMainErrorHandling:
     """Test main application error handling."""
 
-    @patch("app.main.MainWindow")
     @patch("app.main.show_splash_screen")
     def test_main_handles_keyboard_interrupt(
-        self, mock_show_splash, mock_main_window, app
+        self, mock_show_splash, mock_main_window, immediate_timers, app
     ):
         """Test that main function handles KeyboardInterrupt gracefully."""
         # Mock the splash screen
@@ -187,10 +261,9 @@ class TestMainErrorHandling:
         # Verify sys.exit was called
         mock_exit.assert_called_once_with(0)
 
-    @patch("app.main.MainWindow")
     @patch("app.main.show_splash_screen")
     def test_main_handles_main_window_creation_error(
-        self, mock_show_splash, mock_main_window, app
+        self, mock_show_splash, mock_main_window, immediate_timers, app
     ):
         """Test that main function handles MainWindow creation errors."""
         # Mock the splash screen
@@ -204,18 +277,42 @@ class TestMainErrorHandling:
         with patch("sys.exit") as mock_exit:
             # Mock app.exec to prevent actual event loop
             with patch.object(app, "exec", return_value=0):
-                main()
+                with patch.object(app, "exit") as mock_app_exit:
+                    main()
 
-        # Verify sys.exit was called (due to exception)
+        # Splash is closed and the event loop is asked to exit with an error
+        mock_splash.close.assert_called_once()
+        mock_splash.finish.assert_not_called()
+        mock_app_exit.assert_called_once_with(1)
         mock_exit.assert_called_once()
 
+    @patch("app.main.show_splash_screen")
+    def test_main_handles_main_window_import_error(self, mock_show_splash, app):
+        """A main window module that fails to import exits instead of hanging."""
+        mock_splash = Mock()
+        mock_show_splash.return_value = mock_splash
+
+        # A None entry makes the import raise ImportError
+        with patch.dict(sys.modules, {"app.ui.main_window": None}), \
+                patch.object(
+                    _ModulePreloader, "start", lambda preloader: preloader.loaded.emit()
+                ), \
+                patch("sys.exit"), \
+                patch.object(app, "exec", return_value=0), \
+                patch.object(app, "exit") as mock_app_exit:
+            main()
+
+        mock_splash.close.assert_called_once()
+        mock_app_exit.assert_called_once_with(1)
+
 
 class TestMainIntegration:
     """Test main application integration scenarios."""
 
-    @patch("app.main.MainWindow")
     @patch("app.main.show_splash_screen")
-    def test_main_complete_flow(self, mock_show_splash, mock_main_window, app):
+    def test_main_complete_flow(
+        self, mock_show_splash, mock_main_window, immediate_timers, app
+    ):
         """Test the complete main function flow."""
         # Mock the splash screen
         mock_splash = Mock()
@@ -244,10 +341,9 @@ class TestMainIntegration:
         # 4. Main window shown
         mock_window.show.assert_called_once()
 
-    @patch("app.main.MainWindow")
     @patch("app.main.show_splash_screen")
     def test_main_splash_screen_lifecycle(
-        self, mock_show_splash, mock_main_window, app
+        self, mock_show_splash, mock_main_window, immediate_timers, app
     ):
         """Test splash screen lifecycle in main function."""
         # Mock the splash screen
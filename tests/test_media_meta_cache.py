@@ -0,0 +1,66 @@
+"""
+Tests for the SQLite media metadata cache.
+"""
+
+import pytest
+
+from core.media_meta_cache import MediaMeta, MediaMetaCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a metadata cache in a temporary directory."""
+    cache = MediaMetaCache(tmp_path / "media_meta.db")
+    yield cache
+    cache.close()
+
+
+class TestMediaMetaCache:
+    """Test MediaMetaCache lookups and writes."""
+
+    def test_lookup_returns_current_entries(self, cache):
+        """Entries are returned only while mtime and size still match."""
+        cache.put(MediaMeta("/music/a.mp3", 100, 2048, 61000, "a"))
+        cache.put(MediaMeta("/music/b.mp3", 100, 4096, 90000, "b"))
+        assert cache.flush() == 2
+
+        found = cache.lookup(
+            [
+                ("/music/a.mp3", 100, 2048),
+                ("/music/b.mp3", 200, 4096),  # Modified since it was cached
+                ("/music/c.mp3", 100, 1024),  # Never cached
+            ]
+        )
+
+        assert list(found) == ["/music/a.mp3"]
+        assert found["/music/a.mp3"].duration == 61000
+
+    def test_pending_entries_are_visible_before_flush(self, cache):
+        """Queued entries are returned before they are written."""
+        cache.put(MediaMeta("/music/a.mp3", 100, 2048, 61000, "a"))
+
+        assert "/music/a.mp3" in cache.lookup([("/music/a.mp3", 100, 2048)])
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Closing the cache writes queued entries to disk."""
+        db_path = tmp_path / "media_meta.db"
+        first = MediaMetaCache(db_path)
+        first.put(MediaMeta("/music/a.mp3", 100, 2048, 61000, "a"))
+        first.close()
+
+        second = MediaMetaCache(db_path)
+        try:
+            found = second.lookup([("/music/a.mp3", 100, 2048)])
+        finally:
+            second.close()
+
+        assert found["/music/a.mp3"] == MediaMeta("/music/a.mp3", 100, 2048, 61000, "a")
+
+    def test_large_lookups_are_chunked(self, cache):
+        """Lookups with more paths than fit in one query still find every entry."""
+        files = [(f"/music/{i}.mp3", 1, i) for i in range(1200)]
+        for path, mtime, size in files:
+            cache.put(MediaMeta(path, mtime, size, None, str(size)))
+        cache.flush()
+
+        assert len(cache.lookup(files)) == 1200
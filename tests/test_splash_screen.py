@@ -6,12 +6,12 @@ Unit tests for splash screen functionality.
 import time
 
 import pytest
-from PySide6.QtCore import Qt, QThread
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QApplication, QWidget
 from unittest.mock import MagicMock, Mock, patch
 
-from app.splash_screen import LoadingThread, SplashScreen, show_splash_screen
+from app.splash_screen import SplashScreen, show_splash_screen
 
 
 @pytest.fixture(scope="session")
@@ -31,86 +31,6 @@ def splash_screen(qapp):
     splash.close()
 
 
-@pytest.fixture
-def loading_thread(qapp):
-    """Create LoadingThread instance for testing."""
-    thread = LoadingThread()
-    yield thread
-    if thread.isRunning():
-        thread.quit()
-        thread.wait()
-
-
-class TestLoadingThread:
-    """Test the LoadingThread functionality."""
-
-    def test_loading_thread_creation(self, loading_thread):
-        """Test that LoadingThread is created correctly."""
-        assert isinstance(loading_thread, LoadingThread)
-        assert hasattr(loading_thread, "progress_updated")
-        assert not loading_thread.isRunning()
-
-    def test_loading_thread_run(self, loading_thread, qapp):
-        """Test that LoadingThread runs and emits progress signals."""
-        progress_values = []
-
-        def on_progress(value):
-            progress_values.append(value)
-
-        loading_thread.progress_updated.connect(on_progress)
-
-        # Start the thread
-        loading_thread.start()
-
-        # Wait for the thread to run and emit signals
-        # Process events to allow signal delivery
-        for _ in range(10):  # Wait up to 1 second
-            qapp.processEvents()
-            time.sleep(0.1)
-            if progress_values:
-                break
-
-        # Stop the thread
-        loading_thread.quit()
-        loading_thread.wait()
-
-        # Check that progress values were emitted
-        assert len(progress_values) > 0
-        assert 0 in progress_values  # Should start at 0
-        assert progress_values[-1] <= 100  # Should not exceed 100
-
-    def test_loading_thread_progress_range(self, loading_thread, qapp):
-        """Test that LoadingThread emits values in correct range."""
-        progress_values = []
-
-        def on_progress(value):
-            progress_values.append(value)
-
-        loading_thread.progress_updated.connect(on_progress)
-
-        # Start the thread
-        loading_thread.start()
-
-        # Wait for some progress and process events
-        for _ in range(20):  # Wait up to 2 seconds
-            qapp.processEvents()
-            time.sleep(0.1)
-            if len(progress_values) > 5:  # Wait for some progress
-                break
-
-        # Stop the thread
-        loading_thread.quit()
-        loading_thread.wait()
-
-        # Check range
-        if progress_values:
-            assert min(progress_values) >= 0
-            assert max(progress_values) <= 100
-            # Check that values are sequential
-            for i in range(1, len(progress_values)):
-                assert progress_values[i] >= progress_values[i - 1]
-
-
 class TestSplashScreen:
     """Test the SplashScreen functionality."""
 
@@ -133,11 +53,52 @@ class TestSplashScreen:
         assert pixmap.width() == 400
         assert pixmap.height() == 300
 
-    def test_splash_screen_loading_thread(self, splash_screen):
-        """Test that SplashScreen creates and starts loading thread."""
-        assert hasattr(splash_screen, "loading_thread")
-        assert isinstance(splash_screen.loading_thread, LoadingThread)
-        assert splash_screen.loading_thread.isRunning()
+    def test_splash_screen_uses_prerendered_pixmap(self, qapp, tmp_path):
+        """Test that a build-time rendered base pixmap skips runtime drawing."""
+        prerendered = tmp_path / "splash_base.png"
+        assert SplashScreen.render_base_pixmap().save(str(prerendered))
+
+        with patch("app.splash_screen.PRERENDERED_SPLASH", prerendered):
+            with patch.object(SplashScreen, "render_base_pixmap") as mock_render:
+                splash = SplashScreen()
+
+        mock_render.assert_not_called()
+        assert splash.pixmap().width() == 400
+        assert splash.bar_width > 0
+        splash.close()
+
+    def test_splash_screen_loading_timer(self, splash_screen):
+        """Test that SplashScreen creates and starts the loading timer."""
+        assert isinstance(splash_screen._timer, QTimer)
+        assert splash_screen._timer.isActive()
+
+    def test_splash_screen_progress_ticks(self, splash_screen):
+        """Test that progress advances monotonically and stops at 100."""
+        progress_values = []
+        with patch.object(
+            splash_screen, "update_progress", side_effect=progress_values.append
+        ):
+            for _ in range(200):
+                splash_screen._tick()
+                if not splash_screen._timer.isActive():
+                    break
+
+        assert progress_values[0] > 0
+        assert progress_values == sorted(progress_values)
+        assert progress_values[-1] == 100
+        assert not splash_screen._timer.isActive()
+
+    def test_splash_screen_emits_loading_complete(self, splash_screen, qapp):
+        """Test that loading_complete fires once progress reaches 100."""
+        completed = []
+        splash_screen.loading_complete.connect(lambda: completed.append(True))
+        splash_screen._progress = 99
+
+        with patch("app.splash_screen.QTimer.singleShot") as mock_single_shot:
+            splash_screen._tick()
+            mock_single_shot.call_args[0][1]()
+
+        assert completed == [True]
 
     def test_splash_screen_progress_update(self, splash_screen, qapp):
         """Test that SplashScreen updates progress correctly."""
@@ -156,6 +117,24 @@ class TestSplashScreen:
         # (This is a basic check - in practice they might be the same if no progress occurred)
         assert updated_pixmap is not None
 
+    def test_progress_painted_over_static_pixmap(self, splash_screen, qapp):
+        """Progress updates repaint the bar without replacing the pixmap."""
+        splash_screen._timer.stop()
+        cache_key = splash_screen.pixmap().cacheKey()
+
+        with patch.object(
+            splash_screen, "_render_progress", wraps=splash_screen._render_progress
+        ) as render:
+            splash_screen.update_progress(40)
+            splash_screen.update_progress(60)
+            splash_screen.repaint()
+
+        assert splash_screen.pixmap().cacheKey() == cache_key
+        assert render.call_args.args[1] == 60
+
+        # The painted bar differs from the bare pixmap
+        assert splash_screen.grab().toImage() != splash_screen.pixmap().toImage()
+
     def test_splash_screen_finish(self, splash_screen):
         """Test that SplashScreen finishes correctly."""
         # Create a test widget
@@ -168,17 +147,14 @@ class TestSplashScreen:
             # Verify finish was called
             mock_finish.assert_called_once_with(test_widget)
 
-    def test_splash_screen_thread_cleanup(self, splash_screen):
-        """Test that SplashScreen properly cleans up the loading thread."""
-        # Get the loading thread
-        thread = splash_screen.loading_thread
-
+    def test_splash_screen_timer_cleanup(self, splash_screen):
+        """Test that SplashScreen stops the loading timer on finish."""
         # Finish the splash screen
         test_widget = QWidget()
         splash_screen.finish(test_widget)
 
-        # Thread should be stopped
-        assert not thread.isRunning()
+        # Timer should be stopped
+        assert not splash_screen._timer.isActive()
 
     def test_splash_screen_bar_properties(self, splash_screen):
         """Test that splash screen has correct bar properties."""
@@ -237,8 +213,8 @@ class TestSplashScreenIntegration:
         # Finish splash screen
         splash.finish(test_widget)
 
-        # Verify thread is cleaned up
-        assert not splash.loading_thread.isRunning()
+        # Verify timer is cleaned up
+        assert not splash._timer.isActive()
 
     def test_splash_screen_multiple_instances(self, qapp):
         """Test creating multiple splash screen instances."""
@@ -262,8 +238,8 @@ class TestSplashScreenIntegration:
             qapp.processEvents()
             time.sleep(0.1)
 
-        # Check that thread is running
-        assert splash.loading_thread.isRunning()
+        # Check that timer is running
+        assert splash._timer.isActive()
 
         # Clean up
         splash.close()
@@ -272,16 +248,15 @@ class TestSplashScreenIntegration:
 class TestSplashScreenErrorHandling:
     """Test splash screen error handling."""
 
-    def test_splash_screen_thread_error_handling(self, qapp):
-        """Test that splash screen handles thread errors gracefully."""
+    def test_splash_screen_timer_error_handling(self, qapp):
+        """Test that splash screen handles a stopped timer gracefully."""
         splash = show_splash_screen()
 
-        # Force stop the thread
-        splash.loading_thread.quit()
-        splash.loading_thread.wait()
+        # Force stop the timer
+        splash._timer.stop()
 
         # Should not crash
-        assert not splash.loading_thread.isRunning()
+        assert not splash._timer.isActive()
 
         splash.close()
 
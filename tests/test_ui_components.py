@@ -9,11 +9,12 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 from unittest.mock import MagicMock, Mock, patch
 
-from app.ui.history_widget import HistoryItemWidget, HistoryWidget
+from app.ui.history_widget import HistoryWidget
 from app.ui.media_info_widget import MediaInfoWidget
 from app.ui.schedule_dialog import ScheduleDialog
 from app.ui.upload_status import UploadStatusWidget
 from core.history_manager import HistoryManager
+from core.models import MediaItem
 
 
 @pytest.fixture
@@ -57,6 +58,19 @@ class TestMediaInfoWidget:
         # File size should be displayed
         assert widget.size_label.text() != ""
 
+    def test_duration_stored_on_media_item(self, app, temp_media_file):
+        """The displayed duration is written back to the media item."""
+        item = MediaItem(path=temp_media_file)
+        widget = MediaInfoWidget(temp_media_file, media_item=item)
+
+        widget._set_duration(125.7)
+        assert widget.duration_label.text() == "2:05"
+        assert item.duration_ms == 125700
+
+        widget._set_duration(None)
+        assert widget.duration_label.text() == "Unknown"
+        assert item.duration_ms is None
+
     def test_folder_link_creation(self, app, temp_media_file):
         """Test folder link creation."""
         widget = MediaInfoWidget(temp_media_file)
@@ -132,64 +146,6 @@ class TestHistoryWidget:
         assert widget.history_list.count() == 0
 
 
-class TestHistoryItemWidget:
-    """Test HistoryItemWidget component."""
-
-    def test_init_upload_item(self, app):
-        """Test HistoryItemWidget initialization for upload item."""
-        upload_data = {
-            "type": "upload",
-            "timestamp": "2024-01-01T12:00:00Z",
-            "original_file": "test.mp4",
-            "title": "Test Video",
-            "video_url": "https://youtube.com/watch?v=123",
-            "video_id": "123",
-        }
-
-        widget = HistoryItemWidget(upload_data)
-
-        assert widget.item_data == upload_data
-        assert widget.title_label is not None
-        assert widget.date_label is not None
-
-    def test_init_conversion_item(self, app):
-        """Test HistoryItemWidget initialization for conversion item."""
-        conversion_data = {
-            "type": "conversion",
-            "timestamp": "2024-01-01T12:00:00Z",
-            "mp3_file": "test.mp3",
-            "mp4_file": "test.mp4",
-            "image_file": "test.jpg",
-        }
-
-        widget = HistoryItemWidget(conversion_data)
-
-        assert widget.item_data == conversion_data
-        assert widget.title_label is not None
-        assert widget.date_label is not None
-
-    def test_clickable_youtube_url(self, app):
-        """Test clickable YouTube URL."""
-        upload_data = {
-            "type": "upload",
-            "timestamp": "2024-01-01T12:00:00Z",
-            "original_file": "test.mp4",
-            "title": "Test Video",
-            "video_url": "https://youtube.com/watch?v=123",
-            "video_id": "123",
-        }
-
-        widget = HistoryItemWidget(upload_data)
-
-        # Should have clickable URL
-        url_labels = [
-            child
-            for child in widget.findChildren(type(widget.title_label))
-            if hasattr(child, "text") and "youtube.com" in child.text()
-        ]
-        assert len(url_labels) > 0
-
-
 class TestScheduleDialog:
     """Test ScheduleDialog component."""
 
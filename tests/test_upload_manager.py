@@ -104,6 +104,16 @@ class TestUploadManager:
         assert result == auth_info
         mock_auth_manager.get_auth_info.assert_called_once()
 
+    def test_update_auth(self, upload_manager):
+        """Test update_auth swaps the auth manager in place."""
+        new_auth_manager = Mock()
+        new_auth_manager.is_authenticated.return_value = True
+
+        upload_manager.update_auth(new_auth_manager)
+
+        assert upload_manager.auth_manager is new_auth_manager
+        assert upload_manager.is_ready() is True
+
     def test_validate_upload_request_not_authenticated(
         self, upload_manager, mock_auth_manager
     ):